@@ -0,0 +1,115 @@
+"""A router of addresses between several VISA backends (e.g., NI-VISA for GPIB, pyvisa-py for TCP/IP and USB).
+
+Relies on PyVISA and the concurrent.futures module.
+Each address is routed to the backend declared for its interface type, the primary backend otherwise,
+and the resources of all backends are listed in parallel, so the slowest backend does not delay the others.
+"""
+
+
+
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import pyvisa as visa
+
+
+logger = logging.getLogger(__name__)
+
+_INTERFACE_PREFIX = re.compile(r"^([A-Za-z]+)[0-9]*::")
+
+
+def interface_of(address: str) -> str:
+    """Returns the interface type of an address in upper case (e.g., 'GPIB' for 'GPIB0::12::INSTR'), or None for an alias."""
+
+    match = _INTERFACE_PREFIX.match(address)
+    return match.group(1).upper() if match is not None else None
+
+def open_resource_managers(libraries) -> dict:
+    """Opens a ResourceManager per VISA library, in parallel.
+
+    Returns:
+        A dict associating each library (e.g., '@py', '' for the default one) with its ResourceManager.
+    Raises:
+        OSError: A library cannot be loaded (the managers already opened are closed).
+    """
+
+    libraries = list(dict.fromkeys(libraries))
+    with ThreadPoolExecutor(max_workers=max(1, len(libraries))) as executor:
+        futures = {library: executor.submit(visa.ResourceManager, library) for library in libraries}
+
+    resource_managers, errors = dict(), []
+    for library, future in futures.items():
+        try:
+            resource_managers[library] = future.result()
+        except (OSError, ValueError) as err:
+            errors.append("{}: {}".format(library or "default library", err))
+    if errors:
+        for resource_manager in resource_managers.values():
+            resource_manager.close()
+        raise OSError("Cannot open the VISA libraries {}".format("; ".join(errors)))
+    return resource_managers
+
+
+class VisaRouter(object):
+    """Routes the addresses between several VISA resource managers, with the interface of a ResourceManager.
+
+    Attributes:
+        primary: The library of the backend used for the interface types without route.
+        resource_managers: A dict associating each library with its ResourceManager.
+        routes: A dict associating interface types in upper case (e.g., 'GPIB') with a library.
+    """
+
+    def __init__(self, resource_managers: dict, routes: dict = None, primary: str = ''):
+        """Raises ValueError if the primary library or a routed library has no resource manager."""
+
+        routes = {interface.upper(): library for interface, library in (routes or {}).items()}
+        for library in [primary] + list(routes.values()):
+            if library not in resource_managers:
+                raise ValueError("No resource manager is opened for the VISA library {}.".format(library))
+
+        self.primary = primary
+        self.resource_managers = dict(resource_managers)
+        self.routes = routes
+
+    def backend_of(self, address: str) -> str:
+        """Returns the library handling address."""
+
+        return self.routes.get(interface_of(address), self.primary)
+
+    def open_resource(self, address: str, **kwargs):
+        """Opens a session with the backend handling address (see ResourceManager.open_resource())."""
+
+        return self.resource_managers[self.backend_of(address)].open_resource(address, **kwargs)
+
+    def list_resources(self, query: str = "?*::INSTR") -> tuple:
+        """Lists the resources of all backends in parallel; each backend only reports the addresses routed to it.
+
+        Raises:
+            VisaIOError: No backend can list any resource (VI_ERROR_RSRC_NFOUND if none is found).
+        """
+
+        with ThreadPoolExecutor(max_workers=len(self.resource_managers)) as executor:
+            futures = {library: executor.submit(resource_manager.list_resources, query)
+                       for library, resource_manager in self.resource_managers.items()}
+
+        addresses, first_error = [], None
+        for library, future in futures.items():
+            try:
+                found = future.result()
+            except visa.VisaIOError as err:
+                if err.error_code != visa.constants.VI_ERROR_RSRC_NFOUND:
+                    logger.warning("The VISA library %s cannot list the resources: %s", library or "default library", err)
+                    first_error = first_error or err
+                continue
+            addresses.extend(address for address in found if self.backend_of(address) == library)
+
+        if not addresses:
+            raise first_error or visa.VisaIOError(visa.constants.VI_ERROR_RSRC_NFOUND)
+        return tuple(dict.fromkeys(addresses))
+
+    def close(self):
+        """Closes the resource managers of all backends."""
+
+        for resource_manager in self.resource_managers.values():
+            resource_manager.close()
@@ -0,0 +1,152 @@
+"""A reader of IEEE 488.2 binary blocks streaming the payload into preallocated storage, and their encoder.
+
+Relies on NumPy.
+A definite block ('#<n><length><payload>') is read chunk by chunk directly into the memory of the destination array,
+and optionally copied onto a file as it arrives, so the peak memory is one copy of the data plus one chunk.
+An indefinite block ('#0<payload>') ends with the END of the message; its payload is gathered in a growing buffer,
+then viewed as an array without any copy.
+An array to upload (e.g., a list of voltages) is encoded as a definite block straight from its memory.
+"""
+
+
+
+import numpy as np
+
+
+BLOCK_CHUNK_SIZE = 1 << 20  # Size in bytes of each read of the payload
+
+
+def _read_exactly(read, n_bytes: int) -> bytes:
+    data = bytearray()
+    while len(data) < n_bytes:
+        chunk, end = read(n_bytes - len(data))
+        data.extend(chunk)
+        if end and len(data) < n_bytes:
+            raise IOError("The message ended after {} bytes instead of {}.".format(len(data), n_bytes))
+    return bytes(data)
+
+def encode_block(values, dtype) -> bytes:
+    """Returns the definite block ('#<n><length><payload>') of values converted into dtype (e.g., '>f4').
+
+    Raises:
+        ValueError: The payload is too large for a definite block (10**9 bytes or more).
+    """
+
+    payload = np.ascontiguousarray(values, dtype=dtype).tobytes()
+    length = str(len(payload))
+    if len(length) > 9:
+        raise ValueError("The payload of {} bytes is too large for a definite block.".format(length))
+    return "#{}{}".format(len(length), length).encode() + payload
+
+def read_block_header(read):
+    """Reads the header of a binary block.
+
+    Args:
+        read: A callable taking a number of bytes and returning a tuple (bytes read, True if the message ended).
+
+    Returns:
+        An int giving the length in bytes of the payload, or None for an indefinite block ('#0').
+    Raises:
+        IOError: The header is malformed or the message ended too early.
+    """
+
+    start = _read_exactly(read, 2)
+    while start[:1] != b'#': # Some tools send a header before the block (e.g., ':CURV ')
+        if start[:1] in (b'\n', b''):
+            raise IOError("No binary block in the message.")
+        start = start[1:] + _read_exactly(read, 1)
+    if not start[1:2].isdigit():
+        raise IOError("Malformed binary block header {}.".format(start))
+
+    n_digits = int(start[1:2])
+    if n_digits == 0:
+        return None
+    length = _read_exactly(read, n_digits)
+    if not length.isdigit():
+        raise IOError("Malformed binary block header {}.".format(start + length))
+    return int(length)
+
+
+class BlockReader(object):
+    """Reader of binary blocks from a message-based interface.
+
+    Attributes:
+        read: A callable taking a number of bytes and returning a tuple (bytes read, True if the message ended).
+        chunk_size: An int giving the size in bytes of each read of the payload.
+    """
+
+    def __init__(self, read, chunk_size: int = BLOCK_CHUNK_SIZE):
+        if chunk_size <= 0:
+            raise ValueError("The chunk_size argument must be positive.")
+        self.read = read
+        self.chunk_size = chunk_size
+
+    def read_block(self, dtype, out: np.ndarray = None, stream=None, on_length=None) -> np.ndarray:
+        """Reads a binary block into an array.
+
+        Args:
+            dtype: The NumPy data type of the values, including their endianness (e.g., '>f4').
+            out: A contiguous array receiving the values (allocated if None); a view of its used part is returned.
+            stream: A binary file object receiving a copy of the payload as it arrives (e.g., to log it onto disk), or None.
+            on_length: A callable receiving the length in bytes of the payload (None for an indefinite block)
+                as soon as the header is read (e.g., to size the timeout of the transfer), or None.
+
+        Returns:
+            A NumPy array of the values.
+        Raises:
+            IOError: The block is malformed or truncated.
+            ValueError: out is too small, not contiguous or of another data type.
+        """
+
+        dtype = np.dtype(dtype)
+        n_bytes = read_block_header(self.read)
+        if on_length is not None:
+            on_length(n_bytes)
+        if n_bytes is None:
+            return self._read_indefinite(dtype, out, stream)
+        if n_bytes % dtype.itemsize:
+            raise IOError("The block of {} bytes does not hold values of {} bytes.".format(n_bytes, dtype.itemsize))
+
+        n_values = n_bytes // dtype.itemsize
+        if out is None:
+            out = np.empty(n_values, dtype=dtype)
+        elif out.dtype != dtype or not out.flags.c_contiguous or out.size < n_values:
+            raise ValueError("The out argument must be a contiguous array of at least {} values of {}.".format(n_values, dtype))
+
+        memory = memoryview(out.reshape(-1)).cast('B')
+        position, end = 0, False
+        while position < n_bytes:
+            chunk, end = self.read(min(self.chunk_size, n_bytes - position))
+            memory[position:position + len(chunk)] = chunk
+            if stream is not None:
+                stream.write(chunk)
+            position += len(chunk)
+            if end and position < n_bytes:
+                raise IOError("The block ended after {} bytes instead of {}.".format(position, n_bytes))
+        if not end:
+            self.read(1) # Terminator of the message
+        return out.reshape(-1)[:n_values]
+
+    def _read_indefinite(self, dtype, out, stream) -> np.ndarray:
+        payload = bytearray()
+        written, end = 0, False
+        while not end:
+            chunk, end = self.read(self.chunk_size)
+            payload.extend(chunk)
+            if stream is not None and len(payload) - 1 > written: # The last byte may be the terminator
+                stream.write(payload[written:-1])
+                written = len(payload) - 1
+        if payload.endswith(b'\n'): # The block is terminated by NL with END
+            del payload[-1]
+        if stream is not None and len(payload) > written:
+            stream.write(payload[written:])
+        if len(payload) % dtype.itemsize:
+            raise IOError("The block of {} bytes does not hold values of {} bytes.".format(len(payload), dtype.itemsize))
+
+        values = np.frombuffer(payload, dtype=dtype)
+        if out is None:
+            return values
+        if out.dtype != dtype or out.size < values.size:
+            raise ValueError("The out argument must be an array of at least {} values of {}.".format(values.size, dtype))
+        out.reshape(-1)[:values.size] = values
+        return out.reshape(-1)[:values.size]
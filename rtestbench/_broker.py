@@ -0,0 +1,301 @@
+"""A local broker sharing the tools of a test bench between several Python processes.
+
+Relies on Unix domain sockets and on multiprocessing.shared_memory (Python 3.8+) for arrays.
+The broker process owns the RTestBenchManager and its VISA sessions, and serves the calls
+of its clients through the scheduler of the manager (see the _scheduler module).
+
+Each message is a JSON object preceded by its length (4 bytes, big endian). NumPy arrays are
+returned in a shared memory block: the client maps it without copy, and the broker unlinks
+the block as soon as the client sends its next message (the block then lives until the client
+releases the array).
+"""
+
+
+
+import json
+import os
+import socket
+import socketserver
+import struct
+import threading
+import weakref
+
+import numpy as np
+
+from rtestbench import _scheduler
+
+try:
+    from multiprocessing import shared_memory
+    from multiprocessing import resource_tracker
+except ImportError:
+    _HAS_SHARED_MEMORY = False
+else:
+    _HAS_SHARED_MEMORY = True
+
+_HAS_UNIX_SOCKETS = hasattr(socket, "AF_UNIX") # Not available on Windows
+
+
+_HEADER = struct.Struct('>I')
+
+# Exceptions raised again on the client side; any other exception becomes a RuntimeError
+_FORWARDED_ERRORS = {err.__name__: err for err in (
+    AttributeError, IOError, KeyError, NotImplementedError, RuntimeError, TimeoutError, TypeError, UnboundLocalError, ValueError
+)}
+
+
+# Framing
+###
+
+def _send_message(sock, message: dict):
+    payload = json.dumps(message, separators=(',', ':')).encode()
+    sock.sendall(_HEADER.pack(len(payload)) + payload)
+
+def _receive_exactly(sock, size: int) -> bytes:
+    chunks = bytearray()
+    while len(chunks) < size:
+        chunk = sock.recv(size - len(chunks))
+        if not chunk:
+            raise ConnectionError("The connection has been closed by the peer.")
+        chunks.extend(chunk)
+    return bytes(chunks)
+
+def _receive_message(sock) -> dict:
+    size, = _HEADER.unpack(_receive_exactly(sock, _HEADER.size))
+    return json.loads(_receive_exactly(sock, size))
+
+
+# Broker (server side)
+###
+
+class _BrokerHandler(socketserver.BaseRequestHandler):
+    """Serves the requests of one client connection until it closes.
+
+    Attributes:
+        _blocks: A list of the shared memory blocks sent in the last answer, unlinked upon the next request.
+    """
+
+    def setup(self):
+        self._blocks = []
+
+    def handle(self):
+        while True:
+            try:
+                request = _receive_message(self.request)
+            except ConnectionError:
+                return
+            self._unlink_blocks() # The client has mapped the blocks of the previous answer
+
+            try:
+                answer = {"result": self._encode(self.server.broker.call(request, client=id(self)))}
+            except Exception as err:
+                answer = {"error": {"type": type(err).__name__, "message": str(err)}}
+            answer["id"] = request.get("id")
+
+            try:
+                _send_message(self.request, answer)
+            except TypeError as err: # The result cannot be serialized in JSON
+                _send_message(self.request, {"id": answer["id"], "error": {"type": "TypeError", "message": str(err)}})
+
+    def finish(self):
+        self._unlink_blocks()
+
+    def _encode(self, result):
+        if isinstance(result, np.ndarray) and _HAS_SHARED_MEMORY and result.nbytes > 0:
+            block = shared_memory.SharedMemory(create=True, size=result.nbytes)
+            np.ndarray(result.shape, dtype=result.dtype, buffer=block.buf)[...] = result
+            self._blocks.append(block)
+            return {"__array__": {"name": block.name, "dtype": result.dtype.str, "shape": list(result.shape)}}
+        elif isinstance(result, np.ndarray):
+            return {"__list__": {"data": result.tolist(), "dtype": result.dtype.str}}
+        elif isinstance(result, np.generic):
+            return result.item()
+        return result
+
+    def _unlink_blocks(self):
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks.clear()
+
+
+if _HAS_UNIX_SOCKETS:
+    class _BrokerServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+
+def _check_unix_sockets():
+    if not _HAS_UNIX_SOCKETS:
+        raise NotImplementedError("The broker requires Unix domain sockets, which are not available on this platform.")
+
+
+class Broker(object):
+    """Server of the tools of a RTestBenchManager to local processes.
+
+    Attributes:
+        _manager: The RTestBenchManager owning the tools.
+        _tools: A dict associating the name used by clients with each served Tool.
+        _path: The path to the Unix domain socket.
+        _server: The socketserver serving the connections.
+        _thread: The threading.Thread running the server, once started.
+    """
+
+    def __init__(self, manager, path, tools: dict = None):
+        _check_unix_sockets()
+
+        self._manager = manager
+        self._tools = dict(tools) if tools is not None else {str(i): tool for i, tool in enumerate(manager._attached_tools)}
+        self._path = str(path)
+        self._thread = None
+
+        if os.path.exists(self._path):
+            os.unlink(self._path) # Left over by a broker that did not shut down
+        self._server = _BrokerServer(self._path, _BrokerHandler)
+        self._server.broker = self
+
+    def start(self):
+        """Serves the clients in a background thread."""
+
+        self._thread = threading.Thread(target=self._server.serve_forever, name="rtestbench-broker", daemon=True)
+        self._thread.start()
+
+    def serve_forever(self):
+        """Serves the clients until shutdown() is called from another thread."""
+
+        self._server.serve_forever()
+
+    def shutdown(self):
+        """Stops serving and removes the socket."""
+
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+        if os.path.exists(self._path):
+            os.unlink(self._path)
+
+    def call(self, request: dict, client=None):
+        """Runs a request through the scheduler of the manager and returns the result.
+
+        Raises:
+            KeyError: The tool is not served.
+            AttributeError: The method is private or does not exist.
+        """
+
+        if request.get("method") == "list_tools":
+            return {name: str(tool._info) for name, tool in self._tools.items()}
+
+        tool = self._tools[request["tool"]]
+        method = request["method"]
+        if method.startswith('_') or not callable(getattr(tool, method, None)):
+            raise AttributeError("The method {} cannot be called on the tool {}.".format(method, request["tool"]))
+
+        future = self._manager.submit(
+            tool, method, *request.get("args", []),
+            priority=request.get("priority", _scheduler.PRIORITY_NORMAL), client=client, **request.get("kwargs", {}))
+        return future.result()
+
+
+# Client
+###
+
+def _attach_shared_memory(name: str):
+    """Maps an existing shared memory block without letting the resource tracker of the client unlink it."""
+
+    try:
+        return shared_memory.SharedMemory(name=name, track=False) # Python 3.13+
+    except TypeError:
+        block = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(block._name, "shared_memory")
+        return block
+
+
+class BrokerClient(object):
+    """Client of a Broker, with the interface of the tools it serves.
+
+    Attributes:
+        _socket: The socket connected to the broker.
+        _lock: A threading.Lock serializing the requests of the client.
+        _request_id: An int numbering the requests.
+        _blocks: A list of (weak reference to an array, shared memory block) pairs, closed once the array is released.
+    """
+
+    def __init__(self, path):
+        _check_unix_sockets()
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.connect(str(path))
+        self._lock = threading.Lock()
+        self._request_id = 0
+        self._blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Disconnects from the broker; arrays already received remain valid."""
+
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+        self._release_blocks()
+
+    def call(self, tool: str, method: str, *args, priority: int = _scheduler.PRIORITY_NORMAL, **kwargs):
+        """Calls a method of a tool served by the broker and returns its result.
+
+        Raises:
+            The exception raised by the method in the broker (RuntimeError if it cannot be forwarded).
+        """
+
+        with self._lock:
+            self._release_blocks()
+            self._request_id += 1
+            _send_message(self._socket, {
+                "id": self._request_id, "tool": tool, "method": method,
+                "args": list(args), "kwargs": kwargs, "priority": priority})
+            answer = _receive_message(self._socket)
+
+        if "error" in answer:
+            error = _FORWARDED_ERRORS.get(answer["error"]["type"], RuntimeError)
+            raise error(answer["error"]["message"])
+        return self._decode(answer["result"])
+
+    def _decode(self, result):
+        if isinstance(result, dict) and "__array__" in result:
+            description = result["__array__"]
+            block = _attach_shared_memory(description["name"])
+            array = np.ndarray(description["shape"], dtype=np.dtype(description["dtype"]), buffer=block.buf)
+            self._blocks.append((weakref.ref(array), block))
+            return array
+        elif isinstance(result, dict) and "__list__" in result:
+            return np.array(result["__list__"]["data"], dtype=np.dtype(result["__list__"]["dtype"]))
+        return result
+
+    def _release_blocks(self):
+        """Closes the shared memory blocks whose arrays (and views) have been released."""
+
+        alive = []
+        for array, block in self._blocks:
+            if array() is None:
+                block.close()
+            else:
+                alive.append((array, block))
+        self._blocks = alive
+
+
+    # Tool interface
+    def list_tools(self) -> dict:
+        """Returns the description of the served tools, by name."""
+
+        return self.call(None, "list_tools")
+
+    def send(self, tool: str, command: str):
+        return self.call(tool, "send", command)
+
+    def query(self, tool: str, request: str) -> str:
+        return self.call(tool, "query", request)
+
+    def query_data(self, tool: str, request: str, number_data="auto"):
+        return self.call(tool, "query_data", request, number_data)
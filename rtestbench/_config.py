@@ -0,0 +1,222 @@
+"""A test bench configurator.
+
+Relies on the json module (and on PyYAML for YAML files).
+Loads a declarative description of the test bench (tools, addresses and settings),
+then compiles the settings of each tool into a few SCPI messages that are sent in parallel.
+
+Example of YAML configuration file:
+
+    tools:
+      electrometer:
+        address: "USB0::0x2A8D::0x9B01::MY12345678::INSTR"
+        settings:
+          data_transfer_format: [bin, double]
+          meas_data_types: {data_types: [CURRent, VOLTage]}
+          trigger_source: TIMer
+          trigger_count: 1000
+          enable_amperemeter:
+
+Each setting name refers to the set_<name>() method of the tool, or to the <name>() method itself.
+Its value gives the arguments: a list for positional arguments, a mapping for keyword arguments,
+nothing for no argument, or a single value otherwise.
+"""
+
+
+
+import json
+import logging
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import yaml
+except ImportError:
+    _HAS_YAML = False
+else:
+    _HAS_YAML = True
+
+logger = logging.getLogger(__name__)
+
+
+CONFIG_YAML_SUFFIXES = (".yaml", ".yml")
+CONFIG_JSON_SUFFIXES = (".json",)
+
+SCPI_MESSAGE_MAX_LENGTH = 1024 # Conservative size of the input buffer of most tools
+
+
+# Loading and validation
+###
+
+def load_config(file_path) -> dict:
+    """Returns the configuration read from a YAML or JSON file.
+
+    Raises:
+        ImportError: The PyYAML package is missing to read a YAML file.
+        ValueError: The file type is not supported or the configuration is malformed.
+    """
+
+    path = Path(file_path)
+
+    with open(path, 'r') as f:
+        if path.suffix in CONFIG_YAML_SUFFIXES:
+            if _HAS_YAML:
+                config = yaml.safe_load(f)
+            else:
+                raise ImportError("The PyYAML package seems to be missing. Cannot load YAML configuration files.")
+        elif path.suffix in CONFIG_JSON_SUFFIXES:
+            config = json.load(f)
+        else:
+            raise ValueError("The configuration file must have a suffix in {}.".format(CONFIG_YAML_SUFFIXES + CONFIG_JSON_SUFFIXES))
+
+    validate_config(config)
+    return config
+
+def validate_config(config: dict):
+    """Checks the structure of a configuration, before any tool is reached.
+
+    Raises:
+        ValueError: The configuration is malformed.
+    """
+
+    if not isinstance(config, dict) or not isinstance(config.get("tools"), dict):
+        raise ValueError("The configuration must contain a 'tools' mapping.")
+
+    for name, tool_config in config["tools"].items():
+        if not isinstance(tool_config, dict) or not isinstance(tool_config.get("address"), str):
+            raise ValueError("The tool {} must be a mapping with an 'address' string.".format(name))
+        if not isinstance(tool_config.get("settings") or {}, dict):
+            raise ValueError("The settings of the tool {} must be a mapping.".format(name))
+
+
+# Compilation
+###
+
+def _setting_method(tool, name: str):
+    for method_name in ("set_" + name, name):
+        method = getattr(tool, method_name, None)
+        if callable(method):
+            return method
+    raise ValueError("The setting {} is not supported by the tool {}.".format(name, tool._info))
+
+def _call_setting(method, value):
+    if value is None:
+        method()
+    elif isinstance(value, list):
+        method(*value)
+    elif isinstance(value, dict):
+        method(**value)
+    else:
+        method(value)
+
+def compile_settings(tool, settings: dict) -> list:
+    """Returns the SCPI commands sent by the setters of the tool, without sending them.
+
+    The setters of the driver run in a dry run (see Tool.record_commands()), so the values
+    are validated against the capabilities of the tool.
+
+    Raises:
+        ValueError: A setting is not supported or has an invalid value.
+    """
+
+    with tool.record_commands() as commands:
+        for name, value in (settings or {}).items():
+            method = _setting_method(tool, name)
+            try:
+                _call_setting(method, value)
+            except (ValueError, TypeError, NotImplementedError, IOError) as err:
+                raise ValueError("Invalid setting {}: {} for the tool {}; {}".format(name, value, tool._info, err))
+
+    return commands
+
+def _header(command: str) -> str:
+    return command.split(' ', 1)[0].upper()
+
+def deduplicate_commands(commands: list) -> list:
+    """Drops the redundant settings without reordering the commands, since SCPI settings may depend on each other.
+
+    A setting is redundant if the next command sets the same header again, or if it sends the value
+    already set to its header; commands without argument (events, e.g. *RST) are all kept and may change any value.
+    """
+
+    deduplicated = []
+    values = {}
+    for position, command in enumerate(commands):
+        if ' ' not in command.strip():
+            deduplicated.append(command)
+            values.clear()
+            continue
+
+        header, value = _header(command), command.strip().split(' ', 1)[1]
+        following = commands[position + 1] if position + 1 < len(commands) else None
+        if following is not None and ' ' in following.strip() and _header(following) == header:
+            continue # Overwritten right away
+        if values.get(header) == value:
+            continue # Already set
+        values[header] = value
+        deduplicated.append(command)
+
+    return deduplicated
+
+def batch_commands(commands: list, max_length: int = SCPI_MESSAGE_MAX_LENGTH) -> list:
+    """Joins commands into as few SCPI messages as possible, separated with ';'.
+
+    Each command is rooted with a leading ':' (unless it is a common '*' command),
+    so that the header path of the previous command in the message does not apply.
+    """
+
+    messages = []
+    message = ''
+    for command in commands:
+        command = command.strip()
+        if not command.startswith((':', '*')):
+            command = ':' + command
+        if message and len(message) + 1 + len(command) > max_length:
+            messages.append(message)
+            message = ''
+        message = command if not message else message + ';' + command
+    if message:
+        messages.append(message)
+
+    return messages
+
+def compile_plan(tool, settings: dict, max_length: int = SCPI_MESSAGE_MAX_LENGTH) -> list:
+    """Returns the minimal list of SCPI messages that applies the settings to the tool."""
+
+    return batch_commands(deduplicate_commands(compile_settings(tool, settings)), max_length)
+
+
+# Application
+###
+
+def _apply_messages(tool, messages: list):
+    for message in messages:
+        tool.send(message)
+
+def apply_plans(plans: dict, max_workers: int = None):
+    """Sends the compiled messages of each tool; tools are configured in parallel.
+
+    Args:
+        plans: A dict associating each tool with its list of messages (see compile_plan()).
+        max_workers: The maximum number of threads (default: one per tool).
+
+    Raises:
+        RuntimeError: At least one tool could not be configured.
+    """
+
+    if not plans:
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(plans)) as executor:
+        futures = {tool: executor.submit(_apply_messages, tool, messages) for tool, messages in plans.items()}
+
+    failures = []
+    for tool, future in futures.items():
+        err = future.exception()
+        if err is not None:
+            logger.error("Cannot configure %s: %s", tool._info, err)
+            failures.append(str(tool._info))
+        else:
+            logger.debug("%s configured with %s message(s).", tool._info, len(plans[tool]))
+
+    if failures:
+        raise RuntimeError("Cannot configure the following tools: {}.".format(", ".join(failures)))
@@ -0,0 +1,149 @@
+"""A discovery cache for the tools available to the VISA resource manager.
+
+Relies on the threading and concurrent.futures modules.
+Lists of resources are kept for a given time (TTL) per query, optionally refreshed in the background,
+and the identity of each resource (*IDN?) is probed once, in parallel, when it first appears.
+"""
+
+
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pyvisa as visa
+
+
+DISCOVERY_QUERY_ALL = "?*::INSTR"
+DISCOVERY_TTL = 5.0 # Seconds during which a list of resources is reused
+
+
+class DiscoveryCache(object):
+    """Cache of the resources listed by a VISA resource manager and of their identities.
+
+    Attributes:
+        _list_resources: A callable taking a query and returning a tuple of addresses (e.g., ResourceManager.list_resources).
+        _probe: A callable taking an address and returning its ToolInfo.
+        _ttl: A float giving the time in seconds during which a list of resources is valid.
+        _lists: A dict associating each query with a tuple (time.monotonic() of the listing, tuple of addresses).
+        _identities: A dict associating each probed address with its ToolInfo.
+        _lock: A threading.RLock protecting the cache.
+        _stop_refresh: A threading.Event stopping the background refresh, or None.
+        _refresh_thread: The threading.Thread refreshing the lists in the background, or None.
+    """
+
+    def __init__(self, list_resources, probe, ttl: float = DISCOVERY_TTL):
+        self._list_resources = list_resources
+        self._probe = probe
+        self._ttl = ttl
+        self._lists = dict()
+        self._identities = dict()
+        self._lock = threading.RLock()
+        self._stop_refresh = None
+        self._refresh_thread = None
+
+
+    # Resources
+    def list_resources(self, query: str = DISCOVERY_QUERY_ALL, refresh: bool = False) -> tuple:
+        """Returns the addresses matching query, listed again only if the cached list is too old.
+
+        Raises:
+            IOError: The VISA resource manager cannot list the resources.
+        """
+
+        with self._lock:
+            entry = self._lists.get(query)
+            if not refresh and entry is not None and time.monotonic() - entry[0] < self._ttl:
+                return entry[1]
+
+        return self._refresh(query)
+
+    def _refresh(self, query: str) -> tuple:
+        try:
+            addresses = tuple(self._list_resources(query))
+        except visa.VisaIOError as err:
+            if err.error_code == visa.constants.VI_ERROR_RSRC_NFOUND:
+                addresses = tuple()
+            else:
+                raise IOError(err.description)
+
+        with self._lock:
+            previous = self._lists.get(query, (None, tuple()))[1]
+            self._lists[query] = (time.monotonic(), addresses)
+            for address in set(previous) - set(addresses):
+                self._identities.pop(address, None) # Unplugged: it will be probed again if it comes back
+
+        return addresses
+
+    def invalidate(self, address: str = None):
+        """Forgets the identity of address (or everything), so that it is listed and probed again."""
+
+        with self._lock:
+            if address is None:
+                self._lists.clear()
+                self._identities.clear()
+            else:
+                self._identities.pop(address, None)
+                self._lists.clear()
+
+
+    # Identities
+    def identify(self, addresses, max_workers: int = 8) -> dict:
+        """Returns the ToolInfo of each address; addresses not probed yet are probed in parallel."""
+
+        with self._lock:
+            unknown = [address for address in addresses if address not in self._identities]
+
+        if unknown:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(unknown))) as executor:
+                probed = dict(zip(unknown, executor.map(self._probe, unknown)))
+            with self._lock:
+                self._identities.update(probed)
+
+        with self._lock:
+            return {address: self._identities[address] for address in addresses}
+
+    def get_identity(self, address: str):
+        """Returns the ToolInfo of address if it is known, None otherwise."""
+
+        with self._lock:
+            return self._identities.get(address)
+
+    def remember(self, address: str, info):
+        """Records the ToolInfo of an address that is already known (e.g., an attached tool)."""
+
+        with self._lock:
+            self._identities[address] = info
+
+
+    # Background refresh
+    def start_background_refresh(self, period: float = None):
+        """Refreshes all cached lists every period seconds (default: TTL) in a background thread."""
+
+        if self._refresh_thread is not None:
+            return
+
+        period = self._ttl if period is None else period
+        self._stop_refresh = threading.Event()
+
+        def refresh_loop(stop):
+            while not stop.wait(period):
+                with self._lock:
+                    queries = list(self._lists)
+                for query in queries:
+                    try:
+                        self._refresh(query)
+                    except IOError:
+                        pass # Try again at the next period
+
+        self._refresh_thread = threading.Thread(target=refresh_loop, args=(self._stop_refresh,), name="rtestbench-discovery", daemon=True)
+        self._refresh_thread.start()
+
+    def stop_background_refresh(self):
+        """Stops the background refresh."""
+
+        if self._refresh_thread is not None:
+            self._stop_refresh.set()
+            self._refresh_thread.join()
+            self._refresh_thread = None
+            self._stop_refresh = None
@@ -0,0 +1,210 @@
+"""A binary event log for instrument telemetry.
+
+Relies on numpy (and on pandas for analysis).
+Records one fixed-size binary record per transaction with a tool (send, query, query_data),
+in segment files that rotate when they reach a given size. Strings (tool descriptions
+and command headers) are stored once in a companion table and referred to by their index;
+the arguments of the commands are not recorded, so the table stays as small as the command set.
+"""
+
+
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+# Record of a transaction (24 bytes)
+EVENT_DTYPE = np.dtype([
+    ('timestamp', '<f8'),   # POSIX time at the start of the transaction
+    ('duration', '<f4'),    # Duration of the transaction in seconds
+    ('command', '<u4'),     # Index of the command header (without arguments) in the string table
+    ('bytes', '<u4'),       # Number of bytes sent or received
+    ('tool', '<u2'),        # Index of the tool description in the string table
+    ('kind', 'u1'),         # Index in EVENT_KINDS
+    ('status', 'u1'),       # Index in EVENT_STATUSES
+])
+
+EVENT_SEND = 0
+EVENT_QUERY = 1
+EVENT_QUERY_DATA = 2
+EVENT_KINDS = ("send", "query", "query_data")
+
+EVENT_STATUS_OK = 0
+EVENT_STATUS_ERROR = 1
+EVENT_STATUSES = ("ok", "error")
+
+
+def command_header(command: str) -> str:
+    """Returns the headers of the messages of an SCPI command, without their arguments (e.g., ':SOUR:VOLT;:OUTP' for ':SOUR:VOLT 1.5;:OUTP ON')."""
+
+    return ';'.join(message.strip().split(' ', 1)[0] for message in command.split(';'))
+
+def segment_path(file_path, number: int) -> Path:
+    """Returns the path to the segment number of the event log."""
+
+    path = Path(file_path)
+    return path.parent / "{}.{:05d}.events".format(path.name, number)
+
+def segment_paths(file_path) -> list:
+    """Returns the paths to the existing segments of the event log, oldest first."""
+
+    path = Path(file_path)
+    return sorted(path.parent.glob("{}.[0-9][0-9][0-9][0-9][0-9].events".format(path.name)))
+
+def strings_path(file_path) -> Path:
+    """Returns the path to the string table of the event log."""
+
+    path = Path(file_path)
+    return path.parent / "{}.strings".format(path.name)
+
+
+class EventLog(object):
+    """Writer of the binary event log; records are buffered in memory and written in blocks.
+
+    Attributes:
+        _file_path: A pathlib.Path object giving the base path of the event log.
+        _max_bytes: An int giving the size of a segment above which a new segment is started.
+        _max_segments: An int giving the number of segments to keep (None keeps all).
+        _buffer: A NumPy structured array (EVENT_DTYPE) of the records waiting to be written.
+        _n_buffered: An int counting the records in the buffer.
+        _segment: An int giving the number of the segment in use.
+        _segment_stream: A binary file object to append records to the segment.
+        _strings: A dict associating each known string with its index in the string table.
+        _strings_stream: A text file object to append new strings to the string table.
+        _lock: A threading.RLock protecting the buffer and the string table against concurrent tools.
+    """
+
+    def __init__(self, file_path, max_bytes: int = 2**26, max_segments: int = None, buffer_size: int = 4096):
+        self._file_path = Path(file_path)
+        self._max_bytes = max_bytes
+        self._max_segments = max_segments
+
+        self._buffer = np.empty(buffer_size, dtype=EVENT_DTYPE)
+        self._n_buffered = 0
+
+        self._strings = {text: index for index, text in enumerate(load_strings(self._file_path))}
+        self._strings_stream = open(strings_path(self._file_path), 'a')
+
+        segments = segment_paths(self._file_path)
+        self._segment = int(segments[-1].name.split('.')[-2]) if segments else 0
+        self._segment_stream = open(segment_path(self._file_path, self._segment), 'ab')
+
+        self._lock = threading.RLock()
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """Writes the buffered records and closes the files."""
+
+        if getattr(self, "_segment_stream", None) is None:
+            return
+
+        with self._lock:
+            self._write_buffer()
+            self._segment_stream.close()
+            self._strings_stream.close()
+            self._segment_stream = None
+
+    def flush(self):
+        """Writes the buffered records to disk."""
+
+        with self._lock:
+            self._write_buffer()
+            self._segment_stream.flush()
+            self._strings_stream.flush()
+
+
+    # Writing
+    def intern(self, text: str) -> int:
+        """Returns the index of text in the string table, adding it if needed."""
+
+        index = self._strings.get(text)
+        if index is None:
+            with self._lock:
+                index = self._strings.get(text)
+                if index is None:
+                    index = len(self._strings)
+                    self._strings[text] = index
+                    self._strings_stream.write(json.dumps(text) + '\n')
+        return index
+
+    def record(self, tool: int, kind: int, command: str, n_bytes: int, start: float, status: int = EVENT_STATUS_OK):
+        """Records a transaction that started at the POSIX time start and ends now.
+
+        Args:
+            tool: The index of the tool description (see intern()).
+            kind: The kind of transaction, among EVENT_SEND, EVENT_QUERY and EVENT_QUERY_DATA.
+            command: The SCPI command or request, recorded by its header (see command_header()).
+            n_bytes: The number of bytes sent or received.
+            start: The POSIX time at the start of the transaction (time.time()).
+            status: EVENT_STATUS_OK or EVENT_STATUS_ERROR.
+        """
+
+        end = time.time()
+        with self._lock:
+            self._buffer[self._n_buffered] = (start, end - start, self.intern(command_header(command)), n_bytes, tool, kind, status)
+            self._n_buffered += 1
+            if self._n_buffered == len(self._buffer):
+                self._write_buffer()
+
+    def _write_buffer(self):
+        if self._n_buffered:
+            self._strings_stream.flush() # Records never refer to strings that are not on disk
+            self._segment_stream.write(self._buffer[:self._n_buffered].tobytes())
+            self._n_buffered = 0
+            if self._segment_stream.tell() >= self._max_bytes:
+                self._rotate()
+
+    def _rotate(self):
+        """Starts a new segment and removes the oldest ones beyond max_segments."""
+
+        self._segment_stream.close()
+        self._segment += 1
+        self._segment_stream = open(segment_path(self._file_path, self._segment), 'ab')
+
+        if self._max_segments is not None:
+            for path in segment_paths(self._file_path)[:-self._max_segments]:
+                path.unlink()
+
+
+# Readers
+###
+
+def load_strings(file_path) -> list:
+    """Returns the string table of the event log."""
+
+    path = strings_path(file_path)
+    if not path.exists():
+        return []
+    with open(path, 'r') as f:
+        return [json.loads(line) for line in f]
+
+def read_events(file_path) -> np.ndarray:
+    """Returns all records of the event log as a structured array (see EVENT_DTYPE)."""
+
+    segments = [np.fromfile(path, dtype=EVENT_DTYPE) for path in segment_paths(file_path)]
+    if not segments:
+        return np.empty(0, dtype=EVENT_DTYPE)
+    return np.concatenate(segments)
+
+def read_events_frame(file_path) -> pd.DataFrame:
+    """Returns all records of the event log as a pandas' DataFrame with decoded strings."""
+
+    events = read_events(file_path)
+    strings = pd.Index(load_strings(file_path))
+
+    return pd.DataFrame({
+        "timestamp": pd.to_datetime(events['timestamp'], unit='s'),
+        "duration": events['duration'],
+        "tool": pd.Categorical(strings[events['tool']]),
+        "kind": pd.Categorical.from_codes(events['kind'], EVENT_KINDS),
+        "command": pd.Categorical(strings[events['command']]),
+        "bytes": events['bytes'],
+        "status": pd.Categorical.from_codes(events['status'], EVENT_STATUSES),
+    })
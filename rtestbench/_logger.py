@@ -1,15 +1,36 @@
 """A logger configurator for the application.
 
 Relies on the logging module.
+Log records are only put in a queue by the calling thread (e.g., the acquisition loop);
+a background listener thread formats them and writes them to the terminal and to the log file.
 """
 
 
+import atexit
 import logging
+import logging.handlers
+import queue
+
+
+_listeners = {} # QueueListener of each configured logger, by logger name
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler leaving the formatting of the records to the listener thread.
+
+    The queue does not leave the process, so the records need not be made picklable
+    by formatting them on the calling thread (see QueueHandler.prepare()).
+    """
+
+    def prepare(self, record):
+        return record
 
 
 def make_logger(logger_name: str = '', verbose: bool = True) -> logging.Logger:
     """Returns a logger for handling log file and stream.
 
+    The setup is idempotent: calling it again for the same logger only updates the terminal level.
+
     Args:
         logger_name: The name of the logger.
         verbose: A boolean to choose between INFO and WARNING level printed in the terminal
@@ -21,11 +42,14 @@ def make_logger(logger_name: str = '', verbose: bool = True) -> logging.Logger:
         logger = logging.getLogger(__name__)
     logger.setLevel(logging.DEBUG)
 
+    console_level = logging.INFO if verbose else logging.WARNING
+
+    if logger.name in _listeners:
+        get_handlers(logger.name)[0].setLevel(console_level)
+        return logger
+
     console_loghandler = logging.StreamHandler()
-    if verbose:
-        console_loghandler.setLevel(logging.INFO)
-    else:
-        console_loghandler.setLevel(logging.WARNING)
+    console_loghandler.setLevel(console_level)
 
     file_loghandler = logging.FileHandler(filename='rtestbench.log', mode='w')
     file_loghandler.setLevel(logging.DEBUG)
@@ -34,7 +58,34 @@ def make_logger(logger_name: str = '', verbose: bool = True) -> logging.Logger:
     console_loghandler.setFormatter(formatter)
     file_loghandler.setFormatter(formatter)
 
-    logger.addHandler(console_loghandler)
-    logger.addHandler(file_loghandler)
+    log_queue = queue.Queue()
+    listener = logging.handlers.QueueListener(log_queue, console_loghandler, file_loghandler, respect_handler_level=True)
+    listener.start()
+    _listeners[logger.name] = listener
+
+    logger.addHandler(_LocalQueueHandler(log_queue))
 
     return logger
+
+def get_handlers(logger_name: str) -> tuple:
+    """Returns the handlers (terminal, file) fed by the queue of a logger configured by make_logger()."""
+
+    return _listeners[logger_name].handlers
+
+def stop_logger(logger_name: str):
+    """Writes the pending records of a logger, then stops its listener and closes its handlers."""
+
+    listener = _listeners.pop(logger_name, None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+        logger = logging.getLogger(logger_name)
+        for handler in list(logger.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                logger.removeHandler(handler)
+
+@atexit.register
+def _stop_all_loggers():
+    for logger_name in list(_listeners):
+        stop_logger(logger_name)
@@ -1,38 +1,94 @@
 """A meta-data utility.
 
 Relies on the json module.
-Writes files from information sent by rtestbench.
-TO BE IMPLEMENTED - Allows to configure a test bench by loading a config file.
+Writes files from information sent by rtestbench as an append-only JSON Lines event log,
+with a companion binary index giving the byte offset and timestamp range of each run.
+The configuration of a test bench from a file is handled by the _config module.
 """
 
 
 
 import json
+import numpy as np
 from pathlib import Path
 from datetime import (datetime, timezone)
 
 
 
+# Record of the companion index, one per run
+META_INDEX_DTYPE = np.dtype([
+    ('run', '<i8'),     # Run number
+    ('offset', '<i8'),  # Byte offset of the run event in the JSON Lines file
+    ('end', '<i8'),     # Byte offset just after the last event of the run
+    ('first', '<f8'),   # POSIX timestamp of the start of the run
+    ('last', '<f8'),    # POSIX timestamp of the last timestamped event of the run
+])
+
+
+def meta_file_path(file_path) -> Path:
+    """Returns the path to the JSON Lines meta-data file associated with file_path."""
+
+    return Path(file_path).with_suffix(".meta.jsonl")
+
+def index_file_path(file_path) -> Path:
+    """Returns the path to the index of the meta-data file associated with file_path."""
+
+    return Path(file_path).with_suffix(".meta.idx")
+
+
 class MetaDataManager(object):
 
     """Manager for meta-data.
-    
+
+    Events are buffered and flushed in batches; the index record of a run is appended when the run ends.
+
     Attributes:
         _file_path: A pathlib.Path object describing the path to the meta-data file.
-        _file_stream: A file object to stream meta-data to a json file.
+        _index_path: A pathlib.Path object describing the path to the index file.
+        _file_stream: A binary file object to append meta-data to the JSON Lines file.
+        _index_stream: A binary file object to append records to the index file.
+        _offset: An int giving the byte offset of the end of the meta-data file.
+        _flush_every: An int giving the number of events written between two flushes.
+        _pending: An int counting the events written since the last flush.
+        _current_run: A numpy record (META_INDEX_DTYPE) of the run in progress, or None.
     """
 
 
-    def __init__(self, file_path):
-        self._file_path = Path(file_path)
-        self._file_path = file_path.with_suffix(".meta.json")
+    def __init__(self, file_path, flush_every: int = 100, buffer_size: int = 2**16):
+        self._file_path = meta_file_path(file_path)
+        self._index_path = index_file_path(file_path)
+
+        self._file_stream = open(self._file_path, 'ab', buffering=buffer_size)
+        self._index_stream = open(self._index_path, 'ab')
+        self._offset = self._file_stream.tell()
+
+        self._flush_every = flush_every
+        self._pending = 0
+        self._current_run = None
 
-        self._file_stream = open(self._file_path, 'w')
-    
 
     def __del__(self):
-        self._file_stream.close()
-    
+        self.close()
+
+    def close(self):
+        """Ends the run in progress and flushes all buffered events to disk."""
+
+        if getattr(self, "_index_stream", None) is None:
+            return
+
+        self._end_run()
+        if not self._file_stream.closed:
+            self._file_stream.close()
+        self._index_stream.close()
+        self._index_stream = None
+
+    def flush(self):
+        """Writes the buffered events and index records to disk."""
+
+        self._file_stream.flush()
+        self._index_stream.flush()
+        self._pending = 0
+
 
     # Utilities
     @staticmethod
@@ -41,25 +97,137 @@ class MetaDataManager(object):
 
         return datetime.now(tz=timezone.utc).astimezone().isoformat()
 
-    
+    @staticmethod
+    def _get_timestamps():
+        """Returns the current date time both in ISO 8601 format and as a POSIX timestamp."""
+
+        now = datetime.now(tz=timezone.utc).astimezone()
+        return now.isoformat(), now.timestamp()
+
+    def _end_run(self):
+        """Appends the index record of the run in progress."""
+
+        if self._current_run is not None:
+            self._current_run['end'] = self._offset
+            self._index_stream.write(self._current_run.tobytes())
+            self._current_run = None
+
+    def _touch_run(self, posix_time: float):
+        """Extends the timestamp range of the run in progress."""
+
+        if self._current_run is not None:
+            self._current_run['last'] = posix_time
+
+
     # Generic functions
     def dump_meta(self, metadata: dict):
-        json.dump(metadata, self._file_stream)
-    
+        line = json.dumps(metadata, separators=(',', ':')).encode() + b'\n'
+        self._file_stream.write(line)
+        self._offset += len(line)
+
+        self._pending += 1
+        if self._pending >= self._flush_every:
+            self.flush()
+
     def dump_timestamp(self, label: str):
-        timestamp = self.get_timestamp()
+        timestamp, posix_time = self._get_timestamps()
 
         metadata = {label:timestamp}
         self.dump_meta(metadata)
-    
+        self._touch_run(posix_time)
+
 
     # Specific functions
     def dump_run_info(self, number: int, description: str):
+        timestamp, posix_time = self._get_timestamps()
         metadata = {
             "Run":{
                 "Number": number,
-                "Timestamp": self.get_timestamp(),
+                "Timestamp": timestamp,
                 "Info": description
             }
         }
+
+        self._end_run()
+        self._current_run = np.array((number, self._offset, -1, posix_time, posix_time), dtype=META_INDEX_DTYPE)
+
         self.dump_meta(metadata)
+
+
+# Readers
+###
+
+def _parse_timestamp(timestamp: str) -> float:
+    """Returns the POSIX time of a timestamp written by MetaDataManager.get_timestamp().
+
+    datetime.fromisoformat() needs Python 3.7, and %z only accepts the colon of the UTC offset from Python 3.7.
+
+    Raises:
+        ValueError: The string is not such a timestamp.
+    """
+
+    if timestamp[-3:-2] == ':':
+        timestamp = timestamp[:-3] + timestamp[-2:]
+    time_format = '%Y-%m-%dT%H:%M:%S.%f%z' if '.' in timestamp else '%Y-%m-%dT%H:%M:%S%z'
+    return datetime.strptime(timestamp, time_format).timestamp()
+
+def load_index(file_path) -> np.ndarray:
+    """Returns the index of the meta-data file as a structured array (see META_INDEX_DTYPE)."""
+
+    path = index_file_path(file_path)
+    if path.stat().st_size == 0:
+        return np.empty(0, dtype=META_INDEX_DTYPE)
+    return np.memmap(path, dtype=META_INDEX_DTYPE, mode='r')
+
+def read_run(file_path, number: int) -> list:
+    """Returns the list of events of run number, read directly from its byte offset.
+
+    Raises:
+        KeyError: The run is not in the index.
+    """
+
+    index = load_index(file_path)
+    matches = np.flatnonzero(index['run'] == number)
+    if len(matches) == 0:
+        raise KeyError("The run {} is not in the index of {}.".format(number, file_path))
+    record = index[matches[-1]]
+
+    with open(meta_file_path(file_path), 'rb') as f:
+        f.seek(record['offset'])
+        block = f.read(record['end'] - record['offset'])
+
+    return [json.loads(line) for line in block.splitlines()]
+
+def find_runs(file_path, start: float = float('-inf'), stop: float = float('+inf')) -> np.ndarray:
+    """Returns the numbers of the runs overlapping the POSIX time range [start, stop]."""
+
+    index = load_index(file_path)
+    return np.array(index['run'][(index['last'] >= start) & (index['first'] <= stop)])
+
+def rebuild_index(file_path):
+    """Rebuilds the index by scanning the meta-data file (e.g., after a crash)."""
+
+    records = []
+    offset = 0
+    with open(meta_file_path(file_path), 'rb') as f:
+        for line in f:
+            event = json.loads(line)
+            if "Run" in event:
+                if records:
+                    records[-1]['end'] = offset
+                posix_time = _parse_timestamp(event["Run"]["Timestamp"])
+                records.append(np.array((event["Run"]["Number"], offset, -1, posix_time, posix_time), dtype=META_INDEX_DTYPE))
+            elif records:
+                for value in event.values():
+                    if isinstance(value, str):
+                        try:
+                            records[-1]['last'] = _parse_timestamp(value)
+                        except ValueError:
+                            pass
+            offset += len(line)
+    if records:
+        records[-1]['end'] = offset
+
+    with open(index_file_path(file_path), 'wb') as f:
+        for record in records:
+            f.write(record.tobytes())
@@ -0,0 +1,125 @@
+"""A pool of VISA sessions shared by the tools of a test bench.
+
+Relies on PyVISA.
+Sessions are kept open by address, so that a tool detached then attached again reuses its session,
+and a session lost on a transient failure (e.g., a USB hiccup) is replaced by a new one.
+"""
+
+
+
+import logging
+import threading
+
+import pyvisa as visa
+
+
+logger = logging.getLogger(__name__)
+
+# VISA errors after which the session is considered lost (the tool may come back)
+CONNECTION_ERRORS = frozenset((
+    visa.constants.VI_ERROR_CONN_LOST,
+    visa.constants.VI_ERROR_IO,
+    visa.constants.VI_ERROR_INV_OBJECT,
+    visa.constants.VI_ERROR_RSRC_NFOUND,
+    visa.constants.VI_ERROR_SYSTEM_ERROR,
+))
+
+
+def is_connection_error(err: Exception) -> bool:
+    """Returns True if err means that the session with the tool is lost."""
+
+    if isinstance(err, visa.InvalidSession):
+        return True
+    return isinstance(err, visa.VisaIOError) and err.error_code in CONNECTION_ERRORS
+
+def is_healthy(session) -> bool:
+    """Returns True if the VISA session is still open."""
+
+    try:
+        session.session
+    except visa.InvalidSession:
+        return False
+    return True
+
+
+class SessionPool(object):
+    """Pool of VISA sessions keyed by address, with the interface of a ResourceManager for ToolFactory.
+
+    Attributes:
+        _visa_rm: The ResourceManager opening the sessions.
+        _sessions: A dict associating each address with its open session.
+        _lock: A threading.RLock protecting the pool.
+    """
+
+    def __init__(self, visa_rm):
+        self._visa_rm = visa_rm
+        self._sessions = dict()
+        self._lock = threading.RLock()
+
+    def __contains__(self, address: str) -> bool:
+        with self._lock:
+            return address in self._sessions
+
+    def open_resource(self, address: str):
+        """Returns the pooled session of address if it is healthy, a new session otherwise.
+
+        Raises:
+            The exceptions of ResourceManager.open_resource() (AttributeError, ValueError, VisaIOError).
+        """
+
+        with self._lock:
+            session = self._sessions.get(address)
+            if session is not None and is_healthy(session):
+                return session
+
+        new_session = self._visa_rm.open_resource(address) # Unlocked, so that several tools are opened in parallel
+        with self._lock:
+            session = self._sessions.get(address)
+            if session is not None and session is not new_session and is_healthy(session): # Opened by another thread meanwhile
+                new_session.close()
+                return session
+            self._sessions[address] = new_session
+            return new_session
+
+    def reopen(self, address: str):
+        """Closes the session of address (which may be broken) and opens a new one.
+
+        Raises:
+            IOError: The tool cannot be reached anymore.
+        """
+
+        with self._lock:
+            self.discard(address)
+            try:
+                return self.open_resource(address)
+            except (AttributeError, ValueError, visa.VisaIOError) as err:
+                raise IOError("Cannot reopen a session with the tool @ {}: {}".format(address, err))
+
+    def discard(self, address: str):
+        """Closes the session of address and removes it from the pool."""
+
+        with self._lock:
+            session = self._sessions.pop(address, None)
+        if session is not None:
+            try:
+                session.close()
+            except (visa.InvalidSession, visa.VisaIOError) as err:
+                logger.debug("The session with %s was already broken: %s", address, err)
+
+    def health_check(self) -> dict:
+        """Removes the broken sessions from the pool; returns whether each pooled session was healthy, by address."""
+
+        with self._lock:
+            health = {address: is_healthy(session) for address, session in self._sessions.items()}
+        for address, healthy in health.items():
+            if not healthy:
+                self.discard(address)
+        return health
+
+    def close(self):
+        """Closes all sessions."""
+
+        with self._lock:
+            addresses = list(self._sessions)
+        for address in addresses:
+            self.discard(address)
@@ -0,0 +1,229 @@
+"""A measurement scheduler sharing tools between several clients.
+
+Relies on the threading and concurrent.futures modules.
+Each tool (i.e., each VISA session) is served by one worker thread that runs the submitted jobs
+one at a time, by priority, then deadline, then in turns between clients. Identical pending
+getters (declared by each tool in its COALESCED_GETTERS) are coalesced into a single transaction
+whose result is shared by all requesters; each requester keeps its own Future and deadline.
+"""
+
+
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 10
+PRIORITY_LOW = 20
+
+class DeadlineError(TimeoutError):
+    """The deadline of a job expired before the job could start."""
+
+
+class _Job(object):
+    """A call waiting in the queue of a session.
+
+    Attributes:
+        function: The callable to run.
+        args, kwargs: The arguments of the call.
+        key: A hashable object identifying identical queries, or None.
+        requests: A list of tuples (future, deadline, client), one per requester: the Future receiving the result of the call,
+            the time (time.monotonic()) before which the job must start for this requester or None, and the requester.
+        started: A boolean set when the job leaves the queue (other heap entries of the job are then ignored).
+    """
+
+    def __init__(self, function, args, kwargs, key):
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.key = key
+        self.requests = []
+        self.started = False
+
+
+class SessionWorker(object):
+    """Worker thread serializing the access to one tool.
+
+    Attributes:
+        _queue: A heap of entries (priority, deadline, round, sequence number, job).
+        _pending: A dict associating the key of each pending query with its job.
+        _client_rounds: A dict giving the round of the last job submitted by each client with pending jobs.
+        _client_pending: A dict giving the number of pending jobs of each client with pending jobs.
+        _round: An int giving the round of the last job started.
+        _sequence: An iterator numbering the entries to keep the heap stable.
+        _condition: A threading.Condition protecting the queue and waking the worker.
+        _running: A boolean, False once shutdown() is called.
+        _thread: The worker threading.Thread.
+    """
+
+    def __init__(self, name: str = None):
+        self._queue = []
+        self._pending = dict()
+        self._client_rounds = dict()
+        self._client_pending = dict()
+        self._round = 0
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._running = True
+
+        self._thread = threading.Thread(target=self._serve, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, function, *args, priority: int = PRIORITY_NORMAL, deadline: float = None, client=None, key=None, **kwargs) -> Future:
+        """Queues a call and returns a Future of its result.
+
+        Args:
+            function: The callable to run.
+            priority: The priority of the job (lower values run first, see PRIORITY_HIGH).
+            deadline: The time in seconds within which the job must start; DeadlineError is set otherwise.
+            client: Any hashable object identifying the requester; clients of equal priority are served in turns.
+            key: A hashable object identifying identical queries: a pending job with the same key is shared,
+                but the deadline and the cancellation of the returned Future only concern this requester.
+
+        Raises:
+            RuntimeError: The worker has been shut down.
+        """
+
+        with self._condition:
+            if not self._running:
+                raise RuntimeError("Cannot submit a job to a worker that has been shut down.")
+
+            absolute_deadline = None if deadline is None else time.monotonic() + deadline
+
+            job = self._pending.get(key) if key is not None else None
+            if job is None:
+                job = _Job(function, args, kwargs, key)
+                if key is not None:
+                    self._pending[key] = job
+            future = Future()
+            job.requests.append((future, absolute_deadline, client))
+
+            # Fair turns: a client cannot be served twice before the others that are waiting
+            client_round = max(self._client_rounds.get(client, -1) + 1, self._round)
+            self._client_rounds[client] = client_round
+            self._client_pending[client] = self._client_pending.get(client, 0) + 1
+
+            # Coalesced jobs get another entry, so that they run with the best priority of their requesters
+            heapq.heappush(self._queue, (
+                priority,
+                float('inf') if absolute_deadline is None else absolute_deadline,
+                client_round,
+                next(self._sequence),
+                job
+            ))
+            self._condition.notify()
+
+        return future
+
+    def shutdown(self, wait: bool = True):
+        """Stops the worker once the queued jobs are done."""
+
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if wait:
+            self._thread.join()
+
+    def _next_job(self):
+        with self._condition:
+            while True:
+                while self._queue:
+                    priority, deadline, client_round, sequence, job = heapq.heappop(self._queue)
+                    if job.started:
+                        continue # Already run through another entry
+                    job.started = True
+                    if job.key is not None:
+                        del self._pending[job.key]
+                    self._round = max(self._round, client_round)
+                    for _, _, client in job.requests:
+                        self._client_pending[client] -= 1
+                        if not self._client_pending[client]: # Served as a new client from now on
+                            del self._client_pending[client]
+                            del self._client_rounds[client]
+                    return job
+                if not self._running:
+                    return None
+                self._condition.wait()
+
+    def _serve(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+
+            now = time.monotonic()
+            futures = []
+            for future, deadline, _ in job.requests: # Complete, since the job left the queue
+                if not future.set_running_or_notify_cancel():
+                    continue
+                if deadline is not None and now > deadline:
+                    future.set_exception(DeadlineError("The deadline of the job expired before it could start."))
+                    continue
+                futures.append(future)
+            if not futures:
+                continue # Cancelled or expired for all requesters
+
+            try:
+                result = job.function(*job.args, **job.kwargs)
+            except BaseException as err:
+                for future in futures:
+                    future.set_exception(err)
+            else:
+                for future in futures:
+                    future.set_result(result)
+
+
+class Scheduler(object):
+    """Scheduler of the jobs sent to the tools of a test bench, with one SessionWorker per tool.
+
+    Attributes:
+        _workers: A dict associating each tool with its SessionWorker.
+        _lock: A threading.Lock protecting the creation of workers.
+    """
+
+    def __init__(self):
+        self._workers = dict()
+        self._lock = threading.Lock()
+
+    def _worker(self, tool) -> SessionWorker:
+        with self._lock:
+            if tool not in self._workers:
+                self._workers[tool] = SessionWorker(name="rtestbench-{}".format(tool._info.model))
+            return self._workers[tool]
+
+    def submit(self, tool, method, *args, priority: int = PRIORITY_NORMAL, deadline: float = None, client=None, **kwargs) -> Future:
+        """Queues a call of a method of tool and returns a Future of its result.
+
+        Pending calls of getters without side effect (see Tool.COALESCED_GETTERS) with the same arguments
+        are coalesced into a single transaction.
+
+        Args:
+            tool: The Tool to use.
+            method: The name of the method of the tool (e.g., 'get_range') or any callable taking no tool argument.
+            priority, deadline, client: See SessionWorker.submit().
+        """
+
+        key = None
+        if isinstance(method, str):
+            if method in getattr(tool, "COALESCED_GETTERS", ()):
+                try:
+                    key = (method, args, tuple(sorted(kwargs.items())))
+                    hash(key)
+                except TypeError:
+                    key = None # Unhashable arguments: no coalescing
+            method = getattr(tool, method)
+
+        return self._worker(tool).submit(method, *args, priority=priority, deadline=deadline, client=client, key=key, **kwargs)
+
+    def shutdown(self, wait: bool = True):
+        """Stops all workers once their queued jobs are done."""
+
+        with self._lock:
+            workers = list(self._workers.values())
+            self._workers.clear()
+        for worker in workers:
+            worker.shutdown(wait)
@@ -0,0 +1,365 @@
+"""A vocabulary of SCPI keywords for the validation of parameters, and tables of SCPI commands.
+
+Relies on the inspect, logging, re and string modules.
+SCPI keywords are written in their long form with the short form in upper case (e.g., 'CURRent'),
+and tools accept both forms in any case (e.g., 'CURR', 'current'). Each vocabulary precomputes
+an index of all accepted spellings, so that a parameter is validated in constant time.
+A driver declares its settings in a table of commands (header, argument, query form), from which
+its setters and getters are generated with their encoders compiled once, when the class is defined.
+"""
+
+
+
+import inspect
+import logging
+import re
+import string
+
+
+logger = logging.getLogger(__name__)
+
+_KEYWORD = re.compile(r"^([A-Z]*)([a-z]*)([0-9]*)$")
+
+
+def short_form(keyword: str) -> str:
+    """Returns the short form of a SCPI keyword (e.g., 'CURR' for 'CURRent', 'SING1' for 'SINGle1')."""
+
+    match = _KEYWORD.match(keyword)
+    if match is None or not (match.group(1) or match.group(3)):
+        raise ValueError("The keyword {} is not written as <SHORT><long><suffix> (e.g., 'CURRent').".format(keyword))
+    return match.group(1) + match.group(3)
+
+def long_form(keyword: str) -> str:
+    """Returns the long form of a SCPI keyword in upper case (e.g., 'CURRENT' for 'CURRent')."""
+
+    short_form(keyword) # Validates the keyword
+    return keyword.upper()
+
+
+class ScpiKeywords(object):
+    """Immutable set of SCPI keywords accepting their short and long forms in any case.
+
+    Attributes:
+        keywords: A tuple of the keywords as declared (e.g., 'CURRent'), in order.
+        _index: A dict associating each accepted spelling in upper case with its declared keyword.
+    """
+
+    __slots__ = ("keywords", "_index")
+
+    def __init__(self, *keywords):
+        """Builds the vocabulary from keywords (str) and other ScpiKeywords.
+
+        Raises:
+            ValueError: A keyword is malformed or two keywords share a spelling.
+        """
+
+        declared = []
+        for keyword in keywords:
+            declared.extend(keyword.keywords if isinstance(keyword, ScpiKeywords) else (keyword,))
+
+        index = dict()
+        for keyword in dict.fromkeys(declared): # Duplicates (e.g., from unions) are kept once
+            for spelling in (short_form(keyword), long_form(keyword)):
+                if index.get(spelling, keyword) != keyword:
+                    raise ValueError("The keywords {} and {} share the spelling {}.".format(index[spelling], keyword, spelling))
+                index[spelling] = keyword
+
+        object.__setattr__(self, "keywords", tuple(dict.fromkeys(declared)))
+        object.__setattr__(self, "_index", index)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ScpiKeywords are immutable.")
+
+    def match(self, value):
+        """Returns the declared keyword matching value (short or long form, any case), None otherwise."""
+
+        if not isinstance(value, str):
+            return None
+        return self._index.get(value.upper())
+
+    def __contains__(self, value) -> bool:
+        return self.match(value) is not None
+
+    def __iter__(self):
+        return iter(self.keywords)
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def __or__(self, other):
+        return ScpiKeywords(self, other)
+
+    def __eq__(self, other):
+        return isinstance(other, ScpiKeywords) and set(self.keywords) == set(other.keywords)
+
+    def __hash__(self):
+        return hash(frozenset(self.keywords))
+
+    def __repr__(self):
+        return "ScpiKeywords({})".format(", ".join(repr(keyword) for keyword in self.keywords))
+
+    def __str__(self):
+        return "({})".format(", ".join(self.keywords))
+
+
+# Command tables
+###
+
+SCPI_PRESETS = ScpiKeywords("MINimum", "MAXimum", "DEFault") # Accepted by numeric parameters
+SCPI_SWITCH = ScpiKeywords("ON", "OFF")
+
+
+def _encode_keyword(vocabulary: ScpiKeywords):
+    def encode(value) -> str:
+        keyword = vocabulary.match(value)
+        if keyword is None:
+            raise ValueError("The value {} must be in {}.".format(value, vocabulary))
+        return keyword
+    return encode
+
+def _encode_keywords(vocabulary: ScpiKeywords):
+    encode_keyword = _encode_keyword(vocabulary)
+    def encode(values) -> str:
+        if isinstance(values, str) or not values:
+            raise ValueError("The value {} must be a non-empty list of keywords in {}.".format(values, vocabulary))
+        return ','.join(encode_keyword(value) for value in values)
+    return encode
+
+def _encode_number(number_type):
+    encode_preset = _encode_keyword(SCPI_PRESETS)
+    def encode(value) -> str:
+        if isinstance(value, str):
+            return encode_preset(value)
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or (number_type is int and not isinstance(value, int)):
+            raise ValueError("The value {} must be a {} or in {}.".format(value, number_type.__name__, SCPI_PRESETS))
+        return str(value)
+    return encode
+
+def _encode_switch(value) -> str:
+    if isinstance(value, str):
+        return _encode_keyword(SCPI_SWITCH)(value)
+    return "ON" if value else "OFF"
+
+def compile_encoder(argument):
+    """Returns a function converting a parameter into its SCPI text, or raising ValueError if it is invalid.
+
+    Args:
+        argument: A ScpiKeywords (one keyword), a list holding one ScpiKeywords (comma-separated keywords),
+            int or float (number or preset such as 'MIN'), or bool (ON/OFF).
+    """
+
+    if isinstance(argument, ScpiKeywords):
+        return _encode_keyword(argument)
+    if isinstance(argument, list) and len(argument) == 1 and isinstance(argument[0], ScpiKeywords):
+        return _encode_keywords(argument[0])
+    if argument is bool:
+        return _encode_switch
+    if argument in (int, float):
+        return _encode_number(argument)
+    raise ValueError("Unsupported argument type {} for a SCPI command.".format(argument))
+
+def decode_int(answer: str) -> int:
+    """Returns the int of an answer, also written as a float by some tools (e.g., '+5.000000E+00')."""
+
+    try:
+        return int(answer)
+    except ValueError:
+        value = float(answer)
+        if not value.is_integer():
+            raise ValueError("The answer {} is not an integer.".format(answer))
+        return int(value)
+
+def decode_float(answer: str) -> float:
+    """Returns the float of an answer (e.g., '+1.000000E-03')."""
+
+    return float(answer)
+
+def decode_bool(answer: str) -> bool:
+    """Returns the boolean of an answer ('1', '0', 'ON' or 'OFF')."""
+
+    answer = answer.strip().upper()
+    if answer in ("1", "ON"):
+        return True
+    if answer in ("0", "OFF"):
+        return False
+    raise ValueError("The answer {} is not a boolean.".format(answer))
+
+def decode_keyword(vocabulary: ScpiKeywords):
+    """Returns a function converting an answer (e.g., 'CURR') into the declared keyword of vocabulary (e.g., 'CURRent')."""
+
+    def decode(answer: str) -> str:
+        keyword = vocabulary.match(answer.strip().strip('"'))
+        if keyword is None:
+            raise ValueError("The answer {} is not in {}.".format(answer, vocabulary))
+        return keyword
+    return decode
+
+def decode_keywords(vocabulary: ScpiKeywords):
+    """Returns a function converting a comma-separated answer (e.g., 'CURR,TIME') into a list of declared keywords."""
+
+    decode_one = decode_keyword(vocabulary)
+    def decode(answer: str) -> list:
+        return [decode_one(item) for item in answer.strip().strip('"').split(',')]
+    return decode
+
+def compile_decoder(argument):
+    """Returns a function converting the answer of a tool into the type of argument (see compile_encoder()), or str if None."""
+
+    if argument is None:
+        return str
+    if isinstance(argument, ScpiKeywords):
+        return decode_keyword(argument)
+    if isinstance(argument, list) and len(argument) == 1 and isinstance(argument[0], ScpiKeywords):
+        return decode_keywords(argument[0])
+    if argument is bool:
+        return decode_bool
+    if argument is int:
+        return decode_int
+    if argument is float:
+        return decode_float
+    raise ValueError("Unsupported argument type {} for a SCPI command.".format(argument))
+
+def compile_header(header: str):
+    """Returns a function giving the header from the properties of a tool (e.g., ':SENSe:{activated_display_ydata_type}:APERture')."""
+
+    fields = [field for _, field, _, _ in string.Formatter().parse(header) if field is not None]
+    if not fields:
+        return lambda properties: header
+    return lambda properties: header.format_map({field: getattr(properties, field) for field in fields})
+
+
+class ScpiCommand(object):
+    """Row of a command table, from which the setter and getter of a tool are generated (see scpi_commands()).
+
+    Attributes:
+        name: A str giving the name of the setting; the methods are set_<name>(), get_<name>() and, for numbers, set_<name>_min/max().
+        header: A str giving the SCPI header, possibly with fields naming properties of the tool.
+        argument: The type of the parameter (see compile_encoder()), or None for a getter only.
+        parameter: A str giving the name of the parameter of the setter (e.g., 'data_types'), used in configuration files.
+        query: A boolean stating whether the tool answers the query form of the header.
+        decoder: A callable converting the answer of the tool, or None to decode it as the argument (see compile_decoder()).
+        cache: A str naming the property of the tool updated with the set or got value, or None.
+        description: A str describing the setting in error messages (e.g., 'the trigger count').
+        coalesce: A boolean stating whether identical pending calls of the getter can share one transaction
+            (False for values changing by themselves, e.g. a number of acquired data).
+    """
+
+    def __init__(self, name: str, header: str, argument=None, parameter: str = "value", query: bool = True, decoder=None,
+                 cache: str = None, description: str = None, coalesce: bool = True):
+        self.name = name
+        self.header = header
+        self.argument = argument
+        self.parameter = parameter
+        self.query = query
+        self.decoder = decoder if decoder is not None else compile_decoder(argument)
+        self.cache = cache
+        self.description = description if description is not None else "the {}".format(name.replace('_', ' '))
+        self.coalesce = coalesce
+
+    def build_methods(self) -> dict:
+        """Returns the generated methods by name."""
+
+        methods = dict()
+        header_of = compile_header(self.header)
+        description, cache = self.description, self.cache
+
+        if self.argument is not None:
+            encode = compile_encoder(self.argument)
+            is_number = self.argument in (int, float)
+
+            is_list = isinstance(self.argument, list)
+            name, parameter_name = self.name, self.parameter
+            signature = inspect.Signature([inspect.Parameter(param, inspect.Parameter.POSITIONAL_OR_KEYWORD) for param in ("self", parameter_name)])
+
+            def setter(tool, *args, **kwargs):
+                if len(args) == 1 and not kwargs: # Positional call, without binding
+                    value = args[0]
+                else:
+                    value = signature.bind(tool, *args, **kwargs).arguments[parameter_name]
+                parameter = encode(value)
+                try:
+                    tool.send("{} {}".format(header_of(tool._properties), parameter))
+                except IOError as err:
+                    logger.error(err)
+                    raise RuntimeError("Cannot set {} to {} on {}.".format(description, value, tool._info))
+                if cache is not None:
+                    if is_number:
+                        setattr(tool._properties, cache, None if isinstance(value, str) else value) # Presets are queried when needed
+                    else:
+                        setattr(tool._properties, cache, parameter.split(',') if is_list else parameter)
+            setter.__signature__ = signature
+            methods["set_" + name] = setter
+
+            if is_number:
+                methods["set_{}_min".format(name)] = lambda tool: getattr(tool, "set_" + name)("MIN")
+                methods["set_{}_max".format(name)] = lambda tool: getattr(tool, "set_" + name)("MAX")
+
+        if self.query:
+            decode = self.decoder
+
+            def getter(tool):
+                try:
+                    answer = decode(tool.query(header_of(tool._properties) + '?'))
+                except IOError as err:
+                    logger.error(err)
+                    raise RuntimeError("Cannot get {} from {}.".format(description, tool._info))
+                except ValueError as err:
+                    raise RuntimeError("Unexpected answer for {} from {}: {}".format(description, tool._info, err))
+                if cache is not None:
+                    setattr(tool._properties, cache, answer)
+                return answer
+            methods["get_" + self.name] = getter
+
+        for method_name, method in methods.items():
+            method.__name__ = method.__qualname__ = method_name
+            method.__doc__ = "{} {} ({}).".format("Gets" if method_name.startswith("get_") else "Sets", description, self.header)
+        return methods
+
+
+class ScpiAction(object):
+    """Row of a command table sending a fixed message (e.g., ':INITiate:IMMediate:ACQuire').
+
+    Attributes:
+        name: A str giving the name of the generated method.
+        message: A str giving the SCPI message, possibly with fields naming properties of the tool.
+        description: A str describing the action in error messages (e.g., 'initiate measurement with').
+    """
+
+    def __init__(self, name: str, message: str, description: str):
+        self.name = name
+        self.message = message
+        self.description = description
+
+    def build_methods(self) -> dict:
+        message_of = compile_header(self.message)
+        description = self.description
+
+        def action(tool):
+            try:
+                tool.send(message_of(tool._properties))
+            except IOError as err:
+                logger.error(err)
+                raise RuntimeError("Cannot {} {}.".format(description, tool._info))
+        action.__name__ = action.__qualname__ = self.name
+        action.__doc__ = "Sends {}.".format(self.message)
+        return {self.name: action}
+
+
+def scpi_commands(table):
+    """Class decorator adding the methods generated from a table of ScpiCommand and ScpiAction rows.
+
+    Methods defined in the class itself are kept, so that a row can be overridden by hand.
+    The getters of the rows are added to the COALESCED_GETTERS of the class, unless declared with coalesce=False.
+    """
+
+    def decorate(cls):
+        coalesced = set(cls.COALESCED_GETTERS)
+        for row in table:
+            for name, method in row.build_methods().items():
+                if name not in cls.__dict__:
+                    setattr(cls, name, method)
+            if isinstance(row, ScpiCommand) and row.query and row.coalesce:
+                coalesced.add("get_" + row.name)
+        cls.COALESCED_GETTERS = frozenset(coalesced)
+        return cls
+    return decorate
@@ -0,0 +1,62 @@
+"""An adaptive timeout estimator for the IO operations with a tool.
+
+Relies on the threading module.
+The timeout of each operation is computed from its expected payload, the throughput measured on the link
+(exponentially weighted moving average of the large transfers), and the time the tool needs to acquire the data,
+so that small queries fail fast and large fetches never time out spuriously.
+"""
+
+
+
+import threading
+
+
+TIMEOUT_BASE = 1000             # Time in ms given to any operation (latency of the link and of the tool)
+TIMEOUT_MARGIN = 2.0            # Factor applied to the expected transfer and acquisition times
+TIMEOUT_THROUGHPUT = 1e5        # Throughput in bytes/s assumed before any measurement (about a 1 Mbit/s serial link)
+TIMEOUT_MIN_SAMPLE = 4096       # Size in bytes above which a transfer is used to measure the throughput
+TIMEOUT_TEXT_VALUE_SIZE = 16    # Size in bytes of a value transferred as text (e.g., '+1.234567E-12,')
+
+
+class AdaptiveTimeout(object):
+    """Estimator of the timeout of each operation with a tool.
+
+    Attributes:
+        base: A float giving the time in ms given to any operation.
+        margin: A float multiplying the expected transfer and acquisition times.
+        maximum: A float giving the largest timeout in ms, or None.
+        throughput: A float giving the estimated throughput of the link in bytes/s.
+        smoothing: A float in ]0, 1] giving the weight of a new measurement in the throughput average.
+        _lock: A threading.Lock protecting the throughput against concurrent updates.
+    """
+
+    def __init__(self, base: float = TIMEOUT_BASE, margin: float = TIMEOUT_MARGIN, maximum: float = None,
+                 throughput: float = TIMEOUT_THROUGHPUT, smoothing: float = 0.2):
+        if base <= 0 or margin < 1 or throughput <= 0 or not 0 < smoothing <= 1:
+            raise ValueError("Expected base > 0, margin >= 1, throughput > 0 and 0 < smoothing <= 1.")
+
+        self.base = base
+        self.margin = margin
+        self.maximum = maximum
+        self.throughput = throughput
+        self.smoothing = smoothing
+        self._lock = threading.Lock()
+
+    def estimate(self, n_bytes: int = 0, acquisition_time: float = 0.0) -> float:
+        """Returns the timeout in ms of an operation transferring n_bytes after acquiring for acquisition_time seconds."""
+
+        timeout = self.base + 1000 * self.margin * (n_bytes / self.throughput + acquisition_time)
+        if self.maximum is not None:
+            timeout = min(timeout, self.maximum)
+        return timeout
+
+    def update(self, n_bytes: int, duration: float):
+        """Updates the throughput with a transfer of n_bytes that lasted duration seconds.
+
+        Small transfers are ignored: their duration depends on the latency rather than on the throughput.
+        """
+
+        if n_bytes < TIMEOUT_MIN_SAMPLE or duration <= 0:
+            return
+        with self._lock:
+            self.throughput += self.smoothing * (n_bytes / duration - self.throughput)
@@ -0,0 +1,146 @@
+"""A trigger orchestrator for synchronized measurements with several tools.
+
+Relies on the threading module and on the VISA triggers.
+Participating tools are configured to wait for a bus trigger and armed in parallel,
+then triggered together and their data fetched concurrently.
+"""
+
+
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pyvisa as visa
+
+
+logger = logging.getLogger(__name__)
+
+TRIGGER_METHOD_ASSERT = "assert"    # VISA assert trigger: GPIB GET, VXI-11 device trigger (LAN) or USBTMC trigger
+TRIGGER_METHOD_COMMAND = "*TRG"     # IEEE 488.2 common trigger command
+TRIGGER_METHOD_GROUP = "group"      # One GPIB group execute trigger addressed to all tools at once
+TRIGGER_METHODS = (TRIGGER_METHOD_ASSERT, TRIGGER_METHOD_COMMAND, TRIGGER_METHOD_GROUP)
+
+
+class TriggerReport(object):
+    """Outcome of a group trigger.
+
+    Attributes:
+        method: A str giving the trigger method among TRIGGER_METHODS.
+        data: A dict associating each tool with the data fetched after the trigger.
+        trigger_times: A dict associating each tool with the time (time.perf_counter()) at which its trigger was issued.
+        latencies: A dict associating each tool with the duration of its trigger call in seconds.
+        skew: A float giving the time between the first and the last trigger issued, in seconds.
+    """
+
+    def __init__(self, method: str):
+        self.method = method
+        self.data = dict()
+        self.trigger_times = dict()
+        self.latencies = dict()
+        self.skew = 0.0
+
+    def __str__(self):
+        return "Group trigger ({}) of {} tool(s): skew = {:.3g} s, max latency = {:.3g} s".format(
+            self.method, len(self.trigger_times), self.skew, max(self.latencies.values(), default=0))
+
+
+def _run_parallel(function, tools: list, action: str) -> dict:
+    """Calls function(tool) for all tools in parallel threads and returns the results by tool.
+
+    Raises:
+        RuntimeError: The call failed for at least one tool.
+    """
+
+    with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+        futures = {tool: executor.submit(function, tool) for tool in tools}
+
+    results = dict()
+    failures = []
+    for tool, future in futures.items():
+        err = future.exception()
+        if err is not None:
+            logger.error("Cannot %s %s: %s", action, tool._info, err)
+            failures.append(str(tool._info))
+        else:
+            results[tool] = future.result()
+
+    if failures:
+        raise RuntimeError("Cannot {} the following tools: {}.".format(action, ", ".join(failures)))
+    return results
+
+
+def configure(tools: list, count: int = 1):
+    """Configures all tools in parallel to measure count times upon bus triggers."""
+
+    _run_parallel(lambda tool: tool.set_bus_trigger(count), tools, "configure the trigger of")
+
+def arm(tools: list):
+    """Arms all tools in parallel, so that they wait for the trigger."""
+
+    _run_parallel(lambda tool: tool.arm_trigger(), tools, "arm")
+
+def fetch(tools: list) -> dict:
+    """Fetches the triggered data of all tools in parallel; returns the data by tool."""
+
+    return _run_parallel(lambda tool: tool.fetch_triggered_data(), tools, "fetch data from")
+
+
+def default_method(tools: list) -> str:
+    """Returns TRIGGER_METHOD_GROUP if all tools share a GPIB board, TRIGGER_METHOD_ASSERT otherwise."""
+
+    interfaces = [tool._virtual_interface for tool in tools]
+    if all(getattr(interface, "interface_type", None) == visa.constants.InterfaceType.gpib for interface in interfaces) \
+            and len({interface.interface_number for interface in interfaces}) == 1:
+        return TRIGGER_METHOD_GROUP
+    return TRIGGER_METHOD_ASSERT
+
+def fire(tools: list, method: str, report: TriggerReport, board=None):
+    """Triggers all tools as simultaneously as possible and records the trigger times in report.
+
+    Args:
+        tools: The list of armed tools.
+        method: The trigger method among TRIGGER_METHODS.
+        report: The TriggerReport to fill.
+        board: The GPIB interface resource (GPIB<n>::INTFC) for TRIGGER_METHOD_GROUP.
+
+    Raises:
+        ValueError: The method is unknown or the board is missing.
+        RuntimeError: At least one tool could not be triggered.
+    """
+
+    if method == TRIGGER_METHOD_GROUP:
+        if board is None:
+            raise ValueError("A GPIB interface resource is required for a group execute trigger.")
+        start = time.perf_counter()
+        try:
+            board.group_execute_trigger(*[tool._virtual_interface for tool in tools])
+        except visa.VisaIOError as err:
+            raise RuntimeError("Cannot send the group execute trigger; origin comes from {}.".format(err.description))
+        latency = time.perf_counter() - start
+        for tool in tools:
+            report.trigger_times[tool] = start
+            report.latencies[tool] = latency
+
+    elif method in (TRIGGER_METHOD_ASSERT, TRIGGER_METHOD_COMMAND):
+        # All threads are started beforehand and released together by the barrier
+        barrier = threading.Barrier(len(tools))
+
+        def trigger(tool):
+            barrier.wait()
+            start = time.perf_counter()
+            if method == TRIGGER_METHOD_ASSERT:
+                tool.assert_trigger()
+            else:
+                tool.send(TRIGGER_METHOD_COMMAND)
+            return start, time.perf_counter() - start
+
+        for tool, (start, latency) in _run_parallel(trigger, tools, "trigger").items():
+            report.trigger_times[tool] = start
+            report.latencies[tool] = latency
+
+    else:
+        raise ValueError("The method argument must be in {}.".format(TRIGGER_METHODS))
+
+    report.skew = max(report.trigger_times.values()) - min(report.trigger_times.values())
@@ -13,13 +13,15 @@ RTB_BIN_DATA_HEADERS = ('ieee', 'empty', 'hp')
 
 RTB_BIN_DATA_TYPES_FLOAT = ('f', "float", "bin32")
 RTB_BIN_DATA_TYPES_DOUBLE = ('d', "double", "bin64")
+RTB_BIN_DATA_TYPES_INT8 = ('b', "signed char", "int8")
 RTB_BIN_DATA_TYPES_INT16 = ('h', "short", "int16")
 RTB_BIN_DATA_TYPES_INT32 = ('i', 'l', "int", "long", "int32")
 RTB_BIN_DATA_TYPES_INT64 = ('q', "long long", "int64")
+RTB_BIN_DATA_TYPES_UINT8 = ('B', "unsigned char", "uint8")
 RTB_BIN_DATA_TYPES_UINT16 = ('H', "unsigned short", "uint16")
 RTB_BIN_DATA_TYPES_UINT32 = ('I', 'L', "unsigned int", "unsigned long", "uint32")
 RTB_BIN_DATA_TYPES_UINT64 = ('Q', "unsigned long long", "uint64")
-RTB_BIN_DATA_TYPES = RTB_BIN_DATA_TYPES_FLOAT + RTB_BIN_DATA_TYPES_DOUBLE + RTB_BIN_DATA_TYPES_INT16 + RTB_BIN_DATA_TYPES_INT32 + RTB_BIN_DATA_TYPES_INT64 + RTB_BIN_DATA_TYPES_UINT16 + RTB_BIN_DATA_TYPES_UINT32 + RTB_BIN_DATA_TYPES_UINT64
+RTB_BIN_DATA_TYPES = RTB_BIN_DATA_TYPES_FLOAT + RTB_BIN_DATA_TYPES_DOUBLE + RTB_BIN_DATA_TYPES_INT8 + RTB_BIN_DATA_TYPES_INT16 + RTB_BIN_DATA_TYPES_INT32 + RTB_BIN_DATA_TYPES_INT64 + RTB_BIN_DATA_TYPES_UINT8 + RTB_BIN_DATA_TYPES_UINT16 + RTB_BIN_DATA_TYPES_UINT32 + RTB_BIN_DATA_TYPES_UINT64
 
 RTB_MSG_CR_TERMINATORS = ('\r', "CR", "carriage return")
 RTB_MSG_CRLF_TERMINATORS = ('\r\n', "CRLF")
@@ -40,3 +42,29 @@ RTB_TEXT_DATA_SEPARATORS = (',', ';', ' ')
 RTB_TRANSFERT_FORMAT_TEXT = ("text", "ascii")
 RTB_TRANSFERT_FORMAT_BIN = ("bin", "binary")
 RTB_TRANSFERT_FORMATS = RTB_TRANSFERT_FORMAT_TEXT + RTB_TRANSFERT_FORMAT_BIN
+
+
+# Lookup tables for the validation of the properties (constant-time membership and conversion)
+RTB_DATA_CONTAINERS_SET = frozenset(RTB_DATA_CONTAINERS)
+RTB_BIN_DATA_ENDIANNESSES_SET = frozenset(RTB_BIN_DATA_ENDIANNESSES)
+RTB_BIN_DATA_HEADERS_SET = frozenset(RTB_BIN_DATA_HEADERS)
+RTB_TEXT_DATA_SEPARATORS_SET = frozenset(RTB_TEXT_DATA_SEPARATORS)
+RTB_TRANSFERT_FORMATS_SET = frozenset(RTB_TRANSFERT_FORMATS)
+
+RTB_BIN_DATA_TYPE_CODES = {
+    alias: aliases[0]
+    for aliases in (RTB_BIN_DATA_TYPES_FLOAT, RTB_BIN_DATA_TYPES_DOUBLE, RTB_BIN_DATA_TYPES_INT8, RTB_BIN_DATA_TYPES_INT16, RTB_BIN_DATA_TYPES_INT32,
+                    RTB_BIN_DATA_TYPES_INT64, RTB_BIN_DATA_TYPES_UINT8, RTB_BIN_DATA_TYPES_UINT16, RTB_BIN_DATA_TYPES_UINT32, RTB_BIN_DATA_TYPES_UINT64)
+    for alias in aliases
+}
+RTB_MSG_TERMINATOR_CODES = {
+    alias: aliases[0]
+    for aliases in (RTB_MSG_CR_TERMINATORS, RTB_MSG_CRLF_TERMINATORS, RTB_MSG_LF_TERMINATORS)
+    for alias in aliases
+}
+RTB_TEXT_DATA_CONVERTER_CODES = {
+    alias: aliases[0]
+    for aliases in (RTB_TEXT_DATA_CONVERTERS_BIN, RTB_TEXT_DATA_CONVERTERS_OCT, RTB_TEXT_DATA_CONVERTERS_HEX, RTB_TEXT_DATA_CONVERTERS_DEC,
+                    RTB_TEXT_DATA_CONVERTERS_FIX, RTB_TEXT_DATA_CONVERTERS_EXP, RTB_TEXT_DATA_CONVERTERS_STR)
+    for alias in aliases
+}
@@ -5,6 +5,10 @@ rtestbench relies on PyVISA, NumPy and pandas.
 
 
 import logging
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import numpy as np
 import pandas as pd
 import pyvisa as visa
@@ -23,14 +27,77 @@ else:
     _HAS_FEATHER = True
 
 from rtestbench import constants
+from rtestbench import _backends
+from rtestbench import _block
 from rtestbench import _chat
+from rtestbench import _config
+from rtestbench import _discovery
+from rtestbench import _events
+from rtestbench import _pool
+from rtestbench import _scheduler
+from rtestbench import _scpi
+from rtestbench import _timeout
+from rtestbench import _trigger
 from rtestbench import _logger
 
 
+logger = logging.getLogger(__name__) # Child of the package logger configured by _logger.make_logger()
+
 ##########################
 # Generic tool interface #
 ##########################
 
+_INTERFACE_NAMES = {
+    None: None,
+    visa.constants.InterfaceType.gpib: "GPIB",
+    visa.constants.InterfaceType.vxi: "VXI, VME or MXI",
+    visa.constants.InterfaceType.gpib_vxi: "GPIB VXI",
+    visa.constants.InterfaceType.asrl: "Serial (RS-232 or RS-485)",
+    visa.constants.InterfaceType.pxi: "PXI",
+    visa.constants.InterfaceType.tcpip: "TCP/IP",
+    visa.constants.InterfaceType.usb: "USB",
+    visa.constants.InterfaceType.rio: "Rio",
+    visa.constants.InterfaceType.firewire: "Firewire",
+    visa.constants.InterfaceType.rsnrp: "Rohde & Schwarz Device via Passport",
+    visa.constants.InterfaceType.unknown: "Unknown",
+}
+
+
+def _lookup(table, key):
+    """Returns table[key] (or key in a frozenset), None if key is missing or unhashable."""
+
+    try:
+        if isinstance(table, frozenset):
+            return key if key in table else None
+        return table.get(key)
+    except TypeError:
+        return None
+
+
+# Common commands restoring a configuration, after which no memoized answer holds (see Tool.query_cached())
+TOOL_RESET_COMMANDS = ("*RST", "*RCL")
+
+def _is_reset(command: str) -> bool:
+    """Returns whether a command (possibly compound, e.g., '*RST;:TRIG:COUN 10') resets the configuration of the tool."""
+
+    command = command.upper()
+    return any(reset in command for reset in TOOL_RESET_COMMANDS)
+
+
+# Roots of the requests reading a measurement, whose answer is lost with the session: never sent again after a reconnection
+TOOL_UNRETRIED_REQUEST_ROOTS = _scpi.ScpiKeywords("READ", "FETCh", "MEASure")
+
+def _is_retriable(request: str) -> bool:
+    """Returns whether a request can be sent again after a reconnection (see TOOL_UNRETRIED_REQUEST_ROOTS)."""
+
+    for message in request.split(';'):
+        message = message.strip().upper()
+        root = message.lstrip(':').split(':', 1)[0].split('?', 1)[0].split(' ', 1)[0]
+        if root in TOOL_UNRETRIED_REQUEST_ROOTS or message.startswith("*OPC?"):
+            return False
+    return True
+
+
 class ToolInfo(object):
     """Gathers all information related to any Tool.
     
@@ -41,8 +108,19 @@ class ToolInfo(object):
         serial_number: A str giving the serial number of the tool.
         software_version: A str including the software version number of the tool.
         interface: A str describing the type of interface that connects the tool.
+        address: A str giving the VISA address of the tool.
     """
 
+    __slots__ = ("family", "manufacturer", "model", "serial_number", "software_version", "_interface", "address")
+
+    family: str
+    manufacturer: str
+    model: str
+    serial_number: str
+    software_version: str
+    _interface: str
+    address: str
+
     def __init__(self):
         self.family = None
         self.manufacturer = None
@@ -50,6 +128,7 @@ class ToolInfo(object):
         self.serial_number = None
         self.software_version = None
         self._interface = None
+        self.address = None
 
     def __str__(self):
         return "{} from {}, {} model (SN = {}), connected by {}".format(
@@ -62,57 +141,76 @@ class ToolInfo(object):
     
     @interface.setter
     def interface(self, interface_type: visa.constants.InterfaceType):
-        if interface_type is None:
-            self._interface = None
-        elif interface_type == visa.constants.InterfaceType.gpib:
-            self._interface = "GPIB"
-        elif interface_type == visa.constants.InterfaceType.vxi:
-            self._interface = "VXI, VME or MXI"
-        elif interface_type == visa.constants.InterfaceType.gpib_vxi:
-            self._interface = "GPIB VXI"
-        elif interface_type == visa.constants.InterfaceType.asrl:
-            self._interface = "Serial (RS-232 or RS-485)"
-        elif interface_type == visa.constants.InterfaceType.pxi:
-            self._interface = "PXI"
-        elif interface_type == visa.constants.InterfaceType.tcpip:
-            self._interface = "TCP/IP"
-        elif interface_type == visa.constants.InterfaceType.usb:
-            self._interface = "USB"
-        elif interface_type == visa.constants.InterfaceType.rio:
-            self._interface = "Rio"
-        elif interface_type == visa.constants.InterfaceType.firewire:
-            self._interface = "Firewire"
-        elif interface_type == visa.constants.InterfaceType.rsnrp:
-            self._interface = "Rohde & Schwarz Device via Passport"
-        elif interface_type == visa.constants.InterfaceType.unknown:
-            self._interface = "Unknown"
-        else:
+        try:
+            self._interface = _INTERFACE_NAMES[interface_type]
+        except (KeyError, TypeError):
             raise ResourceWarning("Unexpected interface type: {}.".format(interface_type))
 
 
 class ToolProperties(object):
     """Gathers all properties to configure any Tool.
+
+    The common properties are stored in slots; the properties specific to a driver must be declared
+    with update_properties() and are stored in a separate extension dict.
     
     Attributes:
         data_container: A container class to store the data retrieved from the tool (recommended: numpy.ndarray).
         transfer_format: A list representing the available transfer formats for communication between the tool and the computer.
         bin_data_header: A str for the optional header that is in front of binary data.
         bin_data_endianness: A str stating if binary data is big or little endian.
+        bin_data_chunk_size: An int giving the size in bytes of the chunks in which IEEE binary blocks are streamed
+            into the data container (see Tool.query_block()), or None to read each block at once.
         read_msg_terminator: A str describing the terminator for read messages.
         write_msg_terminator: A str describing the terminator for write messages.
         text_data_converter: A str that specifies the format in which the text (ASCII) data are received.
         text_data_separator: A character that specifies the separator used for text (ASCII) data.
         timeout: A float that expresses the timeout in milliseconds for all tool I/O operations.
         activated_transfer_format: A str specified the transfer format currently in use.
+        _extensions: A dict of the driver-specific properties, by name.
     """
 
+    __slots__ = (
+        "_data_container", "_transfer_formats",
+        "_bin_data_endianness", "_bin_data_header", "_bin_data_type", "_bin_data_chunk_size",
+        "_read_msg_terminator", "_write_msg_terminator",
+        "_text_data_converter", "_text_data_separator",
+        "_timeout", "_activated_transfer_format",
+        "_extensions"
+    )
+    _STATE_SLOTS = tuple(slot for slot in __slots__ if slot != "_extensions") # Copied by snapshot(), whatever the order of the slots
+    _PROPERTIES = (
+        "data_container", "transfer_formats",
+        "bin_data_endianness", "bin_data_header", "bin_data_type", "bin_data_chunk_size",
+        "read_msg_terminator", "write_msg_terminator",
+        "text_data_converter", "text_data_separator",
+        "timeout", "activated_transfer_format"
+    )
+    _ATTRIBUTES = frozenset(__slots__ + _PROPERTIES)
+
+    _data_container: type
+    _transfer_formats: list
+    _bin_data_endianness: str
+    _bin_data_header: str
+    _bin_data_type: str
+    _bin_data_chunk_size: int
+    _read_msg_terminator: str
+    _write_msg_terminator: str
+    _text_data_converter: str
+    _text_data_separator: str
+    _timeout: float
+    _activated_transfer_format: str
+    _extensions: dict
+
     def __init__(self):
+        self._extensions = dict()
+
         self._data_container = np.ndarray
         self._transfer_formats = []
 
         self._bin_data_endianness = "little"
         self._bin_data_header = "ieee"
         self._bin_data_type = 'f'
+        self._bin_data_chunk_size = None
 
         self._read_msg_terminator = '\n'
         self._write_msg_terminator = '\n'
@@ -123,6 +221,21 @@ class ToolProperties(object):
         self._timeout = 0
 
         self._activated_transfer_format = None
+
+    def __getattr__(self, name):
+        # Only called for the names that are not common properties
+        try:
+            return object.__getattribute__(self, "_extensions")[name]
+        except KeyError:
+            raise AttributeError("The property {} has not been declared (see update_properties()).".format(name))
+
+    def __setattr__(self, name, value):
+        if name in ToolProperties._ATTRIBUTES:
+            object.__setattr__(self, name, value)
+        elif name in self._extensions:
+            self._extensions[name] = value
+        else:
+            raise AttributeError("The property {} has not been declared (see update_properties()).".format(name))
     
 
     @property
@@ -131,7 +244,7 @@ class ToolProperties(object):
 
     @data_container.setter
     def data_container(self, class_name):
-        if class_name in constants.RTB_DATA_CONTAINERS:
+        if _lookup(constants.RTB_DATA_CONTAINERS_SET, class_name) is not None:
             self._data_container = class_name
         else:
             raise ValueError("The class_name argument must be in {}.".format(constants.RTB_DATA_CONTAINERS))
@@ -141,7 +254,7 @@ class ToolProperties(object):
         return self._transfer_formats
     @transfer_formats.setter
     def transfer_formats(self, formats: list):
-        if all(fmt in constants.RTB_TRANSFERT_FORMATS for fmt in formats):
+        if all(_lookup(constants.RTB_TRANSFERT_FORMATS_SET, fmt) is not None for fmt in formats):
             self._transfer_formats = formats
         else:
             raise ValueError("The formats argument must be a list containing at least one element among {}.".format(constants.RTB_TRANSFERT_FORMATS))
@@ -151,7 +264,7 @@ class ToolProperties(object):
         return self._bin_data_endianness
     @bin_data_endianness.setter
     def bin_data_endianness(self, endianness: str):
-        if endianness in constants.RTB_BIN_DATA_ENDIANNESSES:
+        if _lookup(constants.RTB_BIN_DATA_ENDIANNESSES_SET, endianness) is not None:
             self._bin_data_endianness = endianness
         else:
             raise ValueError("The order argument must be in {}.".format(constants.RTB_BIN_DATA_ENDIANNESSES))
@@ -161,7 +274,7 @@ class ToolProperties(object):
         return self._bin_data_header
     @bin_data_header.setter
     def bin_data_header(self, header_format):
-        if header_format in constants.RTB_BIN_DATA_HEADERS:
+        if _lookup(constants.RTB_BIN_DATA_HEADERS_SET, header_format) is not None:
             self._bin_data_header = header_format
         else:
             raise ValueError("The header_format argument must be in {}.".format(constants.RTB_BIN_DATA_HEADERS))
@@ -171,34 +284,26 @@ class ToolProperties(object):
         return self._bin_data_type
     @bin_data_type.setter
     def bin_data_type(self, datatype):
-        if datatype in constants.RTB_BIN_DATA_TYPES_FLOAT:
-            self._bin_data_type = 'f'
-        elif datatype in constants.RTB_BIN_DATA_TYPES_DOUBLE:
-            self._bin_data_type = 'd'
-        elif datatype in constants.RTB_BIN_DATA_TYPES_INT16:
-            self._bin_data_type = 'h'
-        elif datatype in constants.RTB_BIN_DATA_TYPES_INT32:
-            self._bin_data_type = 'i'
-        elif datatype in constants.RTB_BIN_DATA_TYPES_INT64:
-            self._bin_data_type = 'q'
-        elif datatype in constants.RTB_BIN_DATA_TYPES_UINT16:
-            self._bin_data_type = 'H'
-        elif datatype in constants.RTB_BIN_DATA_TYPES_UINT32:
-            self._bin_data_type = 'I'
-        elif datatype in constants.RTB_BIN_DATA_TYPES_UINT64:
-            self._bin_data_type = 'Q'
-        else:
+        code = _lookup(constants.RTB_BIN_DATA_TYPE_CODES, datatype)
+        if code is None:
             raise ValueError("The datatype argument must be in {}.".format(constants.RTB_BIN_DATA_TYPES))
+        self._bin_data_type = code
 
-    def parse_msg_terminator(self, msg_terminator: str) -> str:
-        if msg_terminator in constants.RTB_MSG_CR_TERMINATORS:
-            return '\r'
-        elif msg_terminator in constants.RTB_MSG_CRLF_TERMINATORS:
-            return '\r\n'
-        elif msg_terminator in constants.RTB_MSG_LF_TERMINATORS:
-            return '\n'
+    @property
+    def bin_data_chunk_size(self):
+        return self._bin_data_chunk_size
+    @bin_data_chunk_size.setter
+    def bin_data_chunk_size(self, chunk_size):
+        if chunk_size is None or (isinstance(chunk_size, int) and chunk_size > 0):
+            self._bin_data_chunk_size = chunk_size
         else:
+            raise ValueError("The chunk_size argument must be a positive int or None.")
+
+    def parse_msg_terminator(self, msg_terminator: str) -> str:
+        code = _lookup(constants.RTB_MSG_TERMINATOR_CODES, msg_terminator)
+        if code is None:
             raise ValueError("The msg_terminator argument must be in {}.".format(constants.RTB_MSG_TERMINATORS))
+        return code
 
     @property
     def read_msg_terminator(self):
@@ -219,29 +324,17 @@ class ToolProperties(object):
         return self._text_data_converter
     @text_data_converter.setter
     def text_data_converter(self, converter):
-        if converter in constants.RTB_TEXT_DATA_CONVERTERS_BIN:
-            self._text_data_converter = 'b'
-        elif converter in constants.RTB_TEXT_DATA_CONVERTERS_OCT:
-            self._text_data_converter = 'o'
-        elif converter in constants.RTB_TEXT_DATA_CONVERTERS_HEX:
-            self._text_data_converter = 'x'
-        elif converter in constants.RTB_TEXT_DATA_CONVERTERS_DEC:
-            self._text_data_converter = 'd'
-        elif converter in constants.RTB_TEXT_DATA_CONVERTERS_FIX:
-            self._text_data_converter = 'f'
-        elif converter in constants.RTB_TEXT_DATA_CONVERTERS_EXP:
-            self._text_data_converter = 'e'
-        elif converter in constants.RTB_TEXT_DATA_CONVERTERS_STR:
-            self._text_data_converter = 's'
-        else:
+        code = _lookup(constants.RTB_TEXT_DATA_CONVERTER_CODES, converter)
+        if code is None:
             raise ValueError("The converter argument must be in {}.".format(constants.RTB_TEXT_DATA_CONVERTERS))
+        self._text_data_converter = code
 
     @property
     def text_data_separator(self):
         return self._text_data_separator
     @text_data_separator.setter
     def text_data_separator(self, sep):
-        if sep in constants.RTB_TEXT_DATA_SEPARATORS:
+        if _lookup(constants.RTB_TEXT_DATA_SEPARATORS_SET, sep) is not None:
             self._text_data_separator = sep
         else:
             raise ValueError("The sep argument must be in {}.".format(constants.RTB_TEXT_DATA_SEPARATORS))
@@ -270,15 +363,61 @@ class ToolProperties(object):
 
 
     def get_properties(self) -> dict:
-        return self.__dict__
+        """Returns the common and driver-specific properties, by name."""
+
+        properties = {name: getattr(self, name) for name in ToolProperties._PROPERTIES}
+        properties.update(self._extensions)
+        return properties
 
     def update_properties(self, **properties):
-        """Updates passed properties."""
+        """Declares or updates driver-specific properties (common properties are validated by their setters)."""
 
         for k, v in properties.items():
-            setattr(self, str(k), v)
+            if str(k) in ToolProperties._ATTRIBUTES:
+                setattr(self, str(k), v)
+            else:
+                self._extensions[str(k)] = v
+
+    def snapshot(self) -> tuple:
+        """Returns a copy of the state of all properties, to be restored with restore()."""
+
+        return tuple(object.__getattribute__(self, name) for name in ToolProperties._STATE_SLOTS) + (dict(self._extensions),)
+
+    def restore(self, snapshot: tuple):
+        """Restores the state of all properties returned by snapshot()."""
+
+        for name, value in zip(ToolProperties._STATE_SLOTS, snapshot):
+            object.__setattr__(self, name, value)
+        self._extensions = dict(snapshot[-1])
     
 
+class _CommandRecorder(object):
+    """Virtual interface that records the written commands instead of sending them (see Tool.record_commands()).
+
+    Attributes:
+        commands: A list of the recorded commands.
+        _interface: The actual virtual interface of the tool (or None), used for other attributes.
+    """
+
+    def __init__(self, interface):
+        self.commands = []
+        self._interface = interface
+
+    def __getattr__(self, name):
+        if self._interface is None:
+            raise AttributeError("No virtual interface to get the attribute {} from.".format(name))
+        return getattr(self._interface, name)
+
+    def write(self, command: str):
+        self.commands.append(command)
+
+    def query(self, request: str):
+        raise IOError("Cannot record the request {}: only commands without answer can be recorded.".format(request))
+
+    def write_raw(self, message: bytes):
+        raise IOError("Cannot record a binary message: only text commands can be recorded.")
+
+
 class Tool(object):
     """Generic class that defines the features common to all electronic tools.
     
@@ -288,12 +427,30 @@ class Tool(object):
         _info: A ToolInfo object including family, manufacturer, model and serial number.
         _properties: A ToolProperties object for configuration.
         _virtual_interface: An object that represents the virtual software interface which allows to communicate with the tool.
+        _subscribers: A list of callables notified with the data returned by query_data().
+        _event_log: An EventLog recording every transaction with the tool (see the _events module), or None.
+        _event_tool: An int giving the index of the tool description in the string table of the event log.
+        _reconnect_handler: A callable taking the address of the tool and returning a new session, or None to never reconnect.
+        _replay_messages: A list of the SCPI messages that configured the tool, sent again after a reconnection.
+        _adaptive_timeout: An AdaptiveTimeout computing the timeout of each operation, or None to keep a static timeout.
+        _query_cache: A dict associating the requests with stable answers (e.g., '*IDN?') with their memoized answer.
+        _volatile_query_cache: A dict of memoized answers forgotten as soon as a command is sent (e.g., the number of data).
     """
 
+    COALESCED_GETTERS = frozenset() # Names of the getters without side effect whose identical pending calls can share one transaction (see the _scheduler module)
+
     def __init__(self, info: ToolInfo):
         self._info = info
         self._properties = ToolProperties()
         self._virtual_interface = None
+        self._subscribers = []
+        self._event_log = None
+        self._event_tool = None
+        self._reconnect_handler = None
+        self._replay_messages = []
+        self._adaptive_timeout = None
+        self._query_cache = dict()
+        self._volatile_query_cache = dict()
 
 
     # Virtual interface management
@@ -321,15 +478,146 @@ class Tool(object):
         else:
             raise RuntimeError("A virtual interface has already been attached to the tool {}.".format(self._info))
     
-    def disconnect_virtual_interface(self):
+    def disconnect_virtual_interface(self, close: bool = True):
         """Disconnects the current virtual interface from the Tool object.
+
+        Args:
+            close: If False, the session is left open (e.g., in a pool of sessions).
         """
 
         if self._virtual_interface is not None:
-            self._virtual_interface.close()
+            if close:
+                self._virtual_interface.close()
             self._virtual_interface = None
+
+    def set_reconnect_handler(self, handler):
+        """Reconnects the tool automatically when its session is lost (None disables the reconnection).
+
+        Args:
+            handler: A callable taking the address of the tool and returning a new session (e.g., SessionPool.reopen).
+        """
+
+        self._reconnect_handler = handler
+
+    def set_replay_messages(self, messages: list):
+        """Caches the SCPI messages that configured the tool, to send them again after a reconnection.
+
+        Only these messages are replayed (e.g., the configuration of RTestBenchManager.load_config()):
+        the settings changed afterwards by calling the setters directly are not, and must be set again after a reconnection.
+        """
+
+        self._replay_messages = list(messages)
+
+    def reconnect(self):
+        """Replaces a lost session by a new one, checks the identity of the tool and replays its configuration.
+
+        Raises:
+            UnboundLocalError: No reconnect handler is set.
+            IOError: The tool cannot be reached, or another tool answers at its address.
+        """
+
+        if self._reconnect_handler is None:
+            raise UnboundLocalError("No reconnect handler is set for the tool {}.".format(self._info))
+
+        session = self._reconnect_handler(self._info.address) # The lost session is kept if the tool cannot be reached
+        timeout = getattr(self._virtual_interface, "timeout", None)
+        self._virtual_interface = None
+        self.connect_virtual_interface(session)
+        try:
+            if timeout is not None:
+                self._virtual_interface.timeout = timeout
+
+            full_id = self._virtual_interface.query('*IDN?')
+            if [field.strip() for field in full_id.split(",")[1:3]] != [self._info.model, self._info.serial_number]:
+                raise IOError("Another tool answers @ {}: {}".format(self._info.address, full_id))
+
+            for message in self._replay_messages:
+                self._virtual_interface.write(message)
+        except (visa.InvalidSession, visa.VisaIOError) as err:
+            raise IOError("Cannot reconnect the tool {}; origin comes from {}.".format(self._info, err))
+        self.clear_query_cache()
+        logger.info("The tool %s has been reconnected.", self._info)
+
+    def _transact(self, method: str, *args, retry: bool = True, **kwargs):
+        """Calls a method of the virtual interface; a lost session is reconnected and the call retried once.
+
+        Args:
+            retry: If False, the call is not retried after the reconnection and the error is raised,
+                e.g., for the requests whose answer is lost with the session (':FETCh?', ':READ?').
+        """
+
+        try:
+            return getattr(self._virtual_interface, method)(*args, **kwargs)
+        except (visa.InvalidSession, visa.VisaIOError) as err:
+            if self._reconnect_handler is None or not _pool.is_connection_error(err):
+                raise
+            logger.warning("The session with %s is lost (%s): reconnecting...", self._info, err)
+            self.reconnect()
+            if not retry:
+                raise
+        return getattr(self._virtual_interface, method)(*args, **kwargs)
+
+    @contextmanager
+    def record_commands(self):
+        """Records the commands sent by the tool instead of sending them (dry run).
+
+        The properties are restored if an error interrupts the recording.
+
+        Yields:
+            The list in which the commands are recorded, e.g., to batch them (see the _config module).
+        Raises:
+            IOError: A request expecting an answer is made while recording.
+        """
+
+        interface, event_log = self._virtual_interface, self._event_log
+        snapshot = self._properties.snapshot()
+        recorder = _CommandRecorder(interface)
+        self._virtual_interface, self._event_log = recorder, None # Nothing is actually sent
+        try:
+            yield recorder.commands
+        except BaseException:
+            self._properties.restore(snapshot) # The properties changed by the failed commands are not applied
+            raise
+        finally:
+            self._virtual_interface, self._event_log = interface, event_log
+
+    def set_event_log(self, event_log):
+        """Records every transaction with the tool in an EventLog (None stops recording)."""
+
+        self._event_log = event_log
+        if event_log is not None:
+            self._event_tool = event_log.intern(str(self._info))
     
 
+    def _update_throughput(self, n_bytes: int, transfer_start: float, acquisition_time: float):
+        """Updates the adaptive timeout with a transfer of n_bytes that started at transfer_start (time.time()) and ends now.
+
+        The transfer may have waited for the acquisition: its expected duration is subtracted only if the transfer lasted longer,
+        otherwise the acquisition was already over.
+        """
+
+        duration = time.time() - transfer_start
+        if duration > acquisition_time:
+            duration -= acquisition_time
+        self._adaptive_timeout.update(n_bytes, duration)
+
+    @contextmanager
+    def _operation_timeout(self, n_bytes: int = 0, acquisition_time: float = 0.0):
+        """Sets the adaptive timeout of an operation (if enabled), then restores the static timeout."""
+
+        if self._adaptive_timeout is None:
+            yield
+            return
+
+        previous = self._virtual_interface.timeout
+        self._virtual_interface.timeout = self._adaptive_timeout.estimate(n_bytes, acquisition_time)
+        try:
+            yield
+        finally:
+            if self._virtual_interface is not None: # The session may have been replaced by a reconnection
+                self._virtual_interface.timeout = previous
+
+
     # Generic commands
     def send(self, command: str) -> int:
         """Sends an SCPI command which does not expect any return from the tool (e.g., '*RST').
@@ -344,16 +632,71 @@ class Tool(object):
         if self._virtual_interface is None:
             raise UnboundLocalError("No virtual interface connected to the tool {}.".format(self._info))
         else:
+            if _is_reset(command):
+                self.clear_query_cache()
+            elif self._volatile_query_cache:
+                self._volatile_query_cache.clear() # The command may change the answers (e.g., :INITiate)
+            status = _events.EVENT_STATUS_ERROR
+            start = time.time()
             try:
-                self._virtual_interface.write(command)
+                with self._operation_timeout(len(command)):
+                    self._transact("write", command)
+                status = _events.EVENT_STATUS_OK
+                if logger.isEnabledFor(logging.DEBUG): # Per transaction: no record is built when debug logs are off
+                    logger.debug("%s received the command %s.", self._info, command)
             except visa.InvalidSession as err:
                 raise RuntimeError("Cannot send the command {}; {}".format(command, err))
             except visa.VisaIOError as err:
                 raise IOError("Cannot send the command {}; origin comes from {}.".format(command, err.description))
+            finally:
+                if self._event_log is not None:
+                    self._event_log.record(self._event_tool, _events.EVENT_SEND, command, len(command), start, status)
     
+    def send_block(self, command: str, values) -> int:
+        """Sends an SCPI command followed by values in an IEEE binary block (e.g., ':LIST:VOLTage #18<8 bytes>').
+
+        The values are converted into the binary data type and endianness of the tool, straight from the memory of the array.
+
+        Returns:
+            An int given the number of bytes sent to the tool.
+        Raises:
+            UnboundLocalError: No virtual interface is connected to the tool to send a command.
+            IOError: An error occured while sending the command.
+            ValueError: The values are too many for a definite block.
+        """
+
+        if self._virtual_interface is None:
+            raise UnboundLocalError("No virtual interface connected to the tool {}.".format(self._info))
+        else:
+            if _is_reset(command):
+                self.clear_query_cache()
+            elif self._volatile_query_cache:
+                self._volatile_query_cache.clear()
+            dtype = ('>' if self._properties.bin_data_endianness == "big" else '<') + self._properties.bin_data_type
+            message = "{} ".format(command).encode() + _block.encode_block(values, dtype) + (self._properties.write_msg_terminator or '').encode()
+            status = _events.EVENT_STATUS_ERROR
+            start = time.time()
+            try:
+                with self._operation_timeout(len(message)):
+                    self._transact("write_raw", message)
+                status = _events.EVENT_STATUS_OK
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("%s received the command %s with %s bytes.", self._info, command, len(message))
+                return len(message)
+            except visa.InvalidSession as err:
+                raise RuntimeError("Cannot send the command {}; {}".format(command, err))
+            except visa.VisaIOError as err:
+                raise IOError("Cannot send the command {}; origin comes from {}.".format(command, err.description))
+            finally:
+                if self._event_log is not None:
+                    self._event_log.record(self._event_tool, _events.EVENT_SEND, command, len(message), start, status)
+
     def query(self, request: str) -> str:
         """Sends an SCPI request which expects an answer from the tool (e.g., '*IDN?').
-        
+
+        If the session is lost, the request is sent again after the reconnection, unless it reads a measurement
+        (see TOOL_UNRETRIED_REQUEST_ROOTS) or waits for an operation ('*OPC?'), which are lost with the session.
+
         Returns:
             An str embedding the tool's answer.
         Raises:
@@ -361,16 +704,92 @@ class Tool(object):
             IOError: An error occured because no answer was received from the tool.
         """
 
+        return self._query(request)
+
+    def _query(self, request: str, acquisition_time: float = 0.0) -> str:
+        """Sends an SCPI request (see query()) whose answer may wait for an operation of acquisition_time seconds."""
+
         if self._virtual_interface is None:
             raise UnboundLocalError("No virtual interface connected to the tool {}.".format(self._info))
         else:
+            status, n_bytes = _events.EVENT_STATUS_ERROR, 0
+            start = time.time()
             try:
-                return self._virtual_interface.query(request)
+                with self._operation_timeout(len(request), acquisition_time):
+                    answer = self._transact("query", request, retry=_is_retriable(request))
+                status, n_bytes = _events.EVENT_STATUS_OK, len(answer)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("%s answered %s to the request %s.", self._info, answer, request)
+                return answer
             except visa.InvalidSession as err:
                 raise RuntimeError("Cannot get an answer from the request {}; {}".format(request, err))
             except visa.VisaIOError as err:
                 raise IOError("Cannot get an answer from the request {}; origin comes from {}.".format(request, err.description))
+            finally:
+                if self._event_log is not None:
+                    self._event_log.record(self._event_tool, _events.EVENT_QUERY, request, n_bytes, start, status)
     
+    def query_cached(self, request: str, volatile: bool = False) -> str:
+        """Sends an SCPI request once and memoizes its answer (e.g., '*IDN?', '*OPT?').
+
+        Memoized answers are forgotten by clear_query_cache(), a reconnection and any command
+        restoring the configuration (see TOOL_RESET_COMMANDS), whether sent by reset(), send() or a configuration batch.
+
+        Args:
+            volatile: If True, the answer is also forgotten as soon as a command is sent (e.g., the number of data of a measurement).
+        Raises:
+            UnboundLocalError: No virtual interface is connected to the tool to send a command.
+            IOError: An error occured because no answer was received from the tool.
+        """
+
+        cache = self._volatile_query_cache if volatile else self._query_cache
+        try:
+            return cache[request]
+        except KeyError:
+            answer = cache[request] = self.query(request)
+            return answer
+
+    def clear_query_cache(self):
+        """Forgets all memoized answers (see query_cached())."""
+
+        self._query_cache.clear()
+        self._volatile_query_cache.clear()
+
+    def _query_decoded(self, request: str, decode, cached: bool):
+        answer = self.query_cached(request) if cached else self.query(request)
+        try:
+            return decode(answer)
+        except ValueError as err:
+            raise ValueError("Unexpected answer to the request {} from the tool {}; {}".format(request, self._info, err))
+
+    def query_int(self, request: str, cached: bool = False) -> int:
+        """Sends an SCPI request whose answer is an integer (e.g., ':TRIGger:COUNt?').
+
+        Args:
+            cached: If True, the answer is memoized (see query_cached()).
+        Raises:
+            UnboundLocalError: No virtual interface is connected to the tool to send a command.
+            IOError: An error occured because no answer was received from the tool.
+            ValueError: The answer is not an integer.
+        """
+
+        return self._query_decoded(request, _scpi.decode_int, cached)
+
+    def query_float(self, request: str, cached: bool = False) -> float:
+        """Sends an SCPI request whose answer is a number (e.g., ':SENSe:CURRent:RANGe?'); see query_int()."""
+
+        return self._query_decoded(request, float, cached)
+
+    def query_bool(self, request: str, cached: bool = False) -> bool:
+        """Sends an SCPI request whose answer is a boolean ('1', '0', 'ON' or 'OFF'); see query_int()."""
+
+        return self._query_decoded(request, _scpi.decode_bool, cached)
+
+    def query_keyword(self, request: str, vocabulary, cached: bool = False) -> str:
+        """Sends an SCPI request whose answer is a keyword of vocabulary (a ScpiKeywords), returned as declared (e.g., 'CURRent' for 'CURR'); see query_int()."""
+
+        return self._query_decoded(request, _scpi.decode_keyword(vocabulary), cached)
+
     def query_number_data(self):
         """Queries the number of data available in the buffer.
         
@@ -378,6 +797,13 @@ class Tool(object):
         
         raise NotImplementedError("This function must be implemented by daughter classes.")
 
+    def expected_acquisition_time(self) -> float:
+        """Returns the time in seconds the tool needs to acquire the data before answering query_data().
+
+        This function can be implemented by daughter classes to adapt the timeout of query_data() (see enable_adaptive_timeout())."""
+
+        return 0.0
+
     def query_data(self, request, number_data="auto"):
         """Sends an SCPI request which expects data from the tool.
         
@@ -395,37 +821,169 @@ class Tool(object):
             if transfer_format is None:
                 raise UnboundLocalError("No transfer format is activated for the tool {}.".format(self._info))
             else:
+                status, n_bytes = _events.EVENT_STATUS_ERROR, 0
+                acquisition_time = 0.0
+                start = time.time()
                 try:
+                    if self._adaptive_timeout is not None:
+                        acquisition_time = self.expected_acquisition_time()
                     if transfer_format in ("text", "ascii"):
-                        return self._virtual_interface.query_ascii_values(
-                            request,
-                            converter=self._properties.text_data_converter,
-                            separator=self._properties.text_data_separator,
-                            container=self._properties.data_container
-                        )
-                    elif transfer_format in ("bin", "binary"):
-                        if number_data == "auto":
-                            number_data = int(self.query_number_data())
-                        else:
-                            return self._virtual_interface.query_binary_values(
+                        expected_bytes = number_data * _timeout.TIMEOUT_TEXT_VALUE_SIZE if isinstance(number_data, int) else 0
+                        with self._operation_timeout(expected_bytes, acquisition_time):
+                            transfer_start = time.time()
+                            data = self._transact(
+                                "query_ascii_values",
                                 request,
-                                datatype=self._properties.bin_data_type,
-                                is_big_endian=True if self._properties.bin_data_endianness == "big" else False,
-                                container=self._properties.data_container,
-                                header_fmt=self._properties.bin_data_header,
-                                data_points=number_data
+                                retry=False, # The data are lost with the session
+                                converter=self._properties.text_data_converter,
+                                separator=self._properties.text_data_separator,
+                                container=self._properties.data_container
                             )
+                    elif transfer_format in ("bin", "binary"):
+                        chunked = self._properties.bin_data_chunk_size is not None and self._properties.bin_data_header == "ieee"
+                        if number_data == "auto" and not chunked: # A chunked block is sized from its header instead
+                            number_data = int(self.query_number_data())
+                        expected_bytes = number_data * struct.calcsize(self._properties.bin_data_type) if isinstance(number_data, int) else 0
+                        with self._operation_timeout(expected_bytes, acquisition_time):
+                            transfer_start = time.time()
+                            if chunked:
+                                self._transact("write", request, retry=False)
+                                data = self._read_block()
+                                if self._properties.data_container is not np.ndarray:
+                                    data = self._properties.data_container(data.tolist())
+                            else:
+                                data = self._transact(
+                                    "query_binary_values",
+                                    request,
+                                    retry=False,
+                                    datatype=self._properties.bin_data_type,
+                                    is_big_endian=True if self._properties.bin_data_endianness == "big" else False,
+                                    container=self._properties.data_container,
+                                    header_fmt=self._properties.bin_data_header,
+                                    data_points=number_data
+                                )
                     else:
                         raise NotImplementedError("Unsupported transfer format {} is currently activated.".format(transfer_format))
+                    value_size = struct.calcsize(self._properties.bin_data_type) if transfer_format in ("bin", "binary") else _timeout.TIMEOUT_TEXT_VALUE_SIZE
+                    status, n_bytes = _events.EVENT_STATUS_OK, len(data) * value_size # Size of the transfer, whatever the container
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("%s sent %s bytes of data to the request %s.", self._info, n_bytes, request)
                 except visa.InvalidSession as err:
                     raise RuntimeError("Cannot get an answer from the request {}; {}".format(request, err))
                 except visa.VisaIOError as err:
                     raise IOError("Cannot get an answer from the request {}; origin comes from {}.".format(request, err.description))
+                else:
+                    if self._adaptive_timeout is not None:
+                        self._update_throughput(n_bytes, transfer_start, acquisition_time)
+                    self._notify_subscribers(data)
+                    return data
+                finally:
+                    if self._event_log is not None:
+                        self._event_log.record(self._event_tool, _events.EVENT_QUERY_DATA, request, n_bytes, start, status)
+
+
+    def _read_block(self, out: np.ndarray = None, stream=None) -> np.ndarray:
+        """Reads an IEEE binary block chunk by chunk into an array (see the _block module).
+
+        With an adaptive timeout, the timeout of the payload is sized from the length given by the block header.
+        """
+
+        interface = self._virtual_interface
+        adaptive_timeout = self._adaptive_timeout
+        max_count = visa.constants.StatusCode.success_max_count_read
+
+        def read(size):
+            chunk, status = interface.visalib.read(interface.session, size)
+            return chunk, status != max_count
+
+        def size_timeout(n_bytes):
+            if n_bytes is not None: # The acquisition is over once the header has arrived
+                interface.timeout = adaptive_timeout.estimate(n_bytes)
+
+        dtype = np.dtype(('>' if self._properties.bin_data_endianness == "big" else '<') + self._properties.bin_data_type)
+        reader = _block.BlockReader(read, self._properties.bin_data_chunk_size or _block.BLOCK_CHUNK_SIZE)
+        read_termination = interface.read_termination
+        interface.read_termination = None # The payload may include the termination character
+        try:
+            with interface.ignore_warning(visa.constants.VI_SUCCESS_DEV_NPRESENT, visa.constants.VI_SUCCESS_MAX_CNT):
+                return reader.read_block(dtype, out, stream, size_timeout if adaptive_timeout is not None else None)
+        finally:
+            interface.read_termination = read_termination
+
+    def query_block(self, request: str, out: np.ndarray = None, stream=None) -> np.ndarray:
+        """Sends an SCPI request answered by an IEEE binary block ('#<n><length>' or '#0'), streamed into an array.
+
+        The payload is read in chunks of bin_data_chunk_size bytes directly into the memory of the array,
+        so a large block is never held twice in memory.
+
+        Args:
+            out: A contiguous array receiving the values (allocated if None), e.g., to reuse a buffer between acquisitions.
+            stream: A binary file object receiving a copy of the payload as it arrives, or None.
+        Returns:
+            A NumPy array of the values (a view of out if given).
+        Raises:
+            UnboundLocalError: No virtual interface is connected to the tool to send a command.
+            IOError: An error occured because no answer or a malformed block was received from the tool.
+            ValueError: out cannot hold the values.
+        """
+
+        if self._virtual_interface is None:
+            raise UnboundLocalError("No virtual interface connected to the tool {}.".format(self._info))
+        else:
+            status, n_bytes = _events.EVENT_STATUS_ERROR, 0
+            acquisition_time = 0.0
+            start = time.time()
+            try:
+                if self._adaptive_timeout is not None:
+                    acquisition_time = self.expected_acquisition_time()
+                with self._operation_timeout(out.nbytes if out is not None else 0, acquisition_time):
+                    transfer_start = time.time()
+                    self._transact("write", request, retry=False)
+                    data = self._read_block(out, stream)
+                status, n_bytes = _events.EVENT_STATUS_OK, data.nbytes
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("%s sent %s bytes of data to the request %s.", self._info, n_bytes, request)
+            except visa.InvalidSession as err:
+                raise RuntimeError("Cannot get an answer from the request {}; {}".format(request, err))
+            except visa.VisaIOError as err:
+                raise IOError("Cannot get an answer from the request {}; origin comes from {}.".format(request, err.description))
+            else:
+                if self._adaptive_timeout is not None:
+                    self._update_throughput(n_bytes, transfer_start, acquisition_time)
+                self._notify_subscribers(data)
+                return data
+            finally:
+                if self._event_log is not None:
+                    self._event_log.record(self._event_tool, _events.EVENT_QUERY_DATA, request, n_bytes, start, status)
+
+
+    # Acquisition stream
+    def subscribe(self, callback):
+        """Registers a callable that receives every container of data returned by query_data().
+
+        The callback runs on the acquisition thread, so it must return quickly (e.g., copy into a buffer).
+        """
+
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        """Removes a callable registered with subscribe()."""
+
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def _notify_subscribers(self, data):
+        for callback in self._subscribers:
+            try:
+                callback(data)
+            except Exception as err:
+                logger.warning("A subscriber of %s failed: %s", self._info, err)
 
 
     # Common SCPI commands
     def set_timeout(self, time_ms):
-        """Sets the timeout in milliseconds for all IO operations."""
+        """Sets the timeout in milliseconds for all IO operations (used when no adaptive timeout is enabled)."""
 
         current_timeout = self._virtual_interface.timeout
         try:
@@ -436,12 +994,52 @@ class Tool(object):
             raise
 
 
+    def enable_adaptive_timeout(self, **kwargs):
+        """Computes the timeout of each operation from its expected payload, the measured throughput and the acquisition time.
+
+        Args:
+            kwargs: The parameters of the AdaptiveTimeout (base, margin, maximum, throughput, smoothing).
+
+        Raises:
+            ValueError: A parameter is invalid.
+        """
+
+        self._adaptive_timeout = _timeout.AdaptiveTimeout(**kwargs)
+
+    def disable_adaptive_timeout(self):
+        """Uses the static timeout (see set_timeout()) for all operations again."""
+
+        self._adaptive_timeout = None
+
+
     def set_data_transfer_format(self, tsf_format: str, data_type: str):
         """Sets the data transfer format of the tool."""
 
         raise NotImplementedError("This function must be implemented by daughter classes.")
 
 
+    def wait_operations(self, duration: float = 0.0):
+        """Waits for the tool to complete its pending operations ('*OPC?'), which last about duration seconds.
+
+        The timeout of the wait, static or adaptive, is extended by duration.
+
+        Raises:
+            UnboundLocalError: No virtual interface is connected to the tool to send a command.
+            IOError: The operations did not complete before the timeout.
+        """
+
+        if self._virtual_interface is None or self._adaptive_timeout is not None or duration <= 0:
+            self._query("*OPC?", duration)
+            return
+
+        previous = self._virtual_interface.timeout
+        self._virtual_interface.timeout = previous + 1000 * duration
+        try:
+            self._query("*OPC?")
+        finally:
+            if self._virtual_interface is not None: # The session may have been replaced by a reconnection
+                self._virtual_interface.timeout = previous
+
     def clear_status(self):
         """Sends a command to clear the status registers."""
 
@@ -450,7 +1048,7 @@ class Tool(object):
     def reset(self):
         """Sends a command to reset the configuration."""
 
-        self.send("*RST")
+        self.send("*RST") # Also forgets the memoized answers
 
 
     def lock(self):
@@ -464,6 +1062,39 @@ class Tool(object):
         raise NotImplementedError("This function must be implemented by daughter classes.")
 
 
+    # Bus trigger interface
+    def set_bus_trigger(self, count: int = 1):
+        """Configures the tool to measure count times upon bus triggers (*TRG, GPIB GET or VISA assert trigger)."""
+
+        raise NotImplementedError("This function must be implemented by daughter classes.")
+
+    def arm_trigger(self):
+        """Initiates a measurement that waits for the bus trigger."""
+
+        raise NotImplementedError("This function must be implemented by daughter classes.")
+
+    def fetch_triggered_data(self):
+        """Returns the data measured upon the bus trigger."""
+
+        raise NotImplementedError("This function must be implemented by daughter classes.")
+
+    def assert_trigger(self):
+        """Sends a software trigger through the VISA session (GPIB GET, VXI-11 device trigger or USBTMC trigger).
+
+        Raises:
+            UnboundLocalError: No virtual interface is connected to the tool.
+            IOError: An error occured while sending the trigger.
+        """
+
+        if self._virtual_interface is None:
+            raise UnboundLocalError("No virtual interface connected to the tool {}.".format(self._info))
+        else:
+            try:
+                self._virtual_interface.assert_trigger()
+            except visa.VisaIOError as err:
+                raise IOError("Cannot assert the trigger; origin comes from {}.".format(err.description))
+
+
 
 ###########
 # Factory #
@@ -491,14 +1122,15 @@ class ToolFactory(object):
             tool_info = self._parse_tool_id(tool_id)
         except (AttributeError, ValueError, IOError):
             raise
+        tool_info.address = address
 
         try:
             new_tool = self._build_specific_tool(tool_info)
-            logging.info("A specific/dedicated tool interface has been created for {}.".format(new_tool._info))
+            logger.info("A specific/dedicated tool interface has been created for %s.", new_tool._info)
         except (NotImplementedError, ValueError) as err_msg:
-            logging.warning("No specific/dedicated tool interface is available for the following reason: {}.".format(err_msg))
+            logger.warning("No specific/dedicated tool interface is available for the following reason: %s.", err_msg)
             new_tool = self._build_generic_tool(tool_info)
-            logging.info("A generic tool interface has been created for {}.".format(new_tool._info))
+            logger.info("A generic tool interface has been created for %s.", new_tool._info)
         
         try:
             new_tool.connect_virtual_interface(new_tool_interface)
@@ -507,6 +1139,29 @@ class ToolFactory(object):
         else:
             return new_tool
 
+    def probe_tool(self, address: str) -> ToolInfo:
+        """Identifies the tool at address without attaching it; the session is closed afterwards.
+
+        Returns:
+            The ToolInfo of the tool; only its address (and interface) is known if it cannot be identified.
+        """
+
+        tool_info = ToolInfo()
+        try:
+            tool_interface = self._find_tool(address)
+        except (AttributeError, ValueError, IOError) as err:
+            logger.warning("Cannot probe the tool @ %s: %s", address, err)
+        else:
+            try:
+                tool_info = self._parse_tool_id(self._identify_tool(tool_interface))
+            except (ValueError, IOError) as err:
+                logger.warning("Cannot identify the tool @ %s: %s", address, err)
+            finally:
+                tool_info.interface = tool_interface.interface_type
+                tool_interface.close()
+
+        tool_info.address = address
+        return tool_info
     
     def _find_tool(self, address: str) -> visa.Resource:
         try:
@@ -579,19 +1234,36 @@ class RTestBenchManager(object):
     Attributes:
         _VERBOSE: A boolean indicating the quantity of information sent through the terminal.
         _attached_tools: A list of the resources (instruments) attached to the remote testbench.
-        _visa_rm: A ResourceManager from the visa module.
+        _visa_rm: The ResourceManager of the primary VISA library.
+        _router: A VisaRouter routing each address to the ResourceManager of its VISA library (see the _backends module).
+        _discovery: A DiscoveryCache of the available tools.
+        _pool: A SessionPool keeping the VISA sessions open by address.
+        _event_log: An EventLog recording the transactions of all attached tools, or None.
+        _scheduler: A Scheduler sharing the tools between clients, created by the first submit().
         chat: A TerminalChat for user interaction via the terminal.
         logger: A Logger handling log messages for streaming and printing.
     """
     
 
     # Constructor
-    def __init__(self, verbose=True, visa_library=''):
-        """Initializes RTestBenchManager with chat, logger, and VISA resource manager."""
+    def __init__(self, verbose=True, visa_library='', backends: dict = None):
+        """Initializes RTestBenchManager with chat, logger, and VISA resource managers.
+
+        Args:
+            verbose: A boolean indicating the quantity of information sent through the terminal.
+            visa_library: The primary VISA library (e.g., '@py'), used for the interface types without backend.
+            backends: A dict associating interface types with other VISA libraries (e.g., {'GPIB': '@ni', 'TCPIP': '@py'}),
+                whose resource managers are opened in parallel, or None.
+        """
 
         self._VERBOSE = verbose
         self._attached_tools = list()
         self._visa_rm = None
+        self._router = None
+        self._discovery = None
+        self._pool = None
+        self._event_log = None
+        self._scheduler = None
         self.logger = _logger.make_logger('rtestbench', self._VERBOSE)
         self.chat = _chat.TerminalChat()
 
@@ -602,11 +1274,15 @@ class RTestBenchManager(object):
         
         self.logger.debug('Calling the VISA resource manager...')
         try:
-            self._visa_rm = visa.ResourceManager(visa_library)
+            resource_managers = _backends.open_resource_managers([visa_library] + list((backends or {}).values()))
         except OSError as error_msg:
             self.logger.critical(error_msg)
             raise OSError('R-testbench cannot be properly initialized.')
         else:
+            self._visa_rm = resource_managers[visa_library]
+            self._router = _backends.VisaRouter(resource_managers, backends, visa_library)
+            self._pool = _pool.SessionPool(self._router)
+            self._discovery = _discovery.DiscoveryCache(self._router.list_resources, ToolFactory(self._router).probe_tool)
             self.logger.debug('Calling the VISA resource manager...done')
             if self._VERBOSE:
                 self.chat.say_ready()
@@ -627,18 +1303,32 @@ class RTestBenchManager(object):
     def close(self, enable_log: bool = True):
         """Closes the R-testbench Manager."""
 
+        if self._scheduler is not None:
+            self._scheduler.shutdown()
+            self._scheduler = None
+
+        if self._discovery is not None:
+            self._discovery.stop_background_refresh()
+
         if self._attached_tools:
             self.close_all_tools(enable_log)
 
         if self._visa_rm is not None:
             self._close_visa_rm(enable_log)
+
+        if self._event_log is not None:
+            self.disable_event_log()
     
     def _close_visa_rm(self, enable_log: bool = True):
-        """Closes the visa resource manager and sets it to None."""
+        """Closes the visa resource managers of all backends and sets them to None."""
 
         if enable_log:
             self.logger.debug('Closing the VISA resource manager...')
-        self._visa_rm.close()
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+        self._router.close()
+        self._router = None
         self._visa_rm = None
         if enable_log: 
             self.logger.debug('Closing the VISA resource manager...done')
@@ -649,33 +1339,71 @@ class RTestBenchManager(object):
         if enable_log:
             self.logger.debug('Closing all connected resources...')
         for device in self._attached_tools:
-            device.disconnect_virtual_interface()
+            device.disconnect_virtual_interface(close=self._pool is None)
             if enable_log:
-                self.logger.info('Resource detached from R-testbench: {}'.format(device))
+                self.logger.info('Resource detached from R-testbench: %s', device)
         self._attached_tools.clear()
+        if self._pool is not None:
+            self._pool.close()
         if enable_log:
             self.logger.debug('Closing all connected resources...done')
 
     
     # Information about tools
-    def detect_tools(self) -> tuple:
-        return self._visa_rm.list_resources()
-    
-    def print_available_tools(self):
-        available_tools = []
+    def detect_tools(self, query: str = _discovery.DISCOVERY_QUERY_ALL, identify: bool = False, refresh: bool = False) -> tuple:
+        """Returns the tools available to the VISA resource manager.
 
-        try:
-            available_tools = self.detect_tools()
-        except visa.VisaIOError as err:
-            if err.error_code == visa.constants.VI_ERROR_RSRC_NFOUND:
-                pass # available tools is empty
-            else:
-                raise IOError(err.description)
+        The list of resources is cached for a few seconds (see _discovery.DISCOVERY_TTL), and the identity
+        of each resource is probed once, when it first appears.
+
+        Args:
+            query: A VISA resource expression filtering the addresses (e.g., 'USB?*::INSTR').
+            identify: If True, the tools that are not identified yet are probed (*IDN?) in parallel.
+            refresh: If True, the resources are listed again even if the cached list is recent.
+
+        Returns:
+            A tuple of ToolInfo; without identification, only their address is known (except for attached tools).
+
+        Raises:
+            IOError: The VISA resource manager cannot list the resources.
+        """
+
+        addresses = self._discovery.list_resources(query, refresh)
+
+        for tool in self._attached_tools: # The sessions of attached tools must not be opened again
+            if tool._info.address in addresses:
+                self._discovery.remember(tool._info.address, tool._info)
+
+        if identify:
+            identities = self._discovery.identify(addresses)
+            return tuple(identities[address] for address in addresses)
+
+        tools = []
+        for address in addresses:
+            tool_info = self._discovery.get_identity(address)
+            if tool_info is None:
+                tool_info = ToolInfo()
+                tool_info.address = address
+            tools.append(tool_info)
+        return tuple(tools)
+
+    def print_available_tools(self, query: str = _discovery.DISCOVERY_QUERY_ALL):
+        available_tools = self.detect_tools(query)
         
         if available_tools:
-            print('Available tools:', available_tools)
+            print('Available tools:', tuple(tool_info.address for tool_info in available_tools))
         else:
             print('No available tools.')
+
+    def enable_discovery_refresh(self, period: float = None):
+        """Lists the available tools again every period seconds (default: TTL) in a background thread."""
+
+        self._discovery.start_background_refresh(period)
+
+    def disable_discovery_refresh(self):
+        """Stops the background refresh of the available tools."""
+
+        self._discovery.stop_background_refresh()
     
 
     # Tools management
@@ -692,16 +1420,236 @@ class RTestBenchManager(object):
             ValueError: An error occured when trying to reach the specified address.
         """
 
-        factory = ToolFactory(self._visa_rm)
+        return self._register_tool(self._connect_tool(address))
+
+    def attach_tools(self, addresses: list) -> tuple:
+        """Attaches several tools; the tools of each VISA backend are attached in a separate thread.
+
+        Args:
+            addresses: The addresses of the tools to attach.
+
+        Returns:
+            A tuple of the attached Tools, in the order of addresses.
+
+        Raises:
+            ValueError: At least one tool cannot be attached (none is attached then).
+        """
+
+        groups = dict()
+        for address in dict.fromkeys(addresses):
+            groups.setdefault(self._router.backend_of(address), []).append(address)
+
+        def connect_group(group):
+            connected = dict()
+            for address in group:
+                try:
+                    connected[address] = self._connect_tool(address)
+                except ValueError as err:
+                    connected[address] = err
+            return connected
+
+        connected = dict()
+        with ThreadPoolExecutor(max_workers=max(1, len(groups))) as executor:
+            for result in executor.map(connect_group, groups.values()):
+                connected.update(result)
+
+        failed = [address for address, tool in connected.items() if not isinstance(tool, Tool)]
+        if failed:
+            attached_addresses = {tool._info.address for tool in self._attached_tools}
+            for address, tool in connected.items(): # The tools that connected are closed, unless already attached
+                if isinstance(tool, Tool):
+                    tool.disconnect_virtual_interface(close=False)
+                    if address not in attached_addresses:
+                        self._pool.discard(address)
+            raise ValueError('Impossible to attach the tools @ {} to R-testbench!'.format(", ".join(failed)))
+
+        tools = {address: self._register_tool(tool) for address, tool in connected.items()}
+        return tuple(tools[address] for address in addresses)
+
+    def _connect_tool(self, address: str) -> Tool:
+        factory = ToolFactory(self._pool) # A session kept in the pool is reused
         try:
-            new_tool = factory.get_tool(address)
+            return factory.get_tool(address)
         except (AttributeError, ValueError, IOError, RuntimeError) as error_msg:
             self.logger.error(error_msg)
             raise ValueError('Impossible to attach the tool to R-testbench!')
-        else:
-            self.logger.info('New tool attached to R-testbench: {}.'.format(new_tool))
-            self._attached_tools.append(new_tool)
-            return new_tool
+
+    def _register_tool(self, new_tool: Tool) -> Tool:
+        self.logger.info('New tool attached to R-testbench: %s.', new_tool)
+        new_tool.set_reconnect_handler(self._pool.reopen)
+        if self._event_log is not None:
+            new_tool.set_event_log(self._event_log)
+        self._attached_tools.append(new_tool)
+        return new_tool
+
+    def detach_tool(self, tool, close: bool = False):
+        """Detaches a tool from the R-testbench manager.
+
+        Args:
+            tool: The attached Tool.
+            close: If False, the session is kept in the pool, so that attaching the tool again is immediate.
+
+        Raises:
+            ValueError: The tool is not attached to the manager.
+        """
+
+        if tool not in self._attached_tools:
+            raise ValueError("The tool {} is not attached to R-testbench.".format(tool._info))
+
+        self._attached_tools.remove(tool)
+        tool.set_reconnect_handler(None)
+        tool.disconnect_virtual_interface(close=False)
+        if close:
+            self._pool.discard(tool._info.address)
+        self.logger.info('Resource detached from R-testbench: %s', tool)
+
+    def check_sessions(self) -> dict:
+        """Closes the broken sessions of the pool and reconnects the attached tools that used them.
+
+        Returns:
+            A dict giving whether the session of each pooled address was healthy.
+        """
+
+        health = self._pool.health_check()
+        for tool in self._attached_tools:
+            if not health.get(tool._info.address, True):
+                try:
+                    tool.reconnect()
+                except IOError as err:
+                    self.logger.error(err)
+        return health
+
+    def load_config(self, file_path) -> dict:
+        """Attaches and configures all tools described in a configuration file (see the _config module).
+
+        All settings are validated and compiled into SCPI messages before anything is sent;
+        the messages are then sent to all tools in parallel, and cached to configure the tools again after a reconnection.
+
+        Args:
+            file_path: The path to the YAML or JSON configuration file.
+
+        Returns:
+            A dict associating the name of each tool in the configuration with the attached Tool.
+
+        Raises:
+            ValueError: The configuration is malformed, a tool cannot be attached or a setting is invalid.
+            RuntimeError: At least one tool could not be configured.
+        """
+
+        config = _config.load_config(file_path)
+        self.logger.debug('Loading the test bench configuration from %s...', file_path)
+
+        names = list(config["tools"])
+        tools = dict(zip(names, self.attach_tools([config["tools"][name]["address"] for name in names])))
+
+        plans = dict()
+        try:
+            for name, tool_config in config["tools"].items():
+                plans[tools[name]] = _config.compile_plan(tools[name], tool_config.get("settings"))
+        except ValueError:
+            for tool in tools.values(): # Nothing was sent, the bench is left as it was
+                self.detach_tool(tool)
+            raise
+        _config.apply_plans(plans)
+        for tool, messages in plans.items():
+            tool.set_replay_messages(messages) # Sent again if the tool is reconnected
+
+        self.logger.debug('Loading the test bench configuration from %s...done', file_path)
+        return tools
+
+
+    # Shared access
+    def submit(self, tool, method, *args, priority: int = _scheduler.PRIORITY_NORMAL, deadline: float = None, client=None, **kwargs):
+        """Schedules a call of a method of tool, serialized with all other calls submitted for this tool.
+
+        Args:
+            tool: The Tool to use.
+            method: The name of the method (e.g., 'get_range'); identical pending getters are coalesced (see Tool.COALESCED_GETTERS).
+            args, kwargs: The arguments of the method.
+            priority: The priority of the call (lower values run first, see _scheduler.PRIORITY_HIGH).
+            deadline: The time in seconds within which the call must start, or None.
+            client: Any hashable object identifying the requester; clients are served in turns.
+
+        Returns:
+            A concurrent.futures.Future of the result of the call.
+        """
+
+        if self._scheduler is None:
+            self._scheduler = _scheduler.Scheduler()
+        return self._scheduler.submit(tool, method, *args, priority=priority, deadline=deadline, client=client, **kwargs)
+
+
+    # Synchronized measurements
+    def trigger_tools(self, tools: list = None, count: int = 1, method: str = None) -> _trigger.TriggerReport:
+        """Measures with several tools upon a common trigger (see the _trigger module).
+
+        The tools are configured for bus triggering and armed in parallel, then triggered together;
+        their data are fetched concurrently afterwards.
+
+        Args:
+            tools: The participating tools (default: all attached tools).
+            count: The number of measurements per tool.
+            method: The trigger method among _trigger.TRIGGER_METHODS (default: a GPIB group execute trigger
+                if all tools share a GPIB board, otherwise a VISA assert trigger per tool).
+
+        Returns:
+            A TriggerReport with the data of each tool and the measured trigger skew.
+
+        Raises:
+            ValueError: No tool participates or the method is unknown.
+            RuntimeError: At least one tool could not be configured, armed, triggered or read.
+        """
+
+        tools = list(self._attached_tools if tools is None else tools)
+        if not tools:
+            raise ValueError("At least one tool must participate in the trigger.")
+        if method is None:
+            method = _trigger.default_method(tools)
+
+        board = None
+        if method == _trigger.TRIGGER_METHOD_GROUP:
+            board = self._router.open_resource("GPIB{}::INTFC".format(tools[0]._virtual_interface.interface_number))
+
+        try:
+            _trigger.configure(tools, count)
+            _trigger.arm(tools)
+
+            report = _trigger.TriggerReport(method)
+            _trigger.fire(tools, method, report, board)
+        finally:
+            if board is not None:
+                board.close()
+
+        report.data = _trigger.fetch(tools)
+        self.logger.info('%s', report)
+        return report
+
+
+    # Event log
+    def enable_event_log(self, file_path, **kwargs):
+        """Records every transaction of the attached tools in a binary event log (see the _events module).
+
+        Args:
+            file_path: The base path of the event log files.
+            kwargs: The options of the EventLog (max_bytes, max_segments, buffer_size).
+        """
+
+        if self._event_log is not None:
+            self.disable_event_log()
+
+        self._event_log = _events.EventLog(file_path, **kwargs)
+        for tool in self._attached_tools:
+            tool.set_event_log(self._event_log)
+        self.logger.debug('Event log enabled in %s.', file_path)
+
+    def disable_event_log(self):
+        """Stops recording transactions and closes the event log."""
+
+        for tool in self._attached_tools:
+            tool.set_event_log(None)
+        if self._event_log is not None:
+            self._event_log.close()
+            self._event_log = None
 
 
     # High-level log functions
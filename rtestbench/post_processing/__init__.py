@@ -1,11 +1,19 @@
 
 __all__ = [
+    'decimation',
     'frequency',
     'histogram',
+    'live',
+    'noise',
+    'report',
     'time_series'
 ]
 
 
+from . import decimation
 from . import frequency
 from . import histogram
+from . import live
+from . import noise
+from . import report
 from . import time_series
@@ -0,0 +1,191 @@
+
+# Scientific computations
+import numpy
+
+
+# Number of samples above which plot functions decimate the data before drawing
+DECIMATION_THRESHOLD = 100000
+
+# Number of samples loaded at once when scanning large (possibly memmapped) arrays
+_CHUNK_SIZE = 2**22
+
+
+def _as_array(data):
+    """Returns a NumPy view of data without copying it (Series, memmap and ndarray are supported)."""
+
+    if hasattr(data, 'to_numpy'):
+        return data.to_numpy()
+    return numpy.asarray(data)
+
+def _as_numeric(x):
+    """Returns x as a numeric array so that arithmetic is possible on datetime axes."""
+
+    if x.dtype.kind in ('M', 'm'):
+        return x.view('i8')
+    return x
+
+
+def _bucket_extrema(y, size: int):
+    """Returns the indices of the minimum and maximum of y in consecutive buckets of the given size.
+
+    The array is scanned chunk by chunk, so that a memmapped array is never loaded as a whole.
+    """
+
+    n_full = len(y) // size
+    has_tail = len(y) % size > 0
+    idx_min = numpy.empty(n_full + has_tail, dtype=numpy.intp)
+    idx_max = numpy.empty(n_full + has_tail, dtype=numpy.intp)
+
+    buckets_per_chunk = max(1, _CHUNK_SIZE // size)
+    for start in range(0, n_full, buckets_per_chunk):
+        stop = min(start + buckets_per_chunk, n_full)
+        block = numpy.asarray(y[start*size:stop*size]).reshape(-1, size)
+        offsets = numpy.arange(start, stop) * size
+        idx_min[start:stop] = block.argmin(axis=1) + offsets
+        idx_max[start:stop] = block.argmax(axis=1) + offsets
+
+    if has_tail:
+        tail = numpy.asarray(y[n_full*size:])
+        idx_min[-1] = tail.argmin() + n_full*size
+        idx_max[-1] = tail.argmax() + n_full*size
+
+    return idx_min, idx_max
+
+def _interleave(idx_min, idx_max):
+    """Merges min and max indices in chronological order, i.e., two points per bucket."""
+
+    first = numpy.minimum(idx_min, idx_max)
+    second = numpy.maximum(idx_min, idx_max)
+    return numpy.column_stack((first, second)).ravel()
+
+
+def minmax(x_data, y_data, n_buckets: int):
+    """Decimates the signal by keeping the minimum and the maximum of each bucket.
+
+    With one bucket per pixel, the plot is visually identical to the full-resolution one.
+    Returns a tuple (x, y) of NumPy arrays with at most 2*n_buckets points.
+    """
+
+    x = _as_array(x_data)
+    y = _as_array(y_data)
+
+    if len(y) <= 2*n_buckets:
+        return x, y
+
+    size = -(-len(y) // n_buckets) # ceil division
+    idx = _interleave(*_bucket_extrema(y, size))
+
+    return x[idx], y[idx]
+
+
+def lttb(x_data, y_data, n_out: int):
+    """Decimates the signal with the Largest-Triangle-Three-Buckets algorithm.
+
+    The bucket averages are computed once for the whole signal, then each bucket keeps the point
+    forming the largest triangle with the previously selected point and the average of the next bucket.
+    Returns a tuple (x, y) of NumPy arrays with n_out points.
+    Reference: S. Steinarsson, Downsampling Time Series for Visual Representation, 2013.
+    """
+
+    x = _as_array(x_data)
+    y = _as_array(y_data)
+    n = len(y)
+
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    x_num = _as_numeric(x)
+
+    # n_out - 2 buckets between the first and the last points, which are always kept
+    edges = numpy.linspace(1, n - 1, n_out - 1).astype(numpy.intp)
+    counts = numpy.diff(edges)
+    avg_x = numpy.append(numpy.add.reduceat(x_num[:n-1], edges[:-1], dtype=float) / counts, x_num[n-1])
+    avg_y = numpy.append(numpy.add.reduceat(y[:n-1], edges[:-1], dtype=float) / counts, y[n-1])
+
+    idx = numpy.empty(n_out, dtype=numpy.intp)
+    idx[0] = 0
+    idx[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i+1]
+        xa, ya = float(x_num[a]), float(y[a])
+        area = numpy.abs((xa - avg_x[i+1]) * (y[lo:hi] - ya) - (xa - x_num[lo:hi]) * (avg_y[i+1] - ya))
+        a = lo + int(area.argmax())
+        idx[i+1] = a
+
+    return x[idx], y[idx]
+
+
+def decimate(x_data, y_data, n_out: int, method: str = 'minmax'):
+    """Decimates the signal to about n_out points with the selected method ('minmax' or 'lttb')."""
+
+    if method == 'minmax':
+        return minmax(x_data, y_data, max(1, n_out // 2))
+    elif method == 'lttb':
+        return lttb(x_data, y_data, n_out)
+    else:
+        raise ValueError("The method argument must be in ('minmax', 'lttb').")
+
+
+class DecimationPyramid(object):
+    """Multi-resolution cache of min-max decimations of a signal.
+
+    The first level is computed with a single pass over the data; each coarser level is built from
+    the previous one. Decimating a visible range then only touches the buckets inside that range.
+
+    Attributes:
+        _x: A NumPy array (or memmap) with the sorted x-axis values.
+        _y: A NumPy array (or memmap) with the y-axis values.
+        _levels: A list of (bucket size, interleaved indices) tuples, from the finest to the coarsest.
+    """
+
+    def __init__(self, x_data, y_data, factor: int = 4, min_points: int = 1000):
+        self._x = _as_array(x_data)
+        self._y = _as_array(y_data)
+        self._levels = []
+
+        size = factor
+        idx_min, idx_max = _bucket_extrema(self._y, size)
+        while len(idx_min) > min_points:
+            self._levels.append((size, _interleave(idx_min, idx_max)))
+            idx_min, idx_max = self._coarsen(idx_min, idx_max, factor)
+            size = size * factor
+        self._levels.append((size, _interleave(idx_min, idx_max)))
+
+    def _coarsen(self, idx_min, idx_max, factor: int):
+        """Merges factor consecutive buckets of the previous level."""
+
+        n = len(idx_min)
+        pad = -n % factor
+        idx_min = numpy.append(idx_min, numpy.repeat(idx_min[-1], pad)).reshape(-1, factor)
+        idx_max = numpy.append(idx_max, numpy.repeat(idx_max[-1], pad)).reshape(-1, factor)
+        rows = numpy.arange(len(idx_min))
+
+        new_min = idx_min[rows, self._y[idx_min].argmin(axis=1)]
+        new_max = idx_max[rows, self._y[idx_max].argmax(axis=1)]
+
+        return new_min, new_max
+
+    def decimate(self, x_min=None, x_max=None, n_out: int = 2000):
+        """Returns a tuple (x, y) with at most about n_out points describing the range [x_min, x_max]."""
+
+        start = 0 if x_min is None else int(numpy.searchsorted(self._x, x_min, side='left'))
+        stop = len(self._x) if x_max is None else int(numpy.searchsorted(self._x, x_max, side='right'))
+        # Keep one extra point on each side so that the line reaches the axes borders
+        start = max(0, start - 1)
+        stop = min(len(self._x), stop + 1)
+
+        count = stop - start
+        if count <= n_out:
+            return self._x[start:stop], self._y[start:stop]
+
+        for size, idx in self._levels:
+            if 2*count // size <= n_out:
+                break
+
+        first = start // size
+        last = -(-stop // size)
+        idx = idx[2*first:2*last]
+
+        return self._x[idx], self._y[idx]
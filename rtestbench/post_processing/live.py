@@ -0,0 +1,189 @@
+
+# Scientific computations
+import numpy
+
+# Plot library
+import matplotlib.pyplot as plt
+from matplotlib.animation import FuncAnimation
+
+# Concurrency
+import threading
+
+# Decimation of long signals
+from . import decimation as _decimation
+
+
+class RingBuffer(object):
+    """Fixed-size circular buffer of (x, y) samples that can be filled from an acquisition thread.
+
+    Attributes:
+        _x: A NumPy array storing the x-axis values (sample index when not provided).
+        _y: A NumPy array storing the y-axis values.
+        _head: An int giving the position of the next write.
+        _count: An int giving the total number of samples ever written.
+        _lock: A threading.Lock protecting the buffer between writers and readers.
+    """
+
+    def __init__(self, capacity: int, dtype=numpy.float64):
+        self._x = numpy.zeros(capacity, dtype=numpy.float64)
+        self._y = numpy.zeros(capacity, dtype=dtype)
+        self._head = 0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return min(self._count, len(self._y))
+
+    @property
+    def capacity(self) -> int:
+        return len(self._y)
+
+    @property
+    def count(self) -> int:
+        """Total number of samples written so far; used by readers to detect new data."""
+
+        return self._count
+
+    def extend(self, y_data, x_data=None):
+        """Appends samples, overwriting the oldest ones when the buffer is full."""
+
+        y = numpy.atleast_1d(numpy.asarray(y_data, dtype=self._y.dtype))
+        if x_data is None:
+            x = None
+        else:
+            x = numpy.atleast_1d(numpy.asarray(x_data, dtype=self._x.dtype))
+
+        n_new = len(y)
+
+        with self._lock:
+            if x is None:
+                x = numpy.arange(self._count, self._count + len(y), dtype=self._x.dtype)
+
+            capacity = self.capacity
+            if len(y) >= capacity: # Only the most recent samples can be kept
+                y = y[-capacity:]
+                x = x[-capacity:]
+                self._head = 0
+
+            first = min(len(y), capacity - self._head)
+            self._y[self._head:self._head+first] = y[:first]
+            self._x[self._head:self._head+first] = x[:first]
+            self._y[:len(y)-first] = y[first:]
+            self._x[:len(y)-first] = x[first:]
+
+            self._head = (self._head + len(y)) % capacity
+            self._count = self._count + n_new
+
+    def snapshot(self):
+        """Returns a tuple (x, y) of copies of the buffered samples in chronological order."""
+
+        with self._lock:
+            if self._count < self.capacity:
+                return self._x[:self._head].copy(), self._y[:self._head].copy()
+            return numpy.roll(self._x, -self._head), numpy.roll(self._y, -self._head)
+
+
+class LivePlot(object):
+    """Live plot of streaming acquisitions, redrawn with blitting at a capped frame rate.
+
+    The acquisition thread only copies incoming data into a ring buffer (see push()),
+    whereas drawing happens in the GUI event loop, so plotting never slows the instrument loop.
+
+    Attributes:
+        _buffer: A RingBuffer holding the most recent samples.
+        _interval: An int giving the minimum time between two frames in milliseconds.
+        _drawn_count: An int recording the buffer count at the last frame, to skip idle frames.
+        _tools: A list of the tools whose acquisition stream feeds the plot.
+        _figure, _axes, _line: The matplotlib objects of the live plot.
+        _animation: The FuncAnimation driving the redraws.
+    """
+
+    def __init__(self, capacity: int = 10000, fps: float = 20, title='Live plot', xlabel=None, ylabel=None):
+        self._buffer = RingBuffer(capacity)
+        self._interval = int(1000 / fps)
+        self._drawn_count = 0
+        self._tools = []
+
+        self._figure, self._axes = plt.subplots()
+        self._line, = self._axes.plot([], [], animated=True)
+        self._axes.set_title(title)
+        self._axes.set_xlabel(xlabel)
+        self._axes.set_ylabel(ylabel)
+        self._axes.grid(True)
+        self._animation = None
+
+    # Acquisition side
+    def push(self, y_data, x_data=None):
+        """Feeds new samples to the plot; suitable as a Tool subscriber."""
+
+        self._buffer.extend(y_data, x_data)
+
+    def attach(self, tool):
+        """Subscribes the plot to the acquisition stream of a tool."""
+
+        tool.subscribe(self.push)
+        self._tools.append(tool)
+
+    def detach(self, tool):
+        """Unsubscribes the plot from the acquisition stream of a tool."""
+
+        tool.unsubscribe(self.push)
+        self._tools.remove(tool)
+
+    # Drawing side
+    def start(self, show: bool = False):
+        """Starts the periodic redraws; call plt.show() or set show=True to run the GUI event loop."""
+
+        self._animation = FuncAnimation(
+            self._figure, self._update, init_func=self._init_frame,
+            interval=self._interval, blit=True, cache_frame_data=False)
+        if show:
+            plt.show()
+
+    def stop(self):
+        """Stops the redraws and unsubscribes from all tools."""
+
+        if self._animation is not None:
+            self._animation.event_source.stop()
+            self._animation = None
+        for tool in list(self._tools):
+            self.detach(tool)
+
+    def _init_frame(self):
+        self._line.set_data([], [])
+        return self._line,
+
+    def _update(self, frame):
+        if self._buffer.count == self._drawn_count:
+            return self._line, # Nothing new: blitting restores the cached background only
+        self._drawn_count = self._buffer.count
+
+        x, y = self._buffer.snapshot()
+        n_buckets = max(1, int(self._axes.get_window_extent().width))
+        x, y = _decimation.minmax(x, y, n_buckets)
+        self._line.set_data(x, y)
+
+        if len(x) and self._rescale(x, y):
+            self._figure.canvas.draw_idle() # Limits changed: the blitted background is no longer valid
+
+        return self._line,
+
+    def _rescale(self, x, y) -> bool:
+        """Updates the axes limits when data leaves them; returns True if they changed."""
+
+        x_min, x_max = self._axes.get_xlim()
+        y_min, y_max = self._axes.get_ylim()
+        changed = False
+
+        if x[0] < x_min or x[-1] > x_max:
+            span = x[-1] - x[0] if x[-1] > x[0] else 1
+            self._axes.set_xlim(x[0], x[-1] + 0.5*span) # Headroom so that scrolling rarely invalidates the background
+            changed = True
+
+        low, high = numpy.nanmin(y), numpy.nanmax(y)
+        if low < y_min or high > y_max:
+            margin = 0.1 * (high - low) if high > low else 1
+            self._axes.set_ylim(low - margin, high + margin)
+            changed = True
+
+        return changed
@@ -0,0 +1,193 @@
+
+# Scientific computations
+import numpy
+import pandas
+
+# Plot library
+import matplotlib.pyplot as plt
+
+# Parallel computations
+from concurrent.futures import ProcessPoolExecutor
+
+# Annotations
+from typing import List
+pd_list = List[pandas.Series]
+
+# Auto styles
+from . import _auto_style
+
+
+# Allan deviations
+###
+# Data are samples y (e.g., current readings) taken every tau0 seconds. They are integrated once into
+# the phase x = cumsum(y) * tau0, after removing their mean: this only adds a linear term to the phase,
+# which cancels in the second differences, and it keeps the cumulative sums small enough for float32.
+# Each estimator then costs O(n) per averaging factor m (tau = m * tau0) thanks to cumulative sums.
+
+_KINDS = ('adev', 'oadev', 'mdev')
+
+_CHUNK_SIZE = 2**20
+
+
+def _phase(y, tau0: float, dtype):
+    """Integrates y into the phase, chunk by chunk to avoid full-size temporaries (memmaps supported)."""
+
+    if isinstance(y, pandas.Series):
+        y = y.to_numpy()
+    y = numpy.asarray(y)
+    dtype = numpy.dtype(dtype)
+    mean = y.mean(dtype=numpy.float64)
+
+    x = numpy.empty(len(y) + 1, dtype=dtype)
+    x[0] = 0
+    for start in range(0, len(y), _CHUNK_SIZE):
+        stop = min(start + _CHUNK_SIZE, len(y))
+        chunk = (numpy.asarray(y[start:stop], dtype=numpy.float64) - mean) * tau0
+        numpy.cumsum(chunk, out=x[start+1:stop+1], dtype=dtype)
+        x[start+1:stop+1] += x[start]
+
+    return x
+
+def _averaging_factors(taus, n: int, kind: str):
+    """Returns the valid averaging factors m for n samples."""
+
+    m_max = n // 3 if kind == 'mdev' else n // 2
+
+    if isinstance(taus, str):
+        if taus == 'octave':
+            factors = 2 ** numpy.arange(int(numpy.log2(m_max)) + 1) if m_max >= 1 else numpy.empty(0)
+        elif taus == 'decade':
+            factors = numpy.unique(numpy.round(numpy.logspace(0, numpy.log10(m_max), 10 * int(numpy.log10(m_max) + 1)))) if m_max >= 1 else numpy.empty(0)
+        elif taus == 'all':
+            factors = numpy.arange(1, m_max + 1)
+        else:
+            raise ValueError("The taus argument must be in ('octave', 'decade', 'all') or a list of averaging factors.")
+    else:
+        factors = numpy.asarray(taus)
+
+    factors = factors.astype(numpy.int64)
+    return factors[(factors >= 1) & (factors <= m_max)]
+
+
+def _avar(x, m: int, tau0: float) -> float:
+    """Non-overlapping Allan variance from the phase decimated by m."""
+
+    xm = x[::m]
+    d2 = xm[2:] - 2*xm[1:-1] + xm[:-2]
+    return numpy.dot(d2, d2) / (2 * (m*tau0)**2 * len(d2))
+
+def _oavar(x, m: int, tau0: float) -> float:
+    """Overlapping Allan variance: every sample starts an estimate."""
+
+    d2 = x[2*m:] - 2*x[m:-m] + x[:-2*m]
+    return numpy.dot(d2, d2) / (2 * (m*tau0)**2 * len(d2))
+
+def _mvar(x, m: int, tau0: float) -> float:
+    """Modified Allan variance: the sums of m consecutive second differences come from a cumulative sum."""
+
+    d2 = x[2*m:] - 2*x[m:-m] + x[:-2*m]
+    cumulative = numpy.concatenate(([0], numpy.cumsum(d2)))
+    s = cumulative[m:] - cumulative[:-m]
+    return numpy.dot(s, s) / (2 * m**2 * (m*tau0)**2 * len(s))
+
+_VARIANCES = {'adev': _avar, 'oadev': _oavar, 'mdev': _mvar}
+
+
+def _worker_deviations(kind: str, x, factors, tau0: float):
+    variance = _VARIANCES[kind]
+    return [numpy.sqrt(variance(x, m, tau0)) for m in factors]
+
+
+def allan(y, tau0: float = 1.0, taus='octave', kind: str = 'oadev', dtype=numpy.float64, n_jobs: int = 1):
+    """Returns a tuple (taus, deviations) with the selected Allan deviation of y.
+
+    Args:
+        y: The samples (pandas' Series or array) taken every tau0 seconds.
+        tau0: The sampling period in seconds.
+        taus: 'octave', 'decade', 'all', or a list of averaging factors m (tau = m * tau0).
+        kind: 'adev' (Allan), 'oadev' (overlapping Allan) or 'mdev' (modified Allan).
+        dtype: numpy.float32 halves the memory used by the phase of very large records.
+        n_jobs: The number of processes sharing the averaging factors (1 computes in-process).
+    """
+
+    if kind not in _KINDS:
+        raise ValueError("The kind argument must be in {}.".format(_KINDS))
+
+    x = _phase(y, tau0, dtype)
+    factors = _averaging_factors(taus, len(x) - 1, kind)
+
+    if n_jobs > 1 and len(factors) > 1:
+        # Interleaved split: small and large factors are spread evenly between processes,
+        # each receiving the phase with its group (no pool initializer before Python 3.7)
+        groups = [factors[i::n_jobs] for i in range(n_jobs)]
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            results = list(executor.map(_worker_deviations, [kind]*n_jobs, [x]*n_jobs, groups, [tau0]*n_jobs))
+        deviations = numpy.empty(len(factors))
+        for i, values in enumerate(results):
+            deviations[i::n_jobs] = values
+    else:
+        variance = _VARIANCES[kind]
+        deviations = numpy.sqrt([variance(x, m, tau0) for m in factors])
+
+    return factors * tau0, numpy.asarray(deviations, dtype=float)
+
+def adev(y, tau0: float = 1.0, taus='octave', **kwargs):
+    """Returns a tuple (taus, deviations) with the (non-overlapping) Allan deviation of y."""
+
+    return allan(y, tau0, taus, kind='adev', **kwargs)
+
+def oadev(y, tau0: float = 1.0, taus='octave', **kwargs):
+    """Returns a tuple (taus, deviations) with the overlapping Allan deviation of y."""
+
+    return allan(y, tau0, taus, kind='oadev', **kwargs)
+
+def mdev(y, tau0: float = 1.0, taus='octave', **kwargs):
+    """Returns a tuple (taus, deviations) with the modified Allan deviation of y."""
+
+    return allan(y, tau0, taus, kind='mdev', **kwargs)
+
+
+# Plots
+###
+
+def plot_allan(data, tau0=1.0, taus='octave', kind='oadev', title='Allan deviation', show=False, **kwargs):
+    """Plot the Allan deviation of data on log-log axes.
+
+    Reference: https://matplotlib.org/api/_as_gen/matplotlib.pyplot.loglog.html
+    """
+
+    plt.figure()
+
+    tau, deviation = allan(data, tau0=tau0, taus=taus, kind=kind)
+    plt.loglog(tau, deviation, **kwargs)
+
+    plt.xlabel('Averaging time [s]')
+    plt.ylabel(kind)
+    plt.title(title)
+
+    plt.grid(True, which='both')
+
+    if show:
+        plt.show()
+
+def multiplot_allan(data: pd_list, tau0=1.0, taus='octave', kind='oadev', title='Allan deviations', **kwargs):
+    """Plot the Allan deviation of several signals passed in data.
+
+    Assumes that data is a list of pandas' Series objects sharing the same sampling period.
+    """
+    plt.figure()
+    legend = list()
+    index = 0
+
+    for y in data:
+        tau, deviation = allan(y, tau0=tau0, taus=taus, kind=kind)
+        plt.loglog(tau, deviation, ls=_auto_style.auto_linestyle[index % len(_auto_style.auto_linestyle)], **kwargs)
+        legend.append(y.name)
+        index = index + 1
+
+    plt.xlabel('Averaging time [s]')
+    plt.ylabel(kind)
+    plt.title(title)
+    plt.legend(legend)
+
+    plt.grid(True, which='both')
@@ -0,0 +1,199 @@
+
+# Scientific computations
+import numpy
+
+# Plot library: object-oriented API only, no pyplot global state
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+# Parallel computations
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+# Files
+from pathlib import Path
+
+# Post-processing
+from . import decimation as _decimation
+from . import noise as _noise
+
+
+REPORT_FORMATS = ('png', 'svg', 'pdf')
+
+
+class FigureTemplate(object):
+    """Layout shared by many report pages: the figure is built once per process and reused.
+
+    Attributes:
+        figsize: A tuple (width, height) in inches.
+        dpi: An int giving the resolution of raster outputs.
+        xlabel, ylabel: The default labels of the axes.
+        xscale, yscale: The default scales of the axes ('linear' or 'log').
+        grid: A boolean to display the grid.
+    """
+
+    def __init__(self, figsize=(8, 4.5), dpi=100, xlabel=None, ylabel=None, xscale='linear', yscale='linear', grid=True):
+        self.figsize = figsize
+        self.dpi = dpi
+        self.xlabel = xlabel
+        self.ylabel = ylabel
+        self.xscale = xscale
+        self.yscale = yscale
+        self.grid = grid
+
+    def _key(self) -> tuple:
+        return (tuple(self.figsize), self.dpi, self.xlabel, self.ylabel, self.xscale, self.yscale, self.grid)
+
+    def build(self):
+        """Returns a new (figure, axes) pair attached to an Agg canvas."""
+
+        figure = Figure(figsize=self.figsize, dpi=self.dpi)
+        FigureCanvasAgg(figure)
+        axes = figure.add_subplot(1, 1, 1)
+        return figure, axes
+
+    def reset(self, axes):
+        """Removes the artists of the previous page and restores the template configuration."""
+
+        for artist in list(axes.lines) + list(axes.patches) + list(axes.collections) + list(axes.texts) + list(axes.images):
+            artist.remove()
+        if axes.get_legend() is not None:
+            axes.get_legend().remove()
+        axes.relim() # Forget the data limits of the removed artists
+        axes.autoscale()
+
+        axes.set_xscale(self.xscale)
+        axes.set_yscale(self.yscale)
+        axes.set_xlabel(self.xlabel)
+        axes.set_ylabel(self.ylabel)
+        axes.grid(self.grid, which='both' if 'log' in (self.xscale, self.yscale) else 'major')
+        axes.set_prop_cycle(None)
+
+
+# Renderers
+###
+# Each renderer draws one kind of page on the axes of a template.
+
+def _render_time_series(axes, x, y, labels=None, max_points=_decimation.DECIMATION_THRESHOLD, **kwargs):
+    n_buckets = max(1, int(axes.get_window_extent().width))
+    for signal in (y if isinstance(y, (list, tuple)) else [y]):
+        if len(signal) > max_points:
+            axes.plot(*_decimation.minmax(x, signal, n_buckets), **kwargs)
+        else:
+            axes.plot(x, signal, **kwargs)
+    if labels:
+        axes.legend(labels)
+
+def _render_histogram(axes, data, bins=50, **kwargs):
+    axes.hist(numpy.asarray(data), bins, density=False, histtype='bar', align='mid', **kwargs)
+    axes.set_ylabel('Counts')
+
+def _render_psd(axes, data, Fs=None, NFFT='full', **kwargs):
+    if NFFT in ('full', 'whole'):
+        NFFT = len(data)
+    axes.psd(numpy.asarray(data), NFFT=NFFT, Fs=Fs, scale_by_freq=True, **kwargs)
+
+def _render_allan(axes, data, tau0=1.0, taus='octave', kind='oadev', **kwargs):
+    tau, deviation = _noise.allan(data, tau0=tau0, taus=taus, kind=kind)
+    axes.loglog(tau, deviation, **kwargs)
+    axes.set_xlabel('Averaging time [s]')
+    axes.set_ylabel(kind)
+
+_RENDERERS = {
+    'time_series': _render_time_series,
+    'histogram': _render_histogram,
+    'psd': _render_psd,
+    'allan': _render_allan,
+}
+
+
+# Worker side
+###
+
+WORKER_FIGURES_MAX = 8 # Number of templates whose figure is kept by each process
+
+_worker_figures = OrderedDict() # Figures reused by the current process, keyed by template, least recently used first
+
+
+def _render_page(page) -> list:
+    """Renders a page and writes it in all requested formats; returns the written paths."""
+
+    name, kind, template, title, data, directory, formats = page
+
+    key = template._key()
+    if key in _worker_figures:
+        _worker_figures.move_to_end(key)
+    else:
+        if len(_worker_figures) >= WORKER_FIGURES_MAX:
+            _worker_figures.popitem(last=False)
+        _worker_figures[key] = template.build()
+    figure, axes = _worker_figures[key]
+
+    template.reset(axes)
+    _RENDERERS[kind](axes, **data)
+    axes.set_title(title)
+
+    paths = []
+    for fmt in formats:
+        path = Path(directory) / "{}.{}".format(name, fmt)
+        figure.savefig(path, format=fmt)
+        paths.append(str(path))
+
+    return paths
+
+
+class BatchReport(object):
+    """Headless generation of many post-processing plots, rendered in a pool of processes.
+
+    Attributes:
+        _directory: A pathlib.Path to the directory where pages are written.
+        _formats: A tuple of the output formats among REPORT_FORMATS.
+        _pages: A list of the pages waiting to be rendered.
+    """
+
+    def __init__(self, directory, formats=('png',)):
+        if not all(fmt in REPORT_FORMATS for fmt in formats):
+            raise ValueError("The formats argument must contain elements among {}.".format(REPORT_FORMATS))
+
+        self._directory = Path(directory)
+        self._formats = tuple(formats)
+        self._pages = []
+
+    def __len__(self):
+        return len(self._pages)
+
+    def add_page(self, name: str, kind: str, template: FigureTemplate = None, title: str = '', **data):
+        """Queues a page; data holds the arguments of the renderer (e.g., x and y for 'time_series')."""
+
+        if kind not in _RENDERERS:
+            raise ValueError("The kind argument must be in {}.".format(tuple(_RENDERERS)))
+        if template is None:
+            template = FigureTemplate()
+
+        self._pages.append((name, kind, template, title, data, str(self._directory), self._formats))
+
+    def render(self, n_jobs: int = None) -> list:
+        """Renders all queued pages and returns the list of written files.
+
+        Args:
+            n_jobs: The number of processes (default: number of CPUs; 1 renders in-process).
+        """
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        if n_jobs is None:
+            n_jobs = os.cpu_count() or 1
+
+        if n_jobs == 1 or len(self._pages) < 2:
+            try:
+                results = [_render_page(page) for page in self._pages]
+            finally:
+                _worker_figures.clear() # The figures of the batch are not kept by the calling process
+        else:
+            # Large chunks so that each process reuses its figures over many pages
+            chunksize = max(1, len(self._pages) // (4 * n_jobs))
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                results = list(executor.map(_render_page, self._pages, chunksize=chunksize))
+
+        self._pages.clear()
+        return [path for paths in results for path in paths]
@@ -9,42 +9,82 @@ import matplotlib.pyplot as plt
 # String matching
 from difflib import SequenceMatcher
 
+# Decimation of long signals
+from . import decimation as _decimation
+
+# Noise characterization
+from . import noise as _noise
+
 
 
 # def plot2(*signals, )
 
-def plot(time_data, y_data, title='Time series plot', **kwargs):
+def _pixel_width(ax) -> int:
+    """Returns the width of the axes in pixels, i.e., the number of buckets for min-max decimation."""
+
+    return max(1, int(ax.get_window_extent().width))
+
+def _plot_decimated(ax, time_data, y_data, decimation, max_points, pyramid, **kwargs):
+    """Plots the signal on ax, decimating it first when it has more than max_points samples."""
+
+    if decimation is None or len(y_data) <= max_points:
+        return ax.plot(time_data, y_data, **kwargs)
+
+    n_out = 2 * _pixel_width(ax)
+
+    if not pyramid:
+        x, y = _decimation.decimate(time_data, y_data, n_out, method=decimation)
+        return ax.plot(x, y, **kwargs)
+
+    cache = _decimation.DecimationPyramid(time_data, y_data)
+    lines = ax.plot(*cache.decimate(n_out=n_out), **kwargs)
+
+    def _on_xlim_changed(axes):
+        x_min, x_max = axes.get_xlim()
+        lines[0].set_data(*cache.decimate(x_min, x_max, n_out=2 * _pixel_width(axes)))
+
+    ax.callbacks.connect('xlim_changed', _on_xlim_changed)
+    return lines
+
+
+def plot(time_data, y_data, title='Time series plot', decimation='minmax',
+         max_points=_decimation.DECIMATION_THRESHOLD, pyramid=False, **kwargs):
     """Plot the time series.
 
-    Assumes that data is a pandas' Series object.
+    Assumes that data is a pandas' Series object, or any NumPy array (including memmap).
+    Above max_points samples, the signal is decimated to about two points per pixel
+    with the decimation method ('minmax', 'lttb' or None to disable it).
+    With pyramid=True, zooming re-decimates only the visible range from a multi-resolution cache.
     Reference: https://matplotlib.org/api/_as_gen/matplotlib.pyplot.plot.html
     """
     plt.figure()
 
-    plt.plot(time_data, y_data, **kwargs)
+    _plot_decimated(plt.gca(), time_data, y_data, decimation, max_points, pyramid, **kwargs)
     
-    plt.xlabel(time_data.name)
-    plt.ylabel(y_data.name)
+    plt.xlabel(getattr(time_data, 'name', None))
+    plt.ylabel(getattr(y_data, 'name', None))
     plt.title(title)
     
     plt.grid(True)
 
     # plt.show()
 
-def multiplot(time_data, y_data, ylabel, title='Time series plot', **kwargs):
+def multiplot(time_data, y_data, ylabel, title='Time series plot', decimation='minmax',
+              max_points=_decimation.DECIMATION_THRESHOLD, pyramid=False, **kwargs):
     """Plot the time series of several signals.
 
     Assumes that y_data is a list of pandas' Series objects sharing the same 'x' axis time_data.
+    Long signals are decimated as in plot().
     Reference: https://matplotlib.org/api/_as_gen/matplotlib.pyplot.plot.html
     """
     plt.figure()
     legend = list()
 
     for data in y_data:
-        plt.plot(time_data, data)
+        _plot_decimated(plt.gca(), time_data, data, decimation, max_points, pyramid)
         legend.append(data.name)
 
-    plt.xlabel(time_data.name)
+    plt.xlabel(getattr(time_data, 'name', None))
     plt.ylabel(ylabel)
     plt.title(title)
     plt.legend(legend)
@@ -58,3 +98,142 @@ def remove_offset(y, offset='mean'):
     elif offset == 'first':
         return y - y.iloc[0]
 
+
+
+# Rolling statistics and drift removal
+###
+# All rolling functions accept a pandas' Series, a NumPy array (or list), or an iterable of chunks.
+# Arrays and Series return the statistic of every complete window (len(data) - window + 1 values),
+# whereas iterables of chunks return a generator yielding the results chunk by chunk (online use).
+
+def _is_batch(data) -> bool:
+    return isinstance(data, (numpy.ndarray, pandas.Series, list, tuple))
+
+def _rolling(kernel, data, window: int, label: str):
+    """Applies a vectorized rolling kernel to a batch of data or to a stream of chunks."""
+
+    if window < 1:
+        raise ValueError("The window argument must be a positive integer.")
+
+    if isinstance(data, pandas.Series):
+        values = kernel(data.to_numpy(dtype=float), window)
+        return pandas.Series(data=values, index=data.index[window-1:], name="{} - rolling {}".format(data.name, label))
+    elif _is_batch(data):
+        return kernel(numpy.asarray(data, dtype=float), window)
+    else:
+        return _rolling_stream(kernel, data, window)
+
+def _rolling_stream(kernel, chunks, window: int):
+    """Yields the rolling statistic chunk by chunk, carrying the last window-1 samples over."""
+
+    tail = numpy.empty(0)
+    for chunk in chunks:
+        buffer = numpy.concatenate((tail, numpy.asarray(chunk, dtype=float).ravel()))
+        if len(buffer) >= window:
+            yield kernel(buffer, window)
+        tail = buffer[len(buffer)-window+1:] if window > 1 else buffer[:0]
+
+def _sliding_sums(x, window: int):
+    """Returns the sums and sums of squares over all windows, in O(n) with cumulative sums.
+
+    Data are shifted by their first value to limit the loss of precision of cumulative sums.
+    """
+
+    shift = x[0] if len(x) else 0.
+    shifted = x - shift
+    s1 = numpy.cumsum(numpy.concatenate(([0.], shifted)))
+    s2 = numpy.cumsum(numpy.concatenate(([0.], shifted * shifted)))
+
+    return s1[window:] - s1[:-window], s2[window:] - s2[:-window], shift
+
+def _rolling_mean(x, window: int):
+    sums, _, shift = _sliding_sums(x, window)
+    return sums / window + shift
+
+def _rolling_std(x, window: int, ddof: int = 0):
+    sums, squares, _ = _sliding_sums(x, window)
+    variance = (squares - sums * sums / window) / (window - ddof)
+    return numpy.sqrt(numpy.maximum(variance, 0))
+
+def _rolling_extremum(x, window: int, ufunc):
+    """Van Herk/Gil-Werman algorithm: O(n) whatever the window, with block-wise prefix and suffix scans."""
+
+    n = len(x)
+    if n < window:
+        return numpy.empty(0)
+
+    pad = -n % window
+    blocks = numpy.concatenate((x, numpy.repeat(x[-1], pad))).reshape(-1, window)
+    prefix = ufunc.accumulate(blocks, axis=1).ravel()
+    suffix = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+
+    return ufunc(suffix[:n-window+1], prefix[window-1:n])
+
+
+def rolling_mean(data, window: int):
+    """Returns the mean over a sliding window of window samples."""
+
+    return _rolling(_rolling_mean, data, window, "mean")
+
+def rolling_std(data, window: int, ddof: int = 0):
+    """Returns the standard deviation over a sliding window of window samples."""
+
+    return _rolling(lambda x, w: _rolling_std(x, w, ddof), data, window, "std")
+
+def rolling_min(data, window: int):
+    """Returns the minimum over a sliding window of window samples."""
+
+    return _rolling(lambda x, w: _rolling_extremum(x, w, numpy.minimum), data, window, "min")
+
+def rolling_max(data, window: int):
+    """Returns the maximum over a sliding window of window samples."""
+
+    return _rolling(lambda x, w: _rolling_extremum(x, w, numpy.maximum), data, window, "max")
+
+
+def _to_array(data):
+    """Returns data as a NumPy array; iterables of chunks are consumed and concatenated."""
+
+    if isinstance(data, pandas.Series):
+        return data.to_numpy(dtype=float)
+    elif _is_batch(data):
+        return numpy.asarray(data, dtype=float)
+    else:
+        return numpy.concatenate([numpy.asarray(chunk, dtype=float).ravel() for chunk in data])
+
+def detrend(y, x=None):
+    """Removes the least-squares linear drift from the signal y (sampled at x, or uniformly).
+
+    The fit is computed in a single O(n) pass from sums; iterables of chunks are consumed first
+    since the drift is only known once the whole record has been seen.
+    """
+
+    values = _to_array(y)
+    n = len(values)
+    if x is None:
+        t = numpy.arange(n, dtype=float)
+    else:
+        t = _to_array(x)
+
+    t_mean = t.mean()
+    y_mean = values.mean()
+    dt = t - t_mean
+    slope = numpy.dot(dt, values - y_mean) / numpy.dot(dt, dt) if n > 1 else 0.
+    detrended = values - (y_mean + slope * dt)
+
+    if isinstance(y, pandas.Series):
+        return pandas.Series(data=detrended, index=y.index, name="{} - detrended".format(y.name))
+    return detrended
+
+
+def allan_deviation(y, taus=None, tau0: float = 1.0):
+    """Returns a tuple (taus, deviations) with the (non-overlapping) Allan deviation of y.
+
+    Args:
+        y: The samples (Series, array or iterable of chunks) taken every tau0 seconds.
+        taus: The averaging factors m (tau = m * tau0); octave-spaced factors by default.
+        tau0: The sampling period in seconds.
+    See the noise module for the overlapping and modified estimators.
+    """
+
+    return _noise.adev(_to_array(y), tau0=tau0, taus='octave' if taus is None else taus)
@@ -1,10 +1,65 @@
-
 # VISA library
 import visa
 
+from contextlib import contextmanager
+
 
 def attach_simulated_device_to(tool):
     """Create a simulated VISA resource and attach it to a tool."""
     rm = visa.ResourceManager('@sim')
     sim_visa_resource = rm.open_resource('ASRL1::INSTR')
     tool.attach_visa_resource(sim_visa_resource)
+
+
+class FakeSession(object):
+    """In-memory VISA session recording the written messages and answering them, read chunk by chunk as by visalib.read().
+
+    The answer of each message of a command (messages separated by ';') is given by answer(), to be overriden
+    or passed as an argument; the answers of a compound command are joined by ';' and terminated by '\\n'.
+
+    Attributes:
+        written: A list of the written commands.
+        timeout: The timeout in ms, as set by the tool.
+        max_chunk: An int giving the largest number of bytes returned by a read, or None.
+        _answer: The bytes answered to the last command and not read yet.
+    """
+
+    interface_type = visa.constants.InterfaceType.usb
+    session = 1
+
+    def __init__(self, answer=None, max_chunk: int = None):
+        if answer is not None:
+            self.answer = answer
+        self.max_chunk = max_chunk
+        self.written = []
+        self.timeout = 2000
+        self.read_termination = '\n'
+        self.write_termination = '\n'
+        self.visalib = self
+        self._answer = b''
+
+    def answer(self, message: str):
+        """Returns the bytes answered to a message, or None if it has no answer."""
+
+        return None
+
+    def write(self, command):
+        self.written.append(command)
+        answers = [answer for answer in (self.answer(message) for message in command.split(';')) if answer is not None]
+        if answers:
+            self._answer = b';'.join(answers) + b'\n'
+
+    def query(self, request):
+        self.write(request)
+        answer, self._answer = self._answer, b''
+        return answer.decode().strip()
+
+    def read(self, session, size):
+        if self.max_chunk is not None:
+            size = min(size, self.max_chunk)
+        chunk, self._answer = self._answer[:size], self._answer[size:]
+        return chunk, visa.constants.StatusCode.success if not self._answer else visa.constants.StatusCode.success_max_count_read
+
+    @contextmanager
+    def ignore_warning(self, *warnings):
+        yield
@@ -0,0 +1,89 @@
+"""Test for the _backends module."""
+
+
+import threading
+import time
+
+import pytest
+
+import visa
+
+import rtestbench._backends as backends
+
+
+class FakeResourceManager(object):
+
+    def __init__(self, resources, delay=0.0, error_code=None):
+        self.resources = resources
+        self.delay = delay
+        self.error_code = error_code
+        self.opened = []
+        self.closed = False
+        self.threads = set()
+
+    def list_resources(self, query="?*::INSTR"):
+        self.threads.add(threading.get_ident())
+        time.sleep(self.delay)
+        if self.error_code is not None:
+            raise visa.VisaIOError(self.error_code)
+        return tuple(self.resources)
+
+    def open_resource(self, address):
+        self.opened.append(address)
+        return address
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def resource_managers():
+    return {
+        '@py': FakeResourceManager(["TCPIP0::1.2.3.4::INSTR", "USB0::1::INSTR", "GPIB0::1::INSTR"], delay=0.2),
+        '@ni': FakeResourceManager(["GPIB0::1::INSTR", "GPIB0::12::INSTR", "TCPIP0::1.2.3.4::INSTR"], delay=0.2),
+    }
+
+@pytest.fixture
+def router(resource_managers):
+    return backends.VisaRouter(resource_managers, {"gpib": '@ni'}, primary='@py')
+
+
+def test_interface_of():
+    assert backends.interface_of("GPIB0::12::INSTR") == "GPIB"
+    assert backends.interface_of("tcpip::1.2.3.4::INSTR") == "TCPIP"
+    assert backends.interface_of("MyScope") is None
+
+def test_routing(resource_managers, router):
+    assert router.backend_of("GPIB1::3::INSTR") == '@ni'
+    assert router.backend_of("USB0::1::INSTR") == '@py'
+    assert router.backend_of("MyScope") == '@py'
+
+    router.open_resource("GPIB0::12::INSTR")
+    router.open_resource("TCPIP0::1.2.3.4::INSTR")
+    assert resource_managers['@ni'].opened == ["GPIB0::12::INSTR"]
+    assert resource_managers['@py'].opened == ["TCPIP0::1.2.3.4::INSTR"]
+
+def test_unknown_library(resource_managers):
+    with pytest.raises(ValueError):
+        backends.VisaRouter(resource_managers, {"USB": '@sim'}, primary='@py')
+
+def test_list_resources(resource_managers, router):
+    start = time.monotonic()
+    addresses = router.list_resources()
+    assert time.monotonic() - start < 0.35 # Both backends are listed in parallel
+    assert resource_managers['@py'].threads != resource_managers['@ni'].threads
+
+    # Each backend only reports the addresses routed to it
+    assert sorted(addresses) == ["GPIB0::12::INSTR", "GPIB0::1::INSTR", "TCPIP0::1.2.3.4::INSTR", "USB0::1::INSTR"]
+
+def test_list_resources_errors(resource_managers, router):
+    resource_managers['@ni'].error_code = visa.constants.VI_ERROR_SYSTEM_ERROR
+    assert "GPIB0::12::INSTR" not in router.list_resources() # The other backend is still listed
+
+    resource_managers['@py'].error_code = visa.constants.VI_ERROR_RSRC_NFOUND
+    with pytest.raises(visa.VisaIOError):
+        router.list_resources()
+
+def test_close(resource_managers, router):
+    router.close()
+    assert all(resource_manager.closed for resource_manager in resource_managers.values())
@@ -0,0 +1,113 @@
+"""Test for the _block module and the streaming of binary blocks."""
+
+
+import io
+
+import numpy as np
+import pytest
+
+import rtestbench._block as block
+from rtestbench.core import Tool
+from rtestbench.core import ToolInfo
+from rtestbench.tests._test_facilities import FakeSession
+
+
+def fake_read(message: bytes, max_chunk: int = 7):
+    """Returns a read callable serving message in chunks of at most max_chunk bytes, with END on the last byte."""
+
+    position = [0]
+    def read(size):
+        chunk = message[position[0]:position[0] + min(size, max_chunk)]
+        position[0] += len(chunk)
+        return chunk, position[0] >= len(message)
+    return read
+
+
+@pytest.fixture
+def values():
+    return np.arange(10, dtype='>f4')
+
+@pytest.fixture
+def definite_block(values):
+    payload = values.tobytes()
+    return "#2{:02d}".format(len(payload)).encode() + payload + b'\n'
+
+
+def test_read_block_header():
+    assert block.read_block_header(fake_read(b"#15abcde")) == 5
+    assert block.read_block_header(fake_read(b"#0abc")) is None
+    assert block.read_block_header(fake_read(b":CURV #212")) == 12
+
+    with pytest.raises(IOError):
+        block.read_block_header(fake_read(b"#x"))
+    with pytest.raises(IOError):
+        block.read_block_header(fake_read(b"#3"))
+    with pytest.raises(IOError):
+        block.read_block_header(fake_read(b"1.0,2.0\n"))
+
+def test_encode_block(values, definite_block):
+    assert block.encode_block(values, '>f4') == definite_block[:-1]
+    assert block.encode_block([1, 2], '<i2') == b"#14\x01\x00\x02\x00"
+
+def test_read_definite_block(values, definite_block):
+    stream = io.BytesIO()
+    data = block.BlockReader(fake_read(definite_block), chunk_size=8).read_block('>f4', stream=stream)
+    np.testing.assert_array_equal(data, values)
+    assert stream.getvalue() == values.tobytes()
+
+def test_read_definite_block_out(values, definite_block):
+    out = np.zeros(16, dtype='>f4')
+    data = block.BlockReader(fake_read(definite_block)).read_block('>f4', out=out)
+    assert np.shares_memory(data, out) # No intermediate copy
+    np.testing.assert_array_equal(out[:10], values)
+
+    with pytest.raises(ValueError):
+        block.BlockReader(fake_read(definite_block)).read_block('>f4', out=np.zeros(4, dtype='>f4'))
+
+def test_read_truncated_block(definite_block):
+    with pytest.raises(IOError):
+        block.BlockReader(fake_read(definite_block[:-9])).read_block('>f4')
+
+def test_read_indefinite_block(values):
+    stream = io.BytesIO()
+    data = block.BlockReader(fake_read(b"#0" + values.tobytes() + b'\n'), chunk_size=16).read_block('>f4', stream=stream)
+    np.testing.assert_array_equal(data, values)
+    assert stream.getvalue() == values.tobytes()
+
+
+def test_tool_query_block(values, definite_block):
+    tool = Tool(ToolInfo())
+    tool._properties.bin_data_endianness = "big"
+    tool._properties.bin_data_chunk_size = 8
+    session = FakeSession(lambda message: definite_block[:-1], max_chunk=7) # Any request is answered by the block
+    tool.connect_virtual_interface(session)
+
+    np.testing.assert_array_equal(tool.query_block(":FETC?"), values)
+    assert session.written == [":FETC?"]
+    assert session.read_termination == '\n' # Restored after the block
+
+    tool._properties.transfer_formats = ["bin"]
+    tool._properties.activated_transfer_format = "bin"
+    np.testing.assert_array_equal(tool.query_data(":FETC?", number_data=10), values)
+
+    with pytest.raises(ValueError):
+        tool._properties.bin_data_chunk_size = 0
+
+def test_tool_query_data_chunked_auto(monkeypatch, values, definite_block):
+    tool = Tool(ToolInfo())
+    tool._properties.bin_data_endianness = "big"
+    tool._properties.bin_data_chunk_size = 8
+    tool._properties.transfer_formats = ["bin"]
+    tool._properties.activated_transfer_format = "bin"
+    timeouts = []
+    class TimedSession(FakeSession):
+        def read(self, session, size):
+            timeouts.append(self.timeout)
+            return FakeSession.read(self, session, size)
+    tool.connect_virtual_interface(TimedSession(lambda message: definite_block[:-1], max_chunk=7))
+    tool.enable_adaptive_timeout(base=100, throughput=1.0, margin=1.0)
+    monkeypatch.setattr(tool, "query_number_data", lambda: pytest.fail("The block header gives the number of data"))
+
+    np.testing.assert_array_equal(tool.query_data(":FETC?"), values)
+    assert timeouts[0] == 100 # Header
+    assert timeouts[-1] == 100 + 1000 * values.nbytes # Payload, sized from the header
@@ -0,0 +1,119 @@
+"""Test for the _broker module."""
+
+
+import gc
+import logging
+import pytest
+import socket
+
+import numpy as np
+
+if not hasattr(socket, "AF_UNIX"):
+    pytest.skip("Unix domain sockets are not available", allow_module_level=True)
+
+import rtestbench._broker as broker
+from rtestbench.core import RTestBenchManager
+from rtestbench.core import Tool
+from rtestbench.core import ToolInfo
+
+
+pytestmark = pytest.mark.skipif(not broker._HAS_SHARED_MEMORY, reason="multiprocessing.shared_memory is not available")
+
+
+class EchoTool(Tool):
+    """Tool answering its requests from memory."""
+
+    def __init__(self):
+        info = ToolInfo()
+        info.model = "Echo"
+        Tool.__init__(self, info)
+        self.sent = []
+
+    def send(self, command):
+        self.sent.append(command)
+
+    def query(self, request):
+        return request.upper()
+
+    def query_data(self, request, number_data="auto"):
+        n = 1000 if number_data == "auto" else number_data
+        return np.arange(n, dtype=np.float32)
+
+    def get_range(self):
+        return np.float64(2e-9)
+
+    def get_info(self):
+        return self._info
+
+
+@pytest.fixture
+def running_broker(tmp_path):
+    """Returns a tuple (broker, tool, socket path) serving an EchoTool in a background thread."""
+
+    rtb = RTestBenchManager(verbose=False, visa_library='@sim')
+    logging.disable(logging.CRITICAL)
+
+    tool = EchoTool()
+    path = tmp_path / "broker.sock"
+    server = broker.Broker(rtb, path, tools={"echo": tool})
+    server.start()
+    yield server, tool, path
+    server.shutdown()
+    rtb.close()
+
+
+def test_framing(running_broker):
+    server, tool, path = running_broker
+    with broker.BrokerClient(path) as client:
+        assert client.list_tools() == {"echo": str(tool._info)}
+        client.send("echo", ":INIT")
+        assert client.query("echo", "*idn?") == "*IDN?"
+        assert client.call("echo", "get_range") == 2e-9
+    assert tool.sent == [":INIT"]
+
+def test_shared_memory_arrays(running_broker):
+    server, tool, path = running_broker
+    with broker.BrokerClient(path) as client:
+        data = client.query_data("echo", ":FETC?", 100000)
+        assert isinstance(data, np.ndarray)
+        assert data.dtype == np.float32
+        assert np.array_equal(data, np.arange(100000))
+
+        # The block is released by the client once the array is no longer used
+        assert len(client._blocks) == 1
+        view = data[10:]
+        del data
+        gc.collect()
+        client.query("echo", "x")
+        assert len(client._blocks) == 1
+        assert view[0] == 10
+        del view
+        gc.collect()
+        client.query("echo", "x")
+        assert len(client._blocks) == 0
+
+        empty = client.query_data("echo", ":FETC?", 0)
+        assert len(empty) == 0 and empty.dtype == np.float32
+
+def test_errors(running_broker):
+    server, tool, path = running_broker
+    with broker.BrokerClient(path) as client:
+        with pytest.raises(KeyError):
+            client.query("toto", "*IDN?")
+        with pytest.raises(AttributeError):
+            client.call("echo", "_notify_subscribers", [])
+        with pytest.raises(AttributeError):
+            client.call("echo", "toto")
+        with pytest.raises(TypeError):
+            client.call("echo", "query")
+        with pytest.raises(TypeError):
+            client.call("echo", "get_info")
+        assert client.query("echo", "ok") == "OK"
+
+def test_several_clients(running_broker):
+    server, tool, path = running_broker
+    clients = [broker.BrokerClient(path) for _ in range(3)]
+    results = [client.query_data("echo", ":FETC?", 10) for client in clients]
+    assert all(np.array_equal(result, np.arange(10)) for result in results)
+    for client in clients:
+        client.close()
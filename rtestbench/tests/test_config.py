@@ -0,0 +1,157 @@
+"""Test for the _config module."""
+
+
+import json
+import logging
+import pytest
+
+import visa
+
+import rtestbench._config as config
+from rtestbench.core import RTestBenchManager
+from rtestbench.core import Tool
+from rtestbench.core import ToolFactory
+from rtestbench.core import ToolInfo
+
+
+B2985_SETTINGS = {
+    "data_transfer_format": ["bin", "double"],
+    "meas_data_types": {"data_types": ["CURRent"]},
+    "trigger_source": "TIMer",
+    "trigger_count": 10,
+    "trigger_timer": 0.1,
+    "enable_amperemeter": None,
+}
+
+BENCH_CONFIG = {
+    "tools": {
+        "electrometer": {"address": "ASRL2985::INSTR", "settings": B2985_SETTINGS},
+        "generic": {"address": "ASRL0::INSTR", "settings": {"reset": None}},
+    }
+}
+
+
+def terminate_simulated_message(tool):
+    """Ends the last message sent to a simulated device, which expects CR+LF whereas the tools send LF only.
+
+    Otherwise, the next tests sharing the simulated device could not identify it.
+    """
+
+    tool._virtual_interface.write_raw(b'\r\n')
+
+
+@pytest.fixture
+def b2985():
+    """Returns a simulated Keysight B2985A."""
+
+    manager = visa.ResourceManager(visa_library='./rtestbench/tests/pyvisasim_devices.yaml@sim')
+    electrometer = ToolFactory(tool_manager=manager).get_tool("ASRL2985::INSTR")
+    yield electrometer
+    terminate_simulated_message(electrometer)
+
+@pytest.fixture
+def rtb_simulated_devices():
+    """Returns a non-verbose RTestBench with simulated devices."""
+
+    rtb = RTestBenchManager(verbose=False, visa_library='./rtestbench/tests/pyvisasim_devices.yaml@sim')
+    logging.disable(logging.CRITICAL)
+
+    return rtb
+
+
+def test_load_config(tmp_path):
+    f = tmp_path / "bench.json"
+    f.write_text(json.dumps(BENCH_CONFIG))
+    assert config.load_config(f) == BENCH_CONFIG
+
+    f = tmp_path / "bench.txt"
+    f.write_text(json.dumps(BENCH_CONFIG))
+    with pytest.raises(ValueError):
+        config.load_config(f)
+
+def test_load_config_yaml(tmp_path):
+    yaml = pytest.importorskip("yaml")
+
+    f = tmp_path / "bench.yaml"
+    f.write_text(yaml.safe_dump(BENCH_CONFIG, sort_keys=False))
+    loaded = config.load_config(f)
+    assert loaded == BENCH_CONFIG
+    assert list(loaded["tools"]["electrometer"]["settings"]) == list(B2985_SETTINGS)
+
+def test_validate_config():
+    with pytest.raises(ValueError):
+        config.validate_config({"toto": {}})
+    with pytest.raises(ValueError):
+        config.validate_config({"tools": {"electrometer": {"settings": {}}}})
+    with pytest.raises(ValueError):
+        config.validate_config({"tools": {"electrometer": {"address": "ASRL0::INSTR", "settings": [1]}}})
+
+
+def test_compile_settings(b2985):
+    commands = config.compile_settings(b2985, B2985_SETTINGS)
+    assert commands == [
+        ":FORMat:DATA REAL,64",
+        ":FORMat:ELEMents:SENSe CURRent",
+        ":TRIGger:ACQuire:SOURce:SIGNal TIMer",
+        ":TRIGger:ACQuire:COUNt 10",
+        ":TRIGger:ACQuire:TIMer 0.1",
+        ":INPut:STATe ON",
+    ]
+    assert b2985._properties.activated_transfer_format == "bin"
+    assert b2985._virtual_interface is not None
+
+    # Invalid values and settings are caught before anything is sent
+    with pytest.raises(ValueError):
+        config.compile_settings(b2985, {"trigger_source": "toto"})
+    with pytest.raises(ValueError):
+        config.compile_settings(b2985, {"toto": 42})
+
+def test_deduplicate_commands():
+    commands = [":TRIG:COUN 1", ":trig:coun 2", "*RST", ":TRIG:COUN 2", ":INIT", ":TRIG:COUN 2", ":trig:coun 3", ":INIT"]
+    assert config.deduplicate_commands(commands) == [":trig:coun 2", "*RST", ":TRIG:COUN 2", ":INIT", ":trig:coun 3", ":INIT"]
+
+def test_deduplicate_commands_order():
+    # The range depends on the function: each setting must stay after the function it applies to
+    commands = [":FUNC VOLT", ":RANG 1", ":FUNC CURR", ":RANG 1e-6", ":FUNC CURR", ":RANG 1e-6"]
+    assert config.deduplicate_commands(commands) == [":FUNC VOLT", ":RANG 1", ":FUNC CURR", ":RANG 1e-6"]
+
+    commands = [":RANG 1", ":FUNC CURR", ":RANG 2"]
+    assert config.deduplicate_commands(commands) == commands
+
+def test_batch_commands():
+    commands = ["*RST", ":TRIG:COUN 1", "INP ON"]
+    assert config.batch_commands(commands) == ["*RST;:TRIG:COUN 1;:INP ON"]
+
+    messages = config.batch_commands(commands, max_length=20)
+    assert messages == ["*RST;:TRIG:COUN 1", ":INP ON"]
+
+def test_apply_plans(b2985):
+    plan = config.compile_plan(b2985, B2985_SETTINGS)
+    assert len(plan) == 1
+    config.apply_plans({b2985: plan})
+
+    # Tool without virtual interface
+    with pytest.raises(RuntimeError):
+        config.apply_plans({b2985: plan, Tool(ToolInfo()): plan})
+
+
+def test_manager_load_config(tmp_path, rtb_simulated_devices):
+    f = tmp_path / "bench.json"
+    f.write_text(json.dumps(BENCH_CONFIG))
+
+    tools = rtb_simulated_devices.load_config(f)
+    assert set(tools) == {"electrometer", "generic"}
+    assert tools["electrometer"]._info.model == "B2985A"
+    assert len(rtb_simulated_devices._attached_tools) == 2
+
+    for tool in tools.values():
+        terminate_simulated_message(tool)
+
+def test_manager_load_config_invalid_settings(tmp_path, rtb_simulated_devices):
+    f = tmp_path / "bench.json"
+    bench_config = {"tools": {"electrometer": {"address": "ASRL2985::INSTR", "settings": {"toto": 1}}}}
+    f.write_text(json.dumps(bench_config))
+
+    with pytest.raises(ValueError):
+        rtb_simulated_devices.load_config(f)
+    assert not rtb_simulated_devices._attached_tools
@@ -11,6 +11,8 @@ import pandas as pd
 import rtestbench
 from rtestbench import constants
 from rtestbench import _chat as chat
+from rtestbench import _events
+from rtestbench import _scpi
 from rtestbench.core import RTestBenchManager
 from rtestbench.core import Tool
 from rtestbench.core import ToolFactory
@@ -89,6 +91,7 @@ def test_toolInfo_attributes(toolInfo_empty):
     assert hasattr(toolInfo_empty, "serial_number")
     assert hasattr(toolInfo_empty, "software_version")
     assert hasattr(toolInfo_empty, "interface")
+    assert hasattr(toolInfo_empty, "address")
 
 def test_toolInfo_init(toolInfo_empty):
     assert toolInfo_empty.family is None
@@ -97,6 +100,7 @@ def test_toolInfo_init(toolInfo_empty):
     assert toolInfo_empty.serial_number is None
     assert toolInfo_empty.software_version is None
     assert toolInfo_empty.interface is None
+    assert toolInfo_empty.address is None
 
 def test_toolInfo_interface(toolInfo_empty):
     toolInfo_empty.interface = visa.constants.InterfaceType.gpib
@@ -347,13 +351,61 @@ def test_toolProperties_activatedtransferformat(toolProperties_empty):
 
 
 def test_toolProperties_getproperties(toolProperties_empty):
-    assert toolProperties_empty.get_properties() == toolProperties_empty.__dict__
+    properties = toolProperties_empty.get_properties()
+    assert properties["bin_data_type"] == 'f'
+    assert properties["activated_transfer_format"] is None
+
+    toolProperties_empty.update_properties(tester="toto")
+    assert toolProperties_empty.get_properties()["tester"] == "toto"
 
 def test_toolProperties_updateproperties(toolProperties_empty):
     toolProperties_empty.update_properties(tester="toto")
     assert hasattr(toolProperties_empty, "tester")
     assert toolProperties_empty.tester == "toto"
 
+    toolProperties_empty.tester = "titi" # Declared
+    assert toolProperties_empty.tester == "titi"
+
+    toolProperties_empty.update_properties(bin_data_type="double") # Common properties are validated
+    assert toolProperties_empty.bin_data_type == 'd'
+    with pytest.raises(ValueError):
+        toolProperties_empty.update_properties(bin_data_type="toto")
+
+def test_toolProperties_slots(toolProperties_empty, toolInfo_empty):
+    assert not hasattr(toolProperties_empty, "__dict__")
+    assert not hasattr(toolInfo_empty, "__dict__")
+
+    # Undeclared properties
+    with pytest.raises(AttributeError):
+        toolProperties_empty.tester = "toto"
+    with pytest.raises(AttributeError):
+        toolProperties_empty.tester
+    with pytest.raises(AttributeError):
+        toolInfo_empty.tester = "toto"
+
+    # Unhashable values
+    with pytest.raises(ValueError):
+        toolProperties_empty.bin_data_type = ['f']
+
+def test_toolProperties_snapshot(toolProperties_empty):
+    toolProperties_empty.update_properties(tester="toto")
+    snapshot = toolProperties_empty.snapshot()
+
+    toolProperties_empty.bin_data_type = "double"
+    toolProperties_empty.read_msg_terminator = "CR"
+    toolProperties_empty.tester = "titi"
+
+    toolProperties_empty.restore(snapshot)
+    assert toolProperties_empty.bin_data_type == 'f'
+    assert toolProperties_empty.read_msg_terminator == '\n'
+    assert toolProperties_empty.tester == "toto"
+    assert "_extensions" not in ToolProperties._STATE_SLOTS
+    assert set(ToolProperties._STATE_SLOTS) | {"_extensions"} == set(ToolProperties.__slots__)
+
+def test_typed_records():
+    assert set(ToolInfo.__annotations__) == set(ToolInfo.__slots__)
+    assert set(ToolProperties.__annotations__) == set(ToolProperties.__slots__)
+
 # --------
 
 def test_toolFactory_attributes(toolFactory):
@@ -436,12 +488,22 @@ def test_toolFactory_get_tool(toolFactory, toolFactoryCustom):
     assert isinstance(test_tool, rtestbench.tools.keysight.electrometer.b298x.B2985)
     assert test_tool._info.manufacturer == "Keysight Technologies"
     assert test_tool._info.model == "B2985A"
+    assert test_tool._info.address == "ASRL2985::INSTR"
 
     # Generic tool
     test_tool = toolFactoryCustom.get_tool("ASRL0::INSTR") # DOES NOT WORK for USB or TCP/IP devices
     assert isinstance(test_tool, rtestbench.core.Tool)
     assert test_tool._info.manufacturer == "Generic Manufacturer"
 
+def test_toolFactory_probe_tool(toolFactory):
+    # Tool that cannot be reached: only the address is known
+    tool_info = toolFactory.probe_tool("TCPIP0::localhost::inst0::INSTR")
+    assert tool_info.address == "TCPIP0::localhost::inst0::INSTR"
+    assert tool_info.manufacturer is None
+
+    tool_info = toolFactory.probe_tool("toto::INSTR")
+    assert tool_info.address == "toto::INSTR"
+
 # --------
 
 def test_tool_init(tool_empty):
@@ -524,6 +586,50 @@ def test_tool_query(fakeToolWithoutInterface, fakeTool):
     with pytest.raises(RuntimeError):
         fakeTool.query("*IDN?")
 
+def test_tool_query_cached(fakeTool):
+    answer = fakeTool.query_cached("*IDN?")
+    assert isinstance(answer, str)
+
+    fakeTool._virtual_interface.read_termination = '\r' # The tool cannot answer anymore
+    assert fakeTool.query_cached("*IDN?") == answer
+    fakeTool.clear_query_cache()
+    with pytest.raises(IOError):
+        fakeTool.query_cached("*IDN?")
+    fakeTool._virtual_interface.read_termination = '\n'
+
+def test_tool_query_cached_volatile(monkeypatch, fakeToolWithoutInterface):
+    answers = iter(["10", "20"])
+    monkeypatch.setattr(fakeToolWithoutInterface, "query", lambda request: next(answers))
+    assert fakeToolWithoutInterface.query_int("quantity?", cached=True) == 10
+    assert fakeToolWithoutInterface.query_int("quantity?", cached=True) == 10
+
+    fakeToolWithoutInterface._volatile_query_cache["volatile?"] = "1"
+    with fakeToolWithoutInterface.record_commands():
+        fakeToolWithoutInterface.send(":INITiate")
+    assert "volatile?" not in fakeToolWithoutInterface._volatile_query_cache
+    assert fakeToolWithoutInterface._query_cache == {"quantity?": "10"}
+
+def test_tool_query_cached_reset(fakeToolWithoutInterface):
+    fakeToolWithoutInterface._query_cache["*IDN?"] = "toto"
+    with fakeToolWithoutInterface.record_commands():
+        fakeToolWithoutInterface.send(":TRIG:COUN 10")
+        assert fakeToolWithoutInterface._query_cache
+        fakeToolWithoutInterface.send(":trig:coun 10;*rst") # e.g., in a configuration batch
+    assert not fakeToolWithoutInterface._query_cache
+
+def test_tool_query_typed(monkeypatch, fakeToolWithoutInterface):
+    answers = {"int?": "+5.000000E+00", "float?": "+1.000000E-03", "bool?": "ON", "keyword?": "CURR", "wrong?": "1.5"}
+    monkeypatch.setattr(fakeToolWithoutInterface, "query", answers.get)
+
+    assert fakeToolWithoutInterface.query_int("int?") == 5
+    assert fakeToolWithoutInterface.query_float("float?") == 1e-3
+    assert fakeToolWithoutInterface.query_bool("bool?") is True
+    assert fakeToolWithoutInterface.query_keyword("keyword?", _scpi.ScpiKeywords("CURRent", "VOLTage")) == "CURRent"
+    with pytest.raises(ValueError):
+        fakeToolWithoutInterface.query_int("wrong?")
+    with pytest.raises(ValueError):
+        fakeToolWithoutInterface.query_keyword("keyword?", _scpi.ScpiKeywords("VOLTage"))
+
 def test_tool_querydata(fakeToolWithoutInterface, fakeTool):
     # No virtual interface
     with pytest.raises(UnboundLocalError):
@@ -568,6 +674,52 @@ def test_tool_querydata(fakeToolWithoutInterface, fakeTool):
     with pytest.raises(NotImplementedError):
         data = fakeTool.query_data('request')
 
+def test_tool_subscribe(fakeTool):
+    received = []
+    fakeTool._properties.transfer_formats = constants.RTB_TRANSFERT_FORMATS
+    fakeTool._properties.activated_transfer_format = "bin"
+
+    fakeTool.subscribe(received.append)
+    fakeTool.subscribe(received.append)
+    data = fakeTool.query_data('request', number_data=1)
+    assert len(received) == 1
+    assert received[0] is data
+
+    fakeTool.unsubscribe(received.append)
+    fakeTool.query_data('request', number_data=1)
+    assert len(received) == 1
+
+def test_tool_event_log(tmp_path, fakeTool):
+    event_log = _events.EventLog(tmp_path / "bench")
+    fakeTool.set_event_log(event_log)
+    fakeTool.send('command')
+    fakeTool.query('*IDN?')
+    fakeTool._properties.transfer_formats = constants.RTB_TRANSFERT_FORMATS
+    fakeTool._properties.activated_transfer_format = "bin"
+    fakeTool._properties.data_container = list
+    fakeTool.query_data('request', number_data=1)
+    with fakeTool.record_commands():
+        fakeTool.send('recorded only')
+    fakeTool.set_event_log(None)
+    fakeTool.send('command')
+    event_log.close()
+
+    frame = _events.read_events_frame(tmp_path / "bench")
+    assert list(frame["kind"]) == ["send", "query", "query_data"]
+    assert list(frame["command"]) == ["command", "*IDN?", "request"]
+    assert (frame["tool"] == str(fakeTool._info)).all()
+    assert frame["bytes"][0] == len('command')
+    assert frame["bytes"][2] == 4 # One float, whatever the container
+
+def test_tool_record_commands_restore(fakeToolWithoutInterface):
+    with pytest.raises(IOError):
+        with fakeToolWithoutInterface.record_commands() as commands:
+            fakeToolWithoutInterface._properties.bin_data_type = "double"
+            fakeToolWithoutInterface.send('recorded only')
+            fakeToolWithoutInterface.query('*IDN?')
+    assert commands == ['recorded only']
+    assert fakeToolWithoutInterface._properties.bin_data_type == 'f' # Restored
+
 def test_tool_set_timeout(fakeTool):
     fakeTool.set_timeout(42)
     assert fakeTool._properties.timeout == 42
@@ -671,6 +823,22 @@ def test_close_all_tools(rtb_simulated_devices):
     rtb_simulated_devices.close_all_tools()
     assert len(rtb_simulated_devices._attached_tools) == 0
 
+def test_detach_tool(rtb_simulated_devices):
+    tool = rtb_simulated_devices.attach_tool("ASRL0::INSTR")
+    session = tool._virtual_interface
+    rtb_simulated_devices.detach_tool(tool)
+    assert tool not in rtb_simulated_devices._attached_tools
+    assert tool._virtual_interface is None
+    session.write_termination = '\r\n' # Necessary for the simulated device to identify itself again
+
+    # The pooled session is reused
+    tool = rtb_simulated_devices.attach_tool("ASRL0::INSTR")
+    assert tool._virtual_interface is session
+    assert tool._reconnect_handler is not None
+
+    with pytest.raises(ValueError):
+        rtb_simulated_devices.detach_tool(Tool(ToolInfo()))
+
 
 # Verbosity
 def test_verbosity(capsys):
@@ -685,6 +853,22 @@ def test_detect_tools(rtb_simulated_visaRM):
     detected_tools = rtb_simulated_visaRM.detect_tools()
     assert detected_tools
     assert isinstance(detected_tools, tuple)
+    assert all(isinstance(tool_info, ToolInfo) for tool_info in detected_tools)
+    assert "ASRL1::INSTR" in [tool_info.address for tool_info in detected_tools]
+
+    # Query filter and cache
+    detected_tools = rtb_simulated_visaRM.detect_tools("ASRL?*::INSTR")
+    assert all(tool_info.address.startswith("ASRL") for tool_info in detected_tools)
+    cached_tools = rtb_simulated_visaRM.detect_tools("ASRL?*::INSTR")
+    assert [tool_info.address for tool_info in cached_tools] == [tool_info.address for tool_info in detected_tools]
+
+def test_detect_tools_attached(rtb_simulated_devices):
+    tool = rtb_simulated_devices.attach_tool("ASRL0::INSTR")
+    detected_tools = rtb_simulated_devices.detect_tools()
+    assert tool._info in detected_tools # Attached tools are not probed again
+
+def test_detect_tools_no_device(rtb_no_device):
+    assert rtb_no_device.detect_tools(identify=True) == tuple()
 
 def test_print_available_tools(capsys, rtb_simulated_visaRM, rtb_no_device):
     rtb_simulated_visaRM.print_available_tools()
@@ -717,6 +901,38 @@ def test_attach_tool(rtb_simulated_visaRM, rtb_simulated_devices):
     assert len(rtb_simulated_devices._attached_tools) == 1
 
 
+
+def test_attach_tools_backends():
+    rtb = RTestBenchManager(verbose=False, visa_library='@sim', backends={"ASRL": './rtestbench/tests/pyvisasim_devices.yaml@sim'})
+    assert rtb._router.backend_of("ASRL0::INSTR") != rtb._router.primary
+    assert "ASRL2985::INSTR" in [tool_info.address for tool_info in rtb.detect_tools()]
+
+    tools = rtb.attach_tools(["ASRL0::INSTR", "ASRL2985::INSTR"])
+    assert [tool._info.address for tool in tools] == ["ASRL0::INSTR", "ASRL2985::INSTR"]
+    assert tools[1]._info.model == "B2985A"
+    with pytest.raises(ValueError): # Neither tool can be attached
+        rtb.attach_tools(["ASRL1::INSTR", "toto::INSTR"])
+    rtb.close()
+
+def test_attach_tools_rollback(rtb_simulated_devices):
+    with pytest.raises(ValueError): # The first tool connects, but not the second one
+        rtb_simulated_devices.attach_tools(["ASRL0::INSTR", "toto::INSTR"])
+    assert rtb_simulated_devices._attached_tools == []
+    assert "ASRL0::INSTR" not in rtb_simulated_devices._pool
+
+    tools = rtb_simulated_devices.attach_tools(["ASRL0::INSTR"])
+    assert rtb_simulated_devices._attached_tools == list(tools)
+
+def test_event_log(tmp_path, rtb_simulated_devices):
+    rtb_simulated_devices.enable_event_log(tmp_path / "bench")
+    test_tool = rtb_simulated_devices.attach_tool("ASRL0::INSTR")
+    assert test_tool._event_log is rtb_simulated_devices._event_log
+
+    rtb_simulated_devices.disable_event_log()
+    assert test_tool._event_log is None
+    assert rtb_simulated_devices._event_log is None
+
+
 # Data management
 def test_log_data(tmp_path, rtb_quiet):
     d = tmp_path
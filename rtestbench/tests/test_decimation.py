@@ -0,0 +1,86 @@
+"""Test for the decimation module."""
+
+
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from rtestbench.post_processing import decimation
+
+
+@pytest.fixture
+def noisy_signal():
+    """Returns a tuple (t, y) of a long noisy sine wave with a single spike."""
+
+    t = np.linspace(0, 1, 100003)
+    y = np.sin(2*np.pi*5*t) + 0.01*np.random.RandomState(42).standard_normal(len(t))
+    y[31415] = 10
+
+    return t, y
+
+
+def test_minmax_keeps_extrema(noisy_signal):
+    t, y = noisy_signal
+    x_dec, y_dec = decimation.minmax(t, y, n_buckets=500)
+
+    assert len(y_dec) <= 2*500
+    assert y_dec.max() == y.max()
+    assert y_dec.min() == y.min()
+    assert np.all(np.diff(x_dec) >= 0)
+
+def test_minmax_short_signal():
+    t = np.arange(10)
+    x_dec, y_dec = decimation.minmax(t, t, n_buckets=10)
+    assert np.array_equal(x_dec, t)
+
+def test_minmax_memmap(tmp_path, noisy_signal):
+    t, y = noisy_signal
+    y_map = np.memmap(tmp_path / "y.dat", dtype=y.dtype, mode='w+', shape=y.shape)
+    y_map[:] = y
+
+    assert np.array_equal(decimation.minmax(t, y_map, 500)[1], decimation.minmax(t, y, 500)[1])
+
+def test_lttb(noisy_signal):
+    t, y = noisy_signal
+    x_dec, y_dec = decimation.lttb(t, y, n_out=1000)
+
+    assert len(y_dec) == 1000
+    assert x_dec[0] == t[0]
+    assert x_dec[-1] == t[-1]
+    assert y_dec.max() == y.max()
+    assert np.all(np.diff(x_dec) > 0)
+
+def test_lttb_series_and_datetime():
+    t = pd.Series(pd.date_range("2020-01-01", periods=10000, freq="ms"), name="time")
+    y = pd.Series(np.random.RandomState(0).standard_normal(10000), name="current")
+    x_dec, y_dec = decimation.lttb(t, y, n_out=100)
+
+    assert len(x_dec) == 100
+    assert x_dec.dtype.kind == 'M'
+
+def test_decimate_method(noisy_signal):
+    t, y = noisy_signal
+    assert len(decimation.decimate(t, y, 1000, method='lttb')[1]) == 1000
+    assert len(decimation.decimate(t, y, 1000, method='minmax')[1]) <= 1000
+    with pytest.raises(ValueError):
+        decimation.decimate(t, y, 1000, method='toto')
+
+def test_pyramid(noisy_signal):
+    t, y = noisy_signal
+    pyramid = decimation.DecimationPyramid(t, y)
+
+    x_dec, y_dec = pyramid.decimate(n_out=2000)
+    assert len(y_dec) <= 2000
+    assert y_dec.max() == y.max()
+
+    # Zoom around the spike: the spike stays visible and only the visible range is returned
+    x_dec, y_dec = pyramid.decimate(0.3, 0.33, n_out=2000)
+    assert y_dec.max() == y.max()
+    assert x_dec[1] >= 0.29
+    assert x_dec[-2] <= 0.34
+
+    # Deep zoom: raw samples
+    x_dec, y_dec = pyramid.decimate(0.5, 0.5001, n_out=2000)
+    assert np.all(np.diff(x_dec) > 0)
+    assert len(x_dec) <= 20
@@ -0,0 +1,103 @@
+"""Test for the _discovery module."""
+
+
+import pytest
+import threading
+import time
+
+import visa
+
+import rtestbench._discovery as discovery
+
+
+class FakeResourceManager(object):
+    """Lists a settable tuple of addresses and counts the calls."""
+
+    def __init__(self, addresses):
+        self.addresses = addresses
+        self.n_listings = 0
+        self.n_probes = 0
+        self.lock = threading.Lock()
+
+    def list_resources(self, query):
+        self.n_listings += 1
+        if not self.addresses:
+            raise visa.VisaIOError(visa.constants.VI_ERROR_RSRC_NFOUND)
+        return tuple(address for address in self.addresses if query == discovery.DISCOVERY_QUERY_ALL or address.startswith(query.split('?')[0]))
+
+    def probe(self, address):
+        with self.lock:
+            self.n_probes += 1
+        time.sleep(0.05)
+        return "info @ {}".format(address)
+
+
+@pytest.fixture
+def fake_rm():
+    return FakeResourceManager(("ASRL1::INSTR", "USB0::1::INSTR", "GPIB0::22::INSTR"))
+
+@pytest.fixture
+def cache(fake_rm):
+    cache = discovery.DiscoveryCache(fake_rm.list_resources, fake_rm.probe, ttl=60)
+    yield cache
+    cache.stop_background_refresh()
+
+
+def test_list_resources_cached(fake_rm, cache):
+    assert cache.list_resources() == fake_rm.addresses
+    assert cache.list_resources() == fake_rm.addresses
+    assert fake_rm.n_listings == 1
+
+    cache.list_resources(refresh=True)
+    assert fake_rm.n_listings == 2
+
+def test_list_resources_ttl(fake_rm):
+    cache = discovery.DiscoveryCache(fake_rm.list_resources, fake_rm.probe, ttl=0)
+    cache.list_resources()
+    cache.list_resources()
+    assert fake_rm.n_listings == 2
+
+def test_list_resources_query(fake_rm, cache):
+    assert cache.list_resources("USB?*::INSTR") == ("USB0::1::INSTR",)
+    assert cache.list_resources() == fake_rm.addresses
+    assert fake_rm.n_listings == 2 # One list per query
+
+def test_list_resources_no_device(fake_rm, cache):
+    fake_rm.addresses = tuple()
+    assert cache.list_resources() == tuple()
+
+def test_identify_parallel(fake_rm, cache):
+    addresses = cache.list_resources()
+    start = time.perf_counter()
+    identities = cache.identify(addresses)
+    assert time.perf_counter() - start < 0.05 * len(addresses)
+    assert identities == {address: "info @ {}".format(address) for address in addresses}
+
+    cache.identify(addresses)
+    assert fake_rm.n_probes == len(addresses) # Probed once
+
+def test_identify_incremental(fake_rm, cache):
+    cache.identify(cache.list_resources())
+    cache.remember("TCPIP0::1::INSTR", "attached")
+
+    fake_rm.addresses = ("ASRL1::INSTR", "TCPIP0::1::INSTR")
+    addresses = cache.list_resources(refresh=True)
+    assert cache.get_identity("USB0::1::INSTR") is None # Unplugged
+    assert cache.identify(addresses)["TCPIP0::1::INSTR"] == "attached"
+    assert fake_rm.n_probes == 3
+
+def test_invalidate(fake_rm, cache):
+    cache.identify(cache.list_resources())
+    cache.invalidate("ASRL1::INSTR")
+    assert cache.get_identity("ASRL1::INSTR") is None
+    assert cache.get_identity("USB0::1::INSTR") is not None
+
+    cache.list_resources()
+    assert fake_rm.n_listings == 2
+
+def test_background_refresh(fake_rm, cache):
+    cache.list_resources()
+    cache.start_background_refresh(period=0.01)
+    time.sleep(0.1)
+    cache.stop_background_refresh()
+    assert fake_rm.n_listings > 2
@@ -0,0 +1,88 @@
+"""Test for the _events module."""
+
+
+import pytest
+import time
+
+import numpy as np
+import pandas as pd
+
+import rtestbench._events as events
+
+
+@pytest.fixture
+def event_log(tmp_path):
+    """Returns an EventLog with small segments."""
+
+    log = events.EventLog(tmp_path / "bench", max_bytes=10*events.EVENT_DTYPE.itemsize, buffer_size=4)
+    yield log
+    log.close()
+
+
+def test_event_dtype():
+    assert events.EVENT_DTYPE.itemsize == 24
+
+def test_intern(event_log):
+    assert event_log.intern("B2985") == 0
+    assert event_log.intern("*IDN?") == 1
+    assert event_log.intern("B2985") == 0
+
+def test_command_header():
+    assert events.command_header("*IDN?") == "*IDN?"
+    assert events.command_header(":SOUR:VOLT 1.5") == ":SOUR:VOLT"
+    assert events.command_header(":SOUR:VOLT 1.5;:OUTP ON") == ":SOUR:VOLT;:OUTP"
+
+def test_record_arguments(tmp_path, event_log):
+    for value in range(10):
+        event_log.record(0, events.EVENT_SEND, ":SOUR:VOLT {}".format(value), 14, time.time())
+    event_log.flush()
+
+    assert events.load_strings(tmp_path / "bench") == [":SOUR:VOLT"]
+    assert (events.read_events_frame(tmp_path / "bench")["command"] == ":SOUR:VOLT").all()
+
+def test_record_and_read(tmp_path, event_log):
+    tool = event_log.intern("B2985")
+    start = time.time()
+    event_log.record(tool, events.EVENT_SEND, ":INIT", 5, start)
+    event_log.record(tool, events.EVENT_QUERY, ":FETC?", 128, start, events.EVENT_STATUS_ERROR)
+
+    assert len(events.read_events(tmp_path / "bench")) == 0 # Still buffered
+    event_log.flush()
+
+    records = events.read_events(tmp_path / "bench")
+    assert len(records) == 2
+    assert np.array_equal(records['bytes'], [5, 128])
+    assert np.all(records['timestamp'] == start)
+    assert np.all(records['duration'] >= 0)
+
+    frame = events.read_events_frame(tmp_path / "bench")
+    assert list(frame["command"]) == [":INIT", ":FETC?"]
+    assert list(frame["kind"]) == ["send", "query"]
+    assert list(frame["status"]) == ["ok", "error"]
+    assert (frame["tool"] == "B2985").all()
+    assert pd.api.types.is_datetime64_any_dtype(frame["timestamp"])
+
+def test_rotation(tmp_path):
+    log = events.EventLog(tmp_path / "bench", max_bytes=10*events.EVENT_DTYPE.itemsize, max_segments=2, buffer_size=5)
+    for i in range(40):
+        log.record(0, events.EVENT_SEND, "cmd", i, time.time())
+    log.close()
+
+    assert len(events.segment_paths(tmp_path / "bench")) == 2
+    records = events.read_events(tmp_path / "bench")
+    assert records['bytes'][-1] == 39
+    assert np.all(np.diff(records['bytes']) == 1)
+
+def test_reopen(tmp_path):
+    log = events.EventLog(tmp_path / "bench")
+    log.record(log.intern("B2985"), events.EVENT_SEND, ":INIT", 5, time.time())
+    log.close()
+
+    log = events.EventLog(tmp_path / "bench")
+    assert log.intern("B2985") == 0
+    log.record(log.intern("B2987"), events.EVENT_SEND, ":INIT", 5, time.time())
+    log.close()
+
+    frame = events.read_events_frame(tmp_path / "bench")
+    assert list(frame["tool"]) == ["B2985", "B2987"]
+    assert list(frame["command"]) == [":INIT", ":INIT"]
@@ -6,6 +6,7 @@ import pytest
 from rtestbench.core import ToolInfo
 from rtestbench.tools.keysight import _factory as keysight_factory
 from rtestbench.tools.keysight.electrometer import b298x
+from rtestbench.tools.keysight.multimeter import k344xx
 
 
 @pytest.fixture
@@ -57,14 +58,27 @@ def info_keysight_b2897():
     
     return tool_info
 
+@pytest.fixture
+def info_keysight_34465():
+    tool_info = ToolInfo()
+
+    tool_info.family = "multimeter"
+    tool_info.manufacturer = "Keysight Technologies"
+    tool_info.model = "34465A"
+    
+    return tool_info
+
 
 # Keysight factory
-def test_get_keysight_tool(info_unknown, info_keysight_b2891):
+def test_get_keysight_tool(info_unknown, info_keysight_b2891, info_keysight_34465):
     with pytest.raises(ValueError):
         keysight_factory.get_keysight_tool(info_unknown)
     
     test_electrometer = keysight_factory.get_keysight_tool(info_keysight_b2891)
     assert isinstance(test_electrometer, b298x.B2981)
+
+    test_multimeter = keysight_factory.get_keysight_tool(info_keysight_34465)
+    assert isinstance(test_multimeter, k344xx.K34465)
     
 def test_get_keysight_electrometer(info_unknown, info_keysight_b2891, info_keysight_b2893, info_keysight_b2895, info_keysight_b2897):
     with pytest.raises(ValueError):
@@ -81,3 +95,12 @@ def test_get_keysight_electrometer(info_unknown, info_keysight_b2891, info_keysi
 
     test_electrometer = keysight_factory.get_keysight_electrometer(info_keysight_b2897)
     assert isinstance(test_electrometer, b298x.B2987)
+
+def test_get_keysight_multimeter(info_unknown, info_keysight_b2891, info_keysight_34465):
+    with pytest.raises(ValueError):
+        keysight_factory.get_keysight_multimeter(info_unknown)
+    with pytest.raises(ValueError):
+        keysight_factory.get_keysight_multimeter(info_keysight_b2891)
+
+    test_multimeter = keysight_factory.get_keysight_multimeter(info_keysight_34465)
+    assert isinstance(test_multimeter, k344xx.K34465)
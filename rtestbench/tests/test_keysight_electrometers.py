@@ -46,6 +46,48 @@ def test_B298X_init_properties(fakeB298xWithoutInterface):
     assert fakeB298xWithoutInterface._properties.activated_subview_mode == None
 
 
+def test_B298X_bus_trigger(fakeB298xWithoutInterface):
+    with fakeB298xWithoutInterface.record_commands() as commands:
+        fakeB298xWithoutInterface.set_bus_trigger(5)
+        fakeB298xWithoutInterface.arm_trigger()
+    assert commands == [":ARM:ACQuire:SOURce:SIGNal BUS", ":ARM:ACQuire:COUNt 1",
+                        ":TRIGger:ACQuire:SOURce:SIGNal AINT", ":TRIGger:ACQuire:COUNt 5", ":INITiate:IMMediate:ACQuire"]
+
+def test_B298X_keywords():
+    assert "CHARge" in b298x.KEYSIGHT_B2985_MEAS_DATA_TYPES
+    assert "temp" in b298x.KEYSIGHT_B2985_MEAS_DATA_TYPES
+    assert "ARge" not in b298x.KEYSIGHT_B2985_MEAS_DATA_TYPES # Used to be a substring of a str
+    assert "VOLT" not in b298x.KEYSIGHT_B2981_MEAS_DATA_TYPES
+    assert len(b298x.KEYSIGHT_B298X_TRIGGER_SOURCES) == 14
+
+def test_B2985_keywords():
+    electrometer = b298x.B2985(ToolInfo())
+    with electrometer.record_commands() as commands:
+        electrometer.set_trigger_source("tim")
+        electrometer.set_meas_data_types(["CURR", "time"])
+        electrometer.set_view_mode("roll")
+        electrometer.set_display_ydata_type("volt")
+        with pytest.raises(ValueError):
+            electrometer.set_trigger_source("TI")
+        with pytest.raises(ValueError):
+            electrometer.set_meas_data_types(["CURR", "ent"])
+    assert commands == [":TRIGger:ACQuire:SOURce:SIGNal TIMer", ":FORMat:ELEMents:SENSe CURRent,TIME",
+                        ":DISPlay:VIEW ROLL", ":DISPlay:VIEW:ROLL:Y:ELEMent VOLTage"]
+    assert electrometer._properties.activated_meas_data_types == ["CURRent", "TIME"]
+    assert electrometer._properties.activated_display_ydata_type == "VOLTage"
+
+def test_B298X_expected_acquisition_time(fakeB298xWithoutInterface):
+    with fakeB298xWithoutInterface.record_commands():
+        assert fakeB298xWithoutInterface.expected_acquisition_time() == 0.0 # Unknown: cannot be queried
+
+        fakeB298xWithoutInterface.set_aperture_time(0.1)
+        fakeB298xWithoutInterface.set_trigger_count(5)
+        assert fakeB298xWithoutInterface.expected_acquisition_time() == pytest.approx(0.5)
+
+        fakeB298xWithoutInterface.set_trigger_count_max()
+        assert fakeB298xWithoutInterface._properties.activated_trigger_count is None
+
+
 @pytest.mark.keysight_b2985
 def test_B2985_init(realB2985):
     assert realB2985._info.family == "electrometer"
@@ -0,0 +1,102 @@
+"""Test for the Keysight multimeter modules."""
+
+
+import numpy as np
+import pytest
+import visa
+
+import rtestbench._block as block
+from rtestbench import constants
+from rtestbench.core import ToolInfo
+from rtestbench.core import ToolFactory
+from rtestbench.tools.keysight.multimeter import k344xx
+from rtestbench.tests._test_facilities import FakeSession
+
+
+def fetch_session(readings: np.ndarray) -> FakeSession:
+    """Returns an in-memory VISA session answering :FETCh? with an IEEE binary block of readings."""
+
+    message = block.encode_block(readings, '>f8')
+    return FakeSession(lambda request: message if request == ":FETCh?" else None)
+
+
+@pytest.fixture
+def fake344xxWithoutInterface():
+    info = ToolInfo()
+    info.serial_number = "42"
+    info.software_version = "A.02.14"
+
+    return k344xx.K344XX(info)
+
+@pytest.fixture
+def simulated34465():
+    tool_factory = ToolFactory(visa.ResourceManager(visa_library='./rtestbench/tests/pyvisasim_devices.yaml@sim'))
+    multimeter = tool_factory.get_tool("ASRL34465::INSTR")
+    multimeter._virtual_interface.write_termination = '\r\n' # As expected by the simulated serial line
+    return multimeter
+
+
+def test_344XX_init(fake344xxWithoutInterface):
+    assert fake344xxWithoutInterface._info.family == "multimeter"
+
+    assert fake344xxWithoutInterface._properties.transfer_formats == constants.RTB_TRANSFERT_FORMATS
+    assert fake344xxWithoutInterface._properties.bin_data_endianness == "big"
+    assert fake344xxWithoutInterface._properties.bin_data_header == "ieee"
+    assert fake344xxWithoutInterface._properties.bin_data_type == 'd'
+    assert fake344xxWithoutInterface._properties.activated_function == "VOLTage:DC"
+
+def test_344XX_function(fake344xxWithoutInterface):
+    with fake344xxWithoutInterface.record_commands() as commands:
+        fake344xxWithoutInterface.set_function("curr", "ac")
+        fake344xxWithoutInterface.set_nplc(10)
+        fake344xxWithoutInterface.set_function("FRES")
+        fake344xxWithoutInterface.set_autorange(True)
+        with pytest.raises(ValueError):
+            fake344xxWithoutInterface.set_function("FREQ", "AC")
+        with pytest.raises(ValueError):
+            fake344xxWithoutInterface.set_function("VOLTS")
+    assert commands == [":SENSe:FUNCtion \"CURRent:AC\"", ":SENSe:CURRent:AC:NPLCycles 10",
+                        ":SENSe:FUNCtion \"FRESistance\"", ":SENSe:FRESistance:RANGe:AUTO ON"]
+
+def test_344XX_buffered_measurement(fake344xxWithoutInterface):
+    with fake344xxWithoutInterface.record_commands() as commands:
+        fake344xxWithoutInterface.configure_buffered_measurement(1000, sample_timer=1E-03)
+        fake344xxWithoutInterface.arm_buffered_measurement()
+    assert commands == [":TRIGger:COUNt 1", ":SAMPle:COUNt 1000", ":SAMPle:SOURce TIMer", ":SAMPle:TIMer 0.001", ":INITiate:IMMediate"]
+    assert fake344xxWithoutInterface.expected_acquisition_time() == pytest.approx(1.0)
+
+    with fake344xxWithoutInterface.record_commands() as commands:
+        fake344xxWithoutInterface.configure_buffered_measurement(10)
+        fake344xxWithoutInterface.set_bus_trigger(5)
+    assert commands[2:] == [":SAMPle:SOURce IMMediate", ":TRIGger:SOURce BUS", ":TRIGger:COUNt 1", ":SAMPle:COUNt 5"]
+    assert fake344xxWithoutInterface.expected_acquisition_time() == 0.0
+
+def test_344XX_fetch_binary(fake344xxWithoutInterface):
+    readings = np.linspace(0.0, 1.0, 1000)
+    session = fetch_session(readings)
+    fake344xxWithoutInterface.connect_virtual_interface(session)
+
+    fake344xxWithoutInterface.set_data_transfer_format("bin", "double")
+    assert session.written == [":FORMat:DATA REAL,64"]
+
+    out = np.empty(1000, dtype='>f8')
+    data = fake344xxWithoutInterface.fetch_buffered_data(out)
+    assert np.shares_memory(data, out) # Streamed into the buffer
+    np.testing.assert_array_equal(data, readings)
+
+    with pytest.raises(NotImplementedError):
+        fake344xxWithoutInterface.set_data_transfer_format("bin", "int16")
+
+def test_344XX_simulated(simulated34465):
+    assert isinstance(simulated34465, k344xx.K34465)
+    assert simulated34465._info.family == "multimeter"
+
+    simulated34465.configure_buffered_measurement(3, sample_timer=0.01)
+    assert simulated34465.get_sample_count() == 3
+    assert simulated34465.get_sample_source() == "TIMer"
+    assert simulated34465.get_sample_timer() == pytest.approx(0.01)
+
+    simulated34465.set_data_transfer_format("ascii", 'e')
+    simulated34465.arm_buffered_measurement()
+    assert simulated34465.query_number_data() == 3
+    np.testing.assert_allclose(simulated34465.fetch_buffered_data(), [1E-03, 2E-03, 3E-03])
@@ -0,0 +1,60 @@
+"""Test for the live plotting module."""
+
+
+import pytest
+
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+
+from rtestbench.core import Tool
+from rtestbench.core import ToolInfo
+from rtestbench.post_processing import live
+
+
+@pytest.fixture
+def ring_buffer():
+    return live.RingBuffer(capacity=10)
+
+
+def test_ringbuffer_fill(ring_buffer):
+    ring_buffer.extend([1, 2, 3])
+    x, y = ring_buffer.snapshot()
+    assert np.array_equal(y, [1, 2, 3])
+    assert np.array_equal(x, [0, 1, 2])
+    assert len(ring_buffer) == 3
+
+def test_ringbuffer_wrap(ring_buffer):
+    ring_buffer.extend(np.arange(8))
+    ring_buffer.extend(np.arange(8, 13))
+    x, y = ring_buffer.snapshot()
+    assert np.array_equal(y, np.arange(3, 13))
+    assert np.array_equal(x, np.arange(3, 13))
+    assert ring_buffer.count == 13
+
+    ring_buffer.extend(np.arange(100), x_data=np.arange(100) * 0.5)
+    x, y = ring_buffer.snapshot()
+    assert np.array_equal(y, np.arange(90, 100))
+    assert np.array_equal(x, np.arange(90, 100) * 0.5)
+
+def test_ringbuffer_scalar(ring_buffer):
+    ring_buffer.extend(4.2)
+    assert ring_buffer.count == 1
+    assert ring_buffer.snapshot()[1][0] == 4.2
+
+
+def test_liveplot_subscription():
+    tool = Tool(ToolInfo())
+    plot = live.LivePlot(capacity=100)
+
+    plot.attach(tool)
+    tool._notify_subscribers(np.ones(5))
+    assert plot._buffer.count == 5
+
+    plot.start()
+    lines = plot._update(0)
+    assert len(lines[0].get_xdata()) == 5
+    assert plot._axes.get_xlim()[1] >= 4
+
+    plot.stop()
+    assert not tool._subscribers
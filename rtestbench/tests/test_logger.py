@@ -2,7 +2,9 @@
 
 
 import pytest
-from logging import DEBUG, INFO, WARNING
+from logging import DEBUG, INFO, NOTSET, WARNING
+from logging import disable, getLogger, makeLogRecord
+from logging.handlers import QueueHandler
 
 import rtestbench._logger as log
 
@@ -14,8 +16,9 @@ def test_make_logger_default():
     assert logger.name == "rtestbench._logger"
     assert logger.level == DEBUG
 
-    assert logger.handlers[0].level == INFO
-    assert logger.handlers[1].level == DEBUG
+    assert isinstance(logger.handlers[0], QueueHandler)
+    assert log.get_handlers(logger.name)[0].level == INFO
+    assert log.get_handlers(logger.name)[1].level == DEBUG
 
 
 def test_make_logger_verbose():
@@ -26,8 +29,8 @@ def test_make_logger_verbose():
     assert logger.name == 'toto_verb'
     assert logger.level == DEBUG
 
-    assert logger.handlers[0].level == INFO
-    assert logger.handlers[1].level == DEBUG
+    assert log.get_handlers(logger.name)[0].level == INFO
+    assert log.get_handlers(logger.name)[1].level == DEBUG
 
 def test_make_logger_nonverbose():
     """Tests that the non-verbose logger has the correct name and levels."""
@@ -37,5 +40,41 @@ def test_make_logger_nonverbose():
     assert logger.name == 'toto_nverb'
     assert logger.level == DEBUG
 
-    assert logger.handlers[0].level == WARNING
-    assert logger.handlers[1].level == DEBUG
+    assert log.get_handlers(logger.name)[0].level == WARNING
+    assert log.get_handlers(logger.name)[1].level == DEBUG
+
+def test_make_logger_idempotent():
+    """Tests that calling make_logger() again does not duplicate the handlers."""
+
+    logger = log.make_logger('toto_idem', verbose=True)
+    assert log.make_logger('toto_idem', verbose=False) is logger
+
+    assert len(logger.handlers) == 1
+    assert log.get_handlers(logger.name)[0].level == WARNING
+
+def test_stop_logger(tmp_path, monkeypatch):
+    """Tests that the pending records are written in the log file when the logger stops."""
+
+    monkeypatch.chdir(tmp_path)
+    disable(NOTSET) # Other tests disable logging
+    logger = log.make_logger('toto_stop', verbose=False)
+    logger.debug("Record %d", 42)
+    log.stop_logger('toto_stop')
+
+    assert not logger.handlers
+    assert "Record 42" in (tmp_path / 'rtestbench.log').read_text()
+
+def test_package_records(tmp_path, monkeypatch):
+    """Tests that the records of the modules of the package reach the package logger, formatted by the listener."""
+
+    monkeypatch.chdir(tmp_path)
+    disable(NOTSET)
+    log.stop_logger('rtestbench') # Possibly configured by the tests of the manager
+    logger = log.make_logger('rtestbench', verbose=False)
+    record = makeLogRecord({"msg": "Record %d", "args": (42,)})
+    assert logger.handlers[0].prepare(record) is record and record.args == (42,) # Not formatted by the caller
+
+    getLogger('rtestbench._config').error("Cannot configure %s", "toto")
+    log.stop_logger('rtestbench')
+
+    assert "Cannot configure toto" in (tmp_path / 'rtestbench.log').read_text()
@@ -3,6 +3,7 @@
 
 import pytest
 import json
+import numpy as np
 
 import rtestbench._meta as meta
 
@@ -81,3 +82,79 @@ def test_dump_run_info(meta_man):
         assert "Info" in read_data["Run"].keys()
         assert read_data["Run"]["Number"] == 42
         assert read_data["Run"]["Info"] == RUN_LABEL
+
+
+def test_jsonl_append(meta_man):
+    """Checks that events are appended one per line, so that the file is valid JSON Lines."""
+
+    meta_man.dump_meta(JSON_DATA_1_ELEM)
+    meta_man.dump_meta(JSON_DATA_MULTI_ELEM)
+    meta_man.close()
+
+    with open(meta_man._file_path) as f:
+        lines = f.readlines()
+    assert [json.loads(line) for line in lines] == [JSON_DATA_1_ELEM, JSON_DATA_MULTI_ELEM]
+
+def test_batched_flush(tmp_path):
+    man = meta.MetaDataManager(tmp_path / "meta_file", flush_every=2)
+
+    man.dump_meta(JSON_DATA_1_ELEM)
+    assert man._pending == 1
+    man.dump_meta(JSON_DATA_1_ELEM)
+    assert man._pending == 0
+    assert man._file_path.stat().st_size == man._offset
+
+
+def test_run_index(tmp_path):
+    f = tmp_path / "campaign"
+    man = meta.MetaDataManager(f)
+    for number in range(100):
+        man.dump_run_info(number=number, description=RUN_LABEL)
+        man.dump_meta({"Values": [number]})
+        man.dump_timestamp(TIMESTAMP_LABEL)
+    man.close()
+
+    index = meta.load_index(f)
+    assert len(index) == 100
+    assert np.array_equal(index['run'], np.arange(100))
+    assert np.all(index['last'] >= index['first'])
+
+    events = meta.read_run(f, 42)
+    assert len(events) == 3
+    assert events[0]["Run"]["Number"] == 42
+    assert events[1] == {"Values": [42]}
+    assert TIMESTAMP_LABEL in events[2]
+
+    with pytest.raises(KeyError):
+        meta.read_run(f, 1000)
+
+    assert len(meta.find_runs(f)) == 100
+    assert len(meta.find_runs(f, stop=index['first'][0] - 1)) == 0
+
+def test_append_to_existing_campaign(tmp_path):
+    f = tmp_path / "campaign"
+    man = meta.MetaDataManager(f)
+    man.dump_run_info(number=1, description=RUN_LABEL)
+    man.close()
+
+    man = meta.MetaDataManager(f)
+    man.dump_run_info(number=2, description=RUN_LABEL)
+    man.close()
+
+    assert meta.read_run(f, 1)[0]["Run"]["Number"] == 1
+    assert meta.read_run(f, 2)[0]["Run"]["Number"] == 2
+
+def test_rebuild_index(tmp_path):
+    f = tmp_path / "campaign"
+    man = meta.MetaDataManager(f)
+    for number in range(5):
+        man.dump_run_info(number=number, description=RUN_LABEL)
+        man.dump_timestamp(TIMESTAMP_LABEL)
+    man.close()
+    expected = np.array(meta.load_index(f))
+
+    meta.index_file_path(f).unlink()
+    meta.rebuild_index(f)
+    rebuilt = meta.load_index(f)
+    assert np.array_equal(rebuilt[['run', 'offset', 'end']], expected[['run', 'offset', 'end']])
+    assert np.allclose(rebuilt['last'], expected['last'])
@@ -0,0 +1,67 @@
+"""Test for the multimeter module."""
+
+
+import pytest
+
+from rtestbench.core import ToolInfo
+from rtestbench.tools.multimeter import Multimeter
+
+
+@pytest.fixture
+def fakeMultimeterWithoutInterface():
+    info = ToolInfo()
+    info.manufacturer = "Toto Tester"
+    info.model = "No interface"
+    info.serial_number = "42"
+    info.software_version = "3.x"
+
+    return Multimeter(info)
+
+
+def test_multimeter_init(fakeMultimeterWithoutInterface):
+    assert hasattr(fakeMultimeterWithoutInterface, "_info")
+    assert hasattr(fakeMultimeterWithoutInterface, "_properties")
+    assert hasattr(fakeMultimeterWithoutInterface, "_virtual_interface")
+
+    assert fakeMultimeterWithoutInterface._info.family == "multimeter"
+
+def test_multimeter_interface(fakeMultimeterWithoutInterface):
+    # Measurement function interface
+    with pytest.raises(NotImplementedError):
+        fakeMultimeterWithoutInterface.set_function("VOLT")
+    with pytest.raises(NotImplementedError):
+        fakeMultimeterWithoutInterface.get_function()
+    # Range interface
+    with pytest.raises(NotImplementedError):
+        fakeMultimeterWithoutInterface.set_range(value=42)
+    with pytest.raises(NotImplementedError):
+        fakeMultimeterWithoutInterface.get_range()
+    with pytest.raises(NotImplementedError):
+        fakeMultimeterWithoutInterface.set_autorange(switch=True)
+    # Aperture (integration) time interface
+    with pytest.raises(NotImplementedError):
+        fakeMultimeterWithoutInterface.set_integration_time(value=42)
+    with pytest.raises(NotImplementedError):
+        fakeMultimeterWithoutInterface.get_integration_time()
+    with pytest.raises(NotImplementedError):
+        fakeMultimeterWithoutInterface.set_nplc(value=10)
+    # Trigger and sample interfaces
+    with pytest.raises(NotImplementedError):
+        fakeMultimeterWithoutInterface.set_trigger_count(42)
+    with pytest.raises(NotImplementedError):
+        fakeMultimeterWithoutInterface.set_sample_count(42)
+    with pytest.raises(NotImplementedError):
+        fakeMultimeterWithoutInterface.set_sample_timer(0.1)
+    # Measurement actions interface
+    with pytest.raises(NotImplementedError):
+        fakeMultimeterWithoutInterface.initiate_measurement()
+    with pytest.raises(NotImplementedError):
+        fakeMultimeterWithoutInterface.fetch_data()
+    with pytest.raises(NotImplementedError):
+        fakeMultimeterWithoutInterface.fetch_buffered_data()
+
+def test_multimeter_buffered_measurement(fakeMultimeterWithoutInterface):
+    with pytest.raises(ValueError):
+        fakeMultimeterWithoutInterface.configure_buffered_measurement(0)
+    with pytest.raises(NotImplementedError):
+        fakeMultimeterWithoutInterface.configure_buffered_measurement(100, sample_timer=1E-03)
@@ -0,0 +1,83 @@
+"""Test for the noise module."""
+
+
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from rtestbench.post_processing import noise
+
+
+TAU0 = 0.01
+FACTORS = [1, 2, 5, 10, 100]
+
+@pytest.fixture
+def white_noise():
+    """Returns a white current noise of 1 pA rms on top of a 3 nA offset."""
+
+    return np.random.RandomState(42).standard_normal(20000) * 1e-12 + 3e-9
+
+
+def reference_deviation(y, m, kind):
+    """Straightforward (slow) implementation from the textbook definitions."""
+
+    x = np.concatenate(([0], np.cumsum(y))) * TAU0
+    tau = m * TAU0
+    n = len(x)
+    if kind == 'adev':
+        terms = [x[i+2*m] - 2*x[i+m] + x[i] for i in range(0, n - 2*m, m)]
+        return np.sqrt(np.sum(np.square(terms)) / (2 * tau**2 * len(terms)))
+    elif kind == 'oadev':
+        terms = [x[i+2*m] - 2*x[i+m] + x[i] for i in range(n - 2*m)]
+        return np.sqrt(np.sum(np.square(terms)) / (2 * tau**2 * len(terms)))
+    else:
+        terms = [sum(x[i+2*m] - 2*x[i+m] + x[i] for i in range(j, j+m)) for j in range(n - 3*m + 1)]
+        return np.sqrt(np.sum(np.square(terms)) / (2 * m**2 * tau**2 * len(terms)))
+
+
+@pytest.mark.parametrize("kind", ['adev', 'oadev', 'mdev'])
+def test_allan_against_definition(white_noise, kind):
+    y = white_noise[:2000]
+    taus, deviations = noise.allan(y, tau0=TAU0, taus=[1, 3, 10], kind=kind)
+
+    assert np.allclose(taus, np.array([1, 3, 10]) * TAU0)
+    for m, deviation in zip([1, 3, 10], deviations):
+        assert deviation == pytest.approx(reference_deviation(y, m, kind), rel=1e-6)
+
+def test_allan_shortcuts(white_noise):
+    assert np.array_equal(noise.adev(white_noise, TAU0)[1], noise.allan(white_noise, TAU0, kind='adev')[1])
+    assert np.array_equal(noise.oadev(white_noise, TAU0)[1], noise.allan(white_noise, TAU0, kind='oadev')[1])
+    assert np.array_equal(noise.mdev(white_noise, TAU0)[1], noise.allan(white_noise, TAU0, kind='mdev')[1])
+
+def test_allan_taus(white_noise):
+    taus, _ = noise.oadev(white_noise, TAU0, taus='octave')
+    assert np.allclose(taus / TAU0, 2 ** np.arange(len(taus)))
+    taus, _ = noise.mdev(white_noise[:300], TAU0, taus='all')
+    assert len(taus) == 100
+    taus, _ = noise.oadev(white_noise, TAU0, taus=[0, 1, 10**6])
+    assert len(taus) == 1
+    for taus in ('octave', 'decade', 'all'):
+        assert noise.oadev(white_noise[:1], TAU0, taus=taus)[0].size == 0
+
+    with pytest.raises(ValueError):
+        noise.oadev(white_noise, TAU0, taus='toto')
+    with pytest.raises(ValueError):
+        noise.allan(white_noise, TAU0, kind='toto')
+
+def test_allan_float32_and_processes(white_noise):
+    series = pd.Series(white_noise, name="current")
+    _, reference = noise.oadev(series, TAU0, taus=FACTORS)
+    _, single = noise.oadev(series, TAU0, taus=FACTORS, dtype=np.float32)
+    _, parallel = noise.oadev(series, TAU0, taus=FACTORS, n_jobs=2)
+
+    assert np.allclose(single, reference, rtol=1e-3)
+    assert np.allclose(parallel, reference)
+
+@pytest.mark.parametrize("kind", ['adev', 'oadev', 'mdev'])
+def test_allan_n_jobs(white_noise, kind):
+    taus, serial = noise.allan(white_noise, TAU0, taus='decade', kind=kind)
+    parallel_taus, parallel = noise.allan(white_noise, TAU0, taus='decade', kind=kind, n_jobs=2)
+
+    assert np.array_equal(parallel_taus, taus)
+    assert np.allclose(parallel, serial)
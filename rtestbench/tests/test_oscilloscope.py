@@ -0,0 +1,190 @@
+"""Test for the waveform transfer engine of the Oscilloscope base class."""
+
+
+import numpy as np
+import pytest
+
+import rtestbench._block as block
+from rtestbench.core import ToolInfo
+from rtestbench.tools.oscilloscope import Oscilloscope
+from rtestbench.tools.oscilloscope import parse_preamble
+from rtestbench.tests._test_facilities import FakeSession
+
+
+PREAMBLE = "0,0,8,1,1.0E-06,-4.0E-06,0,0.5,0.25,2"
+
+
+class FakeScope(Oscilloscope):
+
+    WAVEFORM_SOURCE_COMMAND = ":WAVeform:SOURce {source}"
+    WAVEFORM_FORMAT_COMMAND = ":WAVeform:FORMat {format}"
+    WAVEFORM_PREAMBLE_REQUEST = ":WAVeform:PREamble?"
+    WAVEFORM_DATA_REQUEST = ":WAVeform:DATA?"
+
+
+class FakeSegmentedScope(FakeScope):
+
+    SEGMENTED_ON_COMMAND = ":ACQuire:MODE SEGMented"
+    SEGMENTED_OFF_COMMAND = ":ACQuire:MODE RTIMe"
+    SEGMENTED_COUNT_COMMAND = ":ACQuire:SEGMented:COUNt {count}"
+    SEGMENTED_COUNT_REQUEST = ":WAVeform:SEGMented:COUNt?"
+    SEGMENTED_INDEX_COMMAND = ":ACQuire:SEGMented:INDex {index}"
+    SEGMENTED_TIME_TAG_REQUEST = ":WAVeform:SEGMented:TTAG?"
+
+
+class FakeScopeSession(FakeSession):
+    """In-memory VISA session answering the preamble, waveform and segment requests of FakeSegmentedScope.
+
+    A waveform is a 2-D array whose rows are the segments.
+    """
+
+    def __init__(self, waveforms: dict):
+        FakeSession.__init__(self)
+        self.waveforms = waveforms
+        self.source = None
+        self.index = 1
+        self.all_segments = False
+
+    def answer(self, message):
+        header, _, argument = message.partition(' ')
+        if header == ":WAVeform:SOURce":
+            self.source = argument
+        elif header == ":ACQuire:SEGMented:INDex":
+            self.index = int(argument)
+        elif header == ":WAVeform:SEGMented:ALL":
+            self.all_segments = argument == "ON"
+        elif header == ":WAVeform:PREamble?":
+            return PREAMBLE.encode()
+        elif header == ":WAVeform:SEGMented:COUNt?":
+            return str(len(next(iter(self.waveforms.values())))).encode()
+        elif header == ":WAVeform:SEGMented:TTAG?":
+            return "{:E}".format(1E-03 * (self.index - 1)).encode()
+        elif header == ":WAVeform:DATA?":
+            segments = self.waveforms[self.source]
+            return block.encode_block(segments if self.all_segments else segments[self.index - 1], segments.dtype)
+        return None
+
+
+@pytest.fixture
+def waveforms():
+    return {"CHANnel1": np.arange(24, dtype='B').reshape(3, 8), "CHANnel2": np.arange(24, dtype='B')[::-1].reshape(3, 8).copy()}
+
+def to_volts(raw):
+    return (np.asarray(raw, dtype=np.float64) - 2) * 0.5 + 0.25
+
+@pytest.fixture
+def scope_session(waveforms):
+    scope = FakeSegmentedScope(ToolInfo())
+    session = FakeScopeSession(waveforms)
+    scope.connect_virtual_interface(session)
+    return scope, session
+
+
+def test_parse_preamble():
+    preamble = parse_preamble(PREAMBLE)
+    assert preamble.points == 8
+    assert preamble.gain == 0.5 and preamble.offset == -0.75
+    np.testing.assert_allclose(preamble.time_axis()[:2], [-4.0E-06, -3.0E-06])
+
+    raw = np.array([0, 2, -128], dtype='b')
+    scaled = preamble.scale(raw)
+    assert scaled.dtype == np.float32
+    np.testing.assert_allclose(scaled, [-0.75, 0.25, -64.75])
+
+    with pytest.raises(ValueError):
+        parse_preamble("0,0,8")
+
+def test_fetch_waveform(scope_session, waveforms):
+    scope, session = scope_session
+    scope.set_waveform_format("byte")
+    assert session.written == [":WAVeform:FORMat BYTE"]
+
+    volts = scope.fetch_waveform("CHANnel1")
+    assert volts.dtype == np.float32
+    np.testing.assert_allclose(volts, to_volts(waveforms["CHANnel1"][0]))
+
+    # The preamble is cached and the source is already selected
+    session.written.clear()
+    out = np.empty(8, dtype=np.float32)
+    np.testing.assert_allclose(scope.fetch_data("CHANnel1"), volts)
+    assert np.shares_memory(scope.fetch_waveform("CHANnel1", out), out)
+    np.testing.assert_allclose(out, volts)
+    assert session.written == [":WAVeform:DATA?", ":WAVeform:DATA?"]
+
+    # A command may change the scaling
+    scope.send(":CHANnel1:SCALe 2")
+    session.written.clear()
+    scope.fetch_waveform("CHANnel1")
+    assert session.written == [":WAVeform:SOURce CHANnel1", ":WAVeform:PREamble?", ":WAVeform:DATA?"]
+
+    with pytest.raises(ValueError):
+        scope.set_waveform_format("ASCii")
+
+def test_fetch_waveforms(scope_session, waveforms):
+    scope, session = scope_session
+    scope.set_waveform_format("BYTE")
+    expected = np.array([to_volts(waveforms[source][0]) for source in ("CHANnel1", "CHANnel2")])
+    np.testing.assert_allclose(scope.fetch_waveforms(["CHANnel1", "CHANnel2"]), expected)
+
+    scope.WAVEFORM_COMPOUND_QUERIES = True
+    session.written.clear()
+    np.testing.assert_allclose(scope.fetch_waveforms(["CHANnel1", "CHANnel2"]), expected)
+    assert session.written == [":WAVeform:SOURce CHANnel1;:WAVeform:DATA?;:WAVeform:SOURce CHANnel2;:WAVeform:DATA?"]
+
+def test_waveform_signedness(scope_session):
+    scope, session = scope_session
+    scope.WAVEFORM_UNSIGNED_COMMAND = ":WAVeform:UNSigned {switch}"
+    session.waveforms["CHANnel1"] = np.full((3, 8), 200, dtype='B') # Negative if read as signed
+    scope.set_waveform_format("BYTE")
+    np.testing.assert_allclose(scope.fetch_waveform("CHANnel1"), to_volts(200))
+
+    scope.WAVEFORM_FORMATS = {"BYTE": 'b'}
+    session.waveforms["CHANnel1"] = np.full((3, 8), -56, dtype='b')
+    scope.set_waveform_format("BYTE")
+    np.testing.assert_allclose(scope.fetch_waveform("CHANnel1"), to_volts(-56))
+    assert session.written[:2] == [":WAVeform:FORMat BYTE", ":WAVeform:UNSigned ON"]
+    assert ":WAVeform:UNSigned OFF" in session.written
+
+def test_undeclared_waveform_transfer():
+    scope = Oscilloscope(ToolInfo())
+    scope.connect_virtual_interface(FakeScopeSession({}))
+    with pytest.raises(NotImplementedError):
+        scope.fetch_waveform("CHANnel1")
+
+def test_segmented_acquisition(scope_session):
+    scope, session = scope_session
+    scope.set_segmented_acquisition(True, 3)
+    scope.set_segmented_acquisition(False)
+    assert session.written == [":ACQuire:MODE SEGMented", ":ACQuire:SEGMented:COUNt 3", ":ACQuire:MODE RTIMe"]
+
+    with pytest.raises(ValueError):
+        scope.set_segmented_acquisition(True, 0)
+
+@pytest.mark.parametrize("transfer", ["one_by_one", "compound", "all"])
+def test_fetch_segments(scope_session, waveforms, transfer):
+    scope, session = scope_session
+    scope.set_waveform_format("BYTE")
+    if transfer == "compound":
+        scope.WAVEFORM_COMPOUND_QUERIES = True
+    elif transfer == "all":
+        scope.SEGMENTED_ALL_COMMAND = ":WAVeform:SEGMented:ALL {switch}"
+
+    segments, time_tags = scope.fetch_segments("CHANnel2")
+    assert segments.shape == (3, 8) and segments.dtype == np.float32
+    np.testing.assert_allclose(segments, to_volts(waveforms["CHANnel2"]))
+    np.testing.assert_allclose(time_tags, [0.0, 1E-03, 2E-03])
+
+    # The raw buffer is reused by the next batch
+    session.written.clear()
+    out = np.empty((4, 8), dtype=np.float32)
+    segments, time_tags = scope.fetch_segments("CHANnel2", count=2, out=out, time_tags=False)
+    assert time_tags is None and np.shares_memory(segments, out)
+    np.testing.assert_allclose(segments, to_volts(waveforms["CHANnel2"][:2]))
+    if transfer == "compound":
+        assert len(session.written) == 1
+
+    with pytest.raises(ValueError):
+        scope.fetch_segments("CHANnel2", count=3, out=np.empty((2, 8), dtype=np.float32))
+    if transfer == "all":
+        with pytest.raises(ValueError): # Only 3 segments acquired
+            scope.fetch_segments("CHANnel2", count=4)
@@ -0,0 +1,152 @@
+"""Test for the _pool module and the reconnection of tools."""
+
+
+import pytest
+
+import visa
+
+import rtestbench._pool as pool
+from rtestbench.core import Tool
+from rtestbench.core import ToolInfo
+
+
+class FakeSession(object):
+    """In-memory VISA session that can be broken on purpose."""
+
+    interface_type = visa.constants.InterfaceType.usb
+
+    def __init__(self, address, idn="Fake Manufacturer,Fake Model,42,1.0"):
+        self.address = address
+        self.idn = idn
+        self.written = []
+        self.closed = False
+        self.broken = False
+        self.timeout = 2000
+        self.read_termination = None
+        self.write_termination = None
+
+    @property
+    def session(self):
+        if self.closed or self.broken:
+            raise visa.InvalidSession()
+        return 1
+
+    def write(self, command):
+        if self.broken:
+            raise visa.VisaIOError(visa.constants.VI_ERROR_CONN_LOST)
+        self.written.append(command)
+
+    def query(self, request):
+        if self.broken:
+            raise visa.VisaIOError(visa.constants.VI_ERROR_IO)
+        return self.idn if request == '*IDN?' else "1"
+
+    def close(self):
+        self.closed = True
+
+
+class FakeResourceManager(object):
+
+    def __init__(self):
+        self.opened = []
+        self.idn = "Fake Manufacturer,Fake Model,42,1.0"
+
+    def open_resource(self, address):
+        session = FakeSession(address, self.idn)
+        self.opened.append(session)
+        return session
+
+
+@pytest.fixture
+def fake_rm():
+    return FakeResourceManager()
+
+@pytest.fixture
+def session_pool(fake_rm):
+    session_pool = pool.SessionPool(fake_rm)
+    yield session_pool
+    session_pool.close()
+
+@pytest.fixture
+def reconnecting_tool(session_pool):
+    info = ToolInfo()
+    info.model = "Fake Model"
+    info.serial_number = "42"
+    info.address = "USB0::1::INSTR"
+
+    tool = Tool(info)
+    tool.connect_virtual_interface(session_pool.open_resource(info.address))
+    tool.set_reconnect_handler(session_pool.reopen)
+    return tool
+
+
+def test_is_connection_error():
+    assert pool.is_connection_error(visa.InvalidSession())
+    assert pool.is_connection_error(visa.VisaIOError(visa.constants.VI_ERROR_CONN_LOST))
+    assert not pool.is_connection_error(visa.VisaIOError(visa.constants.VI_ERROR_TMO))
+    assert not pool.is_connection_error(ValueError())
+
+def test_open_resource_pooled(fake_rm, session_pool):
+    session = session_pool.open_resource("USB0::1::INSTR")
+    assert session_pool.open_resource("USB0::1::INSTR") is session
+    assert "USB0::1::INSTR" in session_pool
+    assert len(fake_rm.opened) == 1
+
+    session.broken = True # Unhealthy sessions are replaced
+    assert session_pool.open_resource("USB0::1::INSTR") is not session
+    assert len(fake_rm.opened) == 2
+
+def test_reopen(session_pool):
+    session = session_pool.open_resource("USB0::1::INSTR")
+    new_session = session_pool.reopen("USB0::1::INSTR")
+    assert new_session is not session
+    assert session.closed
+
+def test_health_check(session_pool):
+    session_pool.open_resource("USB0::1::INSTR").broken = True
+    session_pool.open_resource("USB0::2::INSTR")
+
+    assert session_pool.health_check() == {"USB0::1::INSTR": False, "USB0::2::INSTR": True}
+    assert "USB0::1::INSTR" not in session_pool
+
+def test_close(session_pool):
+    session = session_pool.open_resource("USB0::1::INSTR")
+    session_pool.close()
+    assert session.closed
+    assert "USB0::1::INSTR" not in session_pool
+
+
+def test_tool_reconnect(fake_rm, reconnecting_tool):
+    reconnecting_tool.set_replay_messages([":SENS:FUNC 'CURR'", ":TRIG:SOUR BUS"])
+    reconnecting_tool._virtual_interface.timeout = 5000
+    reconnecting_tool._virtual_interface.broken = True
+
+    reconnecting_tool.send("*RST") # Reconnected then retried
+    session = reconnecting_tool._virtual_interface
+    assert session is fake_rm.opened[-1]
+    assert session.written == [":SENS:FUNC 'CURR'", ":TRIG:SOUR BUS", "*RST"]
+    assert session.timeout == 5000
+
+    session.broken = True
+    assert reconnecting_tool.query("*IDN?") == fake_rm.idn
+
+    # The measurements are lost with the session: reconnected but not retried
+    reconnecting_tool._virtual_interface.broken = True
+    with pytest.raises(IOError):
+        reconnecting_tool.query(":READ?")
+    assert reconnecting_tool.query(":READ?") == "1"
+    assert len(fake_rm.opened) == 4
+
+def test_tool_reconnect_other_tool(fake_rm, reconnecting_tool):
+    fake_rm.idn = "Fake Manufacturer,Other Model,43,1.0"
+    reconnecting_tool._virtual_interface.broken = True
+    with pytest.raises(IOError):
+        reconnecting_tool.send("*RST")
+
+def test_tool_no_reconnect(reconnecting_tool):
+    reconnecting_tool.set_reconnect_handler(None)
+    reconnecting_tool._virtual_interface.broken = True
+    with pytest.raises(IOError):
+        reconnecting_tool.send("*RST")
+    with pytest.raises(UnboundLocalError):
+        reconnecting_tool.reconnect()
@@ -0,0 +1,80 @@
+"""Test for the report module."""
+
+
+import pytest
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from rtestbench.post_processing import report
+
+
+@pytest.fixture
+def batch_report(tmp_path):
+    return report.BatchReport(tmp_path / "report", formats=('png', 'svg', 'pdf'))
+
+
+def test_batchreport_formats(tmp_path):
+    with pytest.raises(ValueError):
+        report.BatchReport(tmp_path, formats=('png', 'toto'))
+
+def test_batchreport_add_page(batch_report):
+    with pytest.raises(ValueError):
+        batch_report.add_page("page", "toto", data=[1, 2])
+
+    batch_report.add_page("page", "histogram", data=[1, 2])
+    assert len(batch_report) == 1
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_batchreport_render(batch_report, n_jobs):
+    y = np.random.RandomState(42).standard_normal(20000)
+    t = np.arange(len(y)) * 1e-3
+    template = report.FigureTemplate(xlabel="Time [s]", ylabel="Current [A]")
+    figures_before = plt.get_fignums()
+
+    for run in range(2):
+        batch_report.add_page("run{}_ts".format(run), "time_series", template, title="Run {}".format(run), x=t, y=[y, 2*y], labels=["I1", "I2"], max_points=1000)
+        batch_report.add_page("run{}_hist".format(run), "histogram", title="Run {}".format(run), data=y)
+        batch_report.add_page("run{}_psd".format(run), "psd", data=y[:4096], Fs=1e3)
+        batch_report.add_page("run{}_allan".format(run), "allan", data=y, tau0=1e-3)
+
+    paths = batch_report.render(n_jobs=n_jobs)
+
+    assert len(paths) == 2 * 4 * 3
+    assert len(batch_report) == 0
+    for path in paths:
+        with open(path, 'rb') as f:
+            assert f.read(1)
+    assert plt.get_fignums() == figures_before # No figure leaked to pyplot
+
+def test_template_reuse():
+    template = report.FigureTemplate(yscale='log')
+    figure, axes = template.build()
+
+    axes.plot([1, 2], [1, 2])
+    axes.hist(np.arange(1000) * 100.0)
+    axes.text(0.5, 0.5, "toto")
+    axes.legend(["toto"])
+    axes.set_xscale('log')
+    template.reset(axes)
+
+    assert not axes.lines and not axes.patches and not axes.texts
+    assert axes.get_legend() is None
+    assert axes.get_xscale() == 'linear'
+    assert axes.get_yscale() == 'log'
+
+    # The limits of the next page only depend on its own data
+    axes.plot([10, 20], [1, 2])
+    figure.canvas.draw()
+    assert 9 < axes.get_xlim()[0] and axes.get_xlim()[1] < 21
+
+def test_worker_figures_bounded(batch_report):
+    batch_report._directory.mkdir(parents=True)
+    for i in range(report.WORKER_FIGURES_MAX + 2): # One template per page
+        page = ("page{}".format(i), "histogram", report.FigureTemplate(dpi=50 + i), "", {"data": [1, 2]}, str(batch_report._directory), ('png',))
+        report._render_page(page)
+        assert len(report._worker_figures) <= report.WORKER_FIGURES_MAX
+
+    batch_report.add_page("page", "histogram", data=[1, 2])
+    batch_report.render(n_jobs=1)
+    assert not report._worker_figures # Not kept after the batch
@@ -0,0 +1,187 @@
+"""Test for the _scheduler module."""
+
+
+import logging
+import threading
+import time
+import pytest
+
+import rtestbench._scheduler as scheduler
+from rtestbench.core import RTestBenchManager
+from rtestbench.core import Tool
+from rtestbench.core import ToolInfo
+
+
+class CountingTool(Tool):
+    """Tool counting the calls of its getter."""
+
+    COALESCED_GETTERS = frozenset(("get_range",))
+
+    def __init__(self):
+        Tool.__init__(self, ToolInfo())
+        self.calls = []
+
+    def get_range(self, channel=1):
+        self.calls.append(("get_range", channel))
+        return 42 * channel
+
+    def set_range(self, value):
+        self.calls.append(("set_range", value))
+
+    def query(self, request):
+        self.calls.append(("query", request))
+        return "0"
+
+
+@pytest.fixture
+def worker():
+    """Returns a SessionWorker blocked by a first job until the returned event is set."""
+
+    session = scheduler.SessionWorker()
+    release = threading.Event()
+    session.submit(release.wait)
+    time.sleep(0.01) # The first job is running
+    yield session, release
+    release.set()
+    session.shutdown()
+
+@pytest.fixture
+def rtb_simulated_visaRM():
+    """Returns a non-verbose RTestBench with a simulated VISA resource manager."""
+
+    rtb = RTestBenchManager(verbose=False, visa_library='@sim')
+    logging.disable(logging.CRITICAL)
+
+    return rtb
+
+
+def test_priorities(worker):
+    session, release = worker
+    order = []
+    futures = [
+        session.submit(order.append, "low", priority=scheduler.PRIORITY_LOW),
+        session.submit(order.append, "normal"),
+        session.submit(order.append, "high", priority=scheduler.PRIORITY_HIGH),
+    ]
+    release.set()
+    for future in futures:
+        future.result(timeout=1)
+
+    assert order == ["high", "normal", "low"]
+
+def test_deadlines(worker):
+    session, release = worker
+    order = []
+    late = session.submit(order.append, "late", deadline=10)
+    early = session.submit(order.append, "early", deadline=5)
+    expired = session.submit(order.append, "expired", deadline=0.001)
+    time.sleep(0.01)
+    release.set()
+
+    with pytest.raises(scheduler.DeadlineError):
+        expired.result(timeout=1)
+    late.result(timeout=1)
+    assert order == ["early", "late"]
+
+def test_clients_in_turns(worker):
+    session, release = worker
+    order = []
+    futures = [session.submit(order.append, "A{}".format(i), client="A") for i in range(3)]
+    futures.append(session.submit(order.append, "B0", client="B"))
+    release.set()
+    for future in futures:
+        future.result(timeout=1)
+
+    assert order == ["A0", "B0", "A1", "A2"]
+
+def test_coalescing(worker):
+    session, release = worker
+    calls = []
+    first = session.submit(calls.append, 1, key="get")
+    second = session.submit(calls.append, 1, key="get", priority=scheduler.PRIORITY_HIGH)
+    assert first is not second
+    release.set()
+    first.result(timeout=1)
+    second.result(timeout=1)
+    assert calls == [1]
+
+    # Once done, the same query runs again
+    session.submit(calls.append, 1, key="get").result(timeout=1)
+    assert calls == [1, 1]
+
+def test_coalescing_per_requester(worker):
+    session, release = worker
+    calls = []
+    patient = session.submit(calls.append, 1, key="get")
+    expired = session.submit(calls.append, 1, key="get", deadline=0.001)
+    cancelled = session.submit(calls.append, 1, key="get")
+    assert cancelled.cancel()
+    time.sleep(0.01)
+    release.set()
+
+    # The deadline and the cancellation of a requester do not concern the others
+    with pytest.raises(scheduler.DeadlineError):
+        expired.result(timeout=1)
+    patient.result(timeout=1)
+    assert calls == [1]
+
+    # Nobody waits for the result anymore: the job does not run
+    blocker = threading.Event()
+    session.submit(blocker.wait)
+    assert session.submit(calls.append, 2, key="get").cancel()
+    blocker.set()
+    session.submit(calls.append, 3).result(timeout=1)
+    assert calls == [1, 3]
+
+def test_client_rounds_pruned():
+    session = scheduler.SessionWorker()
+    for client in range(100):
+        session.submit(int, "1", client=client).result(timeout=1)
+    assert session._client_rounds == {} # Only the clients with pending jobs are remembered
+    session.shutdown()
+
+def test_exceptions_and_shutdown(worker):
+    session, release = worker
+    future = session.submit(int, "toto")
+    release.set()
+    with pytest.raises(ValueError):
+        future.result(timeout=1)
+
+    session.shutdown()
+    with pytest.raises(RuntimeError):
+        session.submit(int, "42")
+
+
+def test_scheduler():
+    tool = CountingTool()
+    sched = scheduler.Scheduler()
+
+    blocker = threading.Event()
+    sched.submit(tool, blocker.wait)
+    futures = [sched.submit(tool, "get_range", 2, client=client) for client in range(5)]
+    set_futures = [sched.submit(tool, "set_range", 1) for _ in range(2)]
+    blocker.set()
+
+    assert [future.result(timeout=1) for future in futures] == [84]*5
+    for future in set_futures:
+        future.result(timeout=1)
+    assert tool.calls.count(("get_range", 2)) == 1
+    assert tool.calls.count(("set_range", 1)) == 2
+
+    # Only the getters declared by the tool are coalesced; queries may have side effects (e.g., ':READ?')
+    blocker.clear()
+    sched.submit(tool, blocker.wait)
+    futures = [sched.submit(tool, "query", ":READ?") for _ in range(2)]
+    blocker.set()
+    for future in futures:
+        future.result(timeout=1)
+    assert tool.calls.count(("query", ":READ?")) == 2
+
+    sched.shutdown()
+
+def test_manager_submit(rtb_simulated_visaRM):
+    tool = CountingTool()
+    assert rtb_simulated_visaRM.submit(tool, "get_range", channel=3).result(timeout=1) == 126
+
+    rtb_simulated_visaRM.close()
+    assert rtb_simulated_visaRM._scheduler is None
@@ -0,0 +1,163 @@
+"""Test for the _scpi module."""
+
+
+import pytest
+
+import rtestbench._scpi as scpi
+from rtestbench.core import Tool
+from rtestbench.core import ToolInfo
+
+
+@pytest.fixture
+def data_types():
+    return scpi.ScpiKeywords("CHARge", "CURRent", "TIME", "SINGle1")
+
+
+def test_forms():
+    assert scpi.short_form("CURRent") == "CURR"
+    assert scpi.long_form("CURRent") == "CURRENT"
+    assert scpi.short_form("SINGle1") == "SING1"
+    assert scpi.short_form("HIZ") == "HIZ"
+
+    with pytest.raises(ValueError):
+        scpi.short_form("current")
+    with pytest.raises(ValueError):
+        scpi.short_form("CURR ent")
+
+def test_match(data_types):
+    assert data_types.match("CURRent") == "CURRent"
+    assert data_types.match("CURR") == "CURRent"
+    assert data_types.match("current") == "CURRent"
+    assert data_types.match("sing1") == "SINGle1"
+    assert data_types.match("TIME") == "TIME"
+
+    assert data_types.match("CURRe") is None # Neither the short nor the long form
+    assert data_types.match("CHARgeCURRent") is None # No substring match
+    assert data_types.match("URR") is None
+    assert data_types.match(None) is None
+    assert data_types.match(["CURR"]) is None
+
+def test_contains(data_types):
+    assert "curr" in data_types
+    assert "VOLT" not in data_types
+    assert len(data_types) == 4
+    assert list(data_types) == ["CHARge", "CURRent", "TIME", "SINGle1"]
+
+def test_union(data_types):
+    union = data_types | scpi.ScpiKeywords("VOLTage", "CURRent")
+    assert union.keywords == ("CHARge", "CURRent", "TIME", "SINGle1", "VOLTage")
+    assert scpi.ScpiKeywords(data_types, "VOLTage") == union
+    assert "VOLT" in union
+
+def test_conflict():
+    with pytest.raises(ValueError):
+        scpi.ScpiKeywords("CURRent", "CURR")
+
+def test_immutable(data_types):
+    with pytest.raises(AttributeError):
+        data_types.keywords = ("TOTO",)
+    assert str(data_types) == "(CHARge, CURRent, TIME, SINGle1)"
+
+
+FAKE_COMMANDS = (
+    scpi.ScpiCommand("data_type", ":SENSe:FUNCtion", scpi.ScpiKeywords("CHARge", "CURRent"), cache="activated_data_type"),
+    scpi.ScpiCommand("data_types", ":FORMat:ELEMents", [scpi.ScpiKeywords("CHARge", "CURRent", "TIME")], "data_types"),
+    scpi.ScpiCommand("range", ":SENSe:{activated_data_type}:RANGe", float, cache="activated_range"),
+    scpi.ScpiCommand("count", ":TRIGger:COUNt", int, query=False),
+    scpi.ScpiCommand("display", ":DISPlay:ENABle", bool, coalesce=False),
+    scpi.ScpiAction("initiate", ":INITiate", "initiate"),
+)
+
+@scpi.scpi_commands(FAKE_COMMANDS)
+class FakeScpiTool(Tool):
+
+    def __init__(self, info):
+        Tool.__init__(self, info)
+        self._properties.update_properties(activated_data_type="CURRent", activated_range=None)
+
+    def get_count(self):
+        return 42
+
+
+def test_compile_encoder(data_types):
+    assert scpi.compile_encoder(data_types)("curr") == "CURRent"
+    assert scpi.compile_encoder([data_types])(["curr", "time"]) == "CURRent,TIME"
+    assert scpi.compile_encoder(float)(1e-3) == "0.001"
+    assert scpi.compile_encoder(int)("max") == "MAXimum"
+    assert scpi.compile_encoder(bool)(False) == "OFF"
+
+    with pytest.raises(ValueError):
+        scpi.compile_encoder(data_types)("VOLT")
+    with pytest.raises(ValueError):
+        scpi.compile_encoder([data_types])("CURR") # Not a list
+    with pytest.raises(ValueError):
+        scpi.compile_encoder(int)(1.5)
+    with pytest.raises(ValueError):
+        scpi.compile_encoder(dict)
+
+def test_scpi_commands():
+    tool = FakeScpiTool(ToolInfo())
+    with tool.record_commands() as commands:
+        tool.set_data_type("char")
+        tool.set_data_types(["curr", "TIME"])
+        tool.set_range(2e-6)
+        tool.set_count_max()
+        tool.set_display(True)
+        tool.initiate()
+        with pytest.raises(ValueError):
+            tool.set_data_type("VOLT")
+    assert commands == [":SENSe:FUNCtion CHARge", ":FORMat:ELEMents CURRent,TIME", ":SENSe:CHARge:RANGe 2e-06",
+                        ":TRIGger:COUNt MAXimum", ":DISPlay:ENABle ON", ":INITiate"]
+    assert tool._properties.activated_data_type == "CHARge"
+    assert tool._properties.activated_range == 2e-6
+
+    assert tool.get_count() == 42 # Defined by hand
+    assert not hasattr(tool, "get_count_max")
+    assert FakeScpiTool.set_range.__name__ == "set_range"
+
+def test_scpi_commands_coalesced_getters():
+    assert FakeScpiTool.COALESCED_GETTERS == {"get_data_type", "get_data_types", "get_range"}
+    assert Tool.COALESCED_GETTERS == frozenset()
+
+def test_scpi_commands_errors():
+    tool = FakeScpiTool(ToolInfo())
+    with tool.record_commands():
+        with pytest.raises(RuntimeError): # Requests cannot be answered while recording
+            tool.get_data_type()
+        with pytest.raises(ValueError):
+            tool.set_count(1.5)
+        with pytest.raises(TypeError):
+            tool.set_range(1.0, 2.0)
+        tool.set_data_types(data_types=["TIME"]) # Keyword argument, as in configuration files
+    with pytest.raises(UnboundLocalError): # No virtual interface
+        tool.initiate()
+
+def test_decoders(data_types):
+    assert scpi.decode_int("42") == 42
+    assert scpi.decode_int("+4.200000E+01") == 42
+    assert scpi.decode_float("+1.000000E-03") == 1e-3
+    assert scpi.decode_bool("1") and not scpi.decode_bool("OFF\n")
+    assert scpi.decode_keyword(data_types)('"CURR"') == "CURRent"
+    assert scpi.decode_keywords(data_types)("CURR,TIME") == ["CURRent", "TIME"]
+    assert scpi.compile_decoder(None) is str
+    assert scpi.compile_decoder(int) is scpi.decode_int
+
+    with pytest.raises(ValueError):
+        scpi.decode_int("4.2")
+    with pytest.raises(ValueError):
+        scpi.decode_bool("2")
+    with pytest.raises(ValueError):
+        scpi.decode_keyword(data_types)("VOLT")
+
+def test_scpi_commands_getters(monkeypatch):
+    tool = FakeScpiTool(ToolInfo())
+    answers = {":SENSe:FUNCtion?": "CHAR", ":SENSe:CHARge:RANGe?": "+2.000000E-06", ":DISPlay:ENABle?": "0", ":FORMat:ELEMents?": "1"}
+    monkeypatch.setattr(tool, "query", answers.get)
+
+    assert tool.get_data_type() == "CHARge"
+    assert tool._properties.activated_data_type == "CHARge" # Cached, then used by the header of the range
+    assert tool.get_range() == 2e-6
+    assert tool._properties.activated_range == 2e-6
+    assert tool.get_display() is False
+    with pytest.raises(RuntimeError):
+        tool.get_data_types()
@@ -0,0 +1,145 @@
+"""Test for the supply module and its sequence (list) engine."""
+
+
+import numpy as np
+import pytest
+
+import visa
+
+import rtestbench._block as block
+from rtestbench.core import ToolInfo
+from rtestbench.tools.supply import Supply
+from rtestbench.tests._test_facilities import FakeSession
+
+
+class FakeSupply(Supply):
+
+    LIST_VOLTAGE_COMMAND = ":LIST:VOLTage"
+    LIST_CURRENT_COMMAND = ":LIST:CURRent"
+    LIST_DWELL_COMMAND = ":LIST:DWELl"
+    LIST_COUNT_COMMAND = ":LIST:COUNt {count}"
+    LIST_STEP_COMMAND = ":LIST:STEP {step}"
+    LIST_ON_COMMAND = ":VOLTage:MODE LIST;:CURRent:MODE LIST"
+    LIST_OFF_COMMAND = ":VOLTage:MODE FIXed;:CURRent:MODE FIXed"
+    LIST_INITIATE_COMMAND = ":INITiate:TRANsient"
+    LIST_TRIGGER_COMMAND = ":TRIGger:TRANsient:IMMediate"
+    READBACK_VOLTAGE_REQUEST = ":FETCh:ARRay:VOLTage?"
+    READBACK_CURRENT_REQUEST = ":FETCh:ARRay:CURRent?"
+
+    def __init__(self, info):
+        Supply.__init__(self, info)
+
+        self._properties.bin_data_endianness = "big"
+        self._properties.bin_data_type = 'd'
+
+
+class FakeSupplySession(FakeSession):
+    """In-memory VISA session storing the uploaded lists and answering the readback with them (into a 1 kOhm load)."""
+
+    def __init__(self):
+        FakeSession.__init__(self)
+        self.lists = dict()
+        self.timeouts = []
+
+    def answer(self, message):
+        if message == ":FETCh:ARRay:VOLTage?":
+            return block.encode_block(self.lists[":LIST:VOLTage"], '>f8')
+        elif message == ":FETCh:ARRay:CURRent?":
+            return block.encode_block(self.lists[":LIST:VOLTage"] / 1E3, '>f8')
+        elif message == "*OPC?":
+            return b"1"
+        return None
+
+    def query(self, request):
+        self.timeouts.append(self.timeout)
+        return FakeSession.query(self, request)
+
+    def write_raw(self, message):
+        command, _, data = message.partition(b' ')
+        n_digits = int(data[1:2])
+        self.lists[command.decode()] = np.frombuffer(data[2 + n_digits:-1], dtype='>f8')
+        self.written.append(command.decode())
+        return len(message), visa.constants.StatusCode.success
+
+
+@pytest.fixture
+def fakeSupplyWithoutInterface():
+    info = ToolInfo()
+    info.manufacturer = "Toto Tester"
+    info.model = "No interface"
+    info.serial_number = "42"
+    info.software_version = "3.x"
+
+    return Supply(info)
+
+@pytest.fixture
+def supply_session():
+    supply = FakeSupply(ToolInfo())
+    session = FakeSupplySession()
+    supply.connect_virtual_interface(session)
+    return supply, session
+
+
+def test_supply_init(fakeSupplyWithoutInterface):
+    assert fakeSupplyWithoutInterface._info.family == "supply"
+    assert fakeSupplyWithoutInterface.expected_acquisition_time() == 0.0
+
+def test_supply_interface(fakeSupplyWithoutInterface):
+    with pytest.raises(NotImplementedError):
+        fakeSupplyWithoutInterface.set_output(True)
+    with pytest.raises(NotImplementedError):
+        fakeSupplyWithoutInterface.set_voltage(1.0)
+    with pytest.raises(NotImplementedError):
+        fakeSupplyWithoutInterface.set_current(1E-03)
+    with pytest.raises(NotImplementedError):
+        fakeSupplyWithoutInterface.measure_current()
+    with pytest.raises(NotImplementedError):
+        fakeSupplyWithoutInterface.set_trigger_source("EXT")
+    with pytest.raises(NotImplementedError):
+        fakeSupplyWithoutInterface.run_sequence() # Sequence mode not declared
+
+def test_upload_sequence(supply_session):
+    supply, session = supply_session
+    voltages = np.linspace(0.0, 5.0, 1000)
+    supply.upload_sequence(voltages, currents=0.1, dwell_times=1E-03, count=2)
+    assert session.written == [":LIST:VOLTage", ":LIST:CURRent", ":LIST:DWELl", ":LIST:COUNt 2", ":VOLTage:MODE LIST;:CURRent:MODE LIST"]
+    np.testing.assert_array_equal(session.lists[":LIST:VOLTage"], voltages)
+    np.testing.assert_array_equal(session.lists[":LIST:CURRent"], [0.1])
+    assert supply.expected_acquisition_time() == pytest.approx(2.0)
+
+    with pytest.raises(ValueError):
+        supply.upload_sequence([])
+    with pytest.raises(ValueError):
+        supply.upload_sequence(voltages, dwell_times=[1E-03, 2E-03])
+    with pytest.raises(ValueError):
+        supply.upload_sequence(voltages, count=0)
+
+def test_triggered_sequence(supply_session):
+    supply, session = supply_session
+    supply.upload_sequence([1.0, 2.0, 3.0])
+    session.written.clear()
+    supply.set_sequence_stepping(True)
+    supply.run_sequence()
+    supply.disable_sequence()
+    assert session.written == [":LIST:STEP ONCE", ":INITiate:TRANsient", ":VOLTage:MODE FIXed;:CURRent:MODE FIXed"]
+
+def test_sweep_voltage(supply_session):
+    supply, session = supply_session
+    voltages = np.linspace(-1.0, 1.0, 1000)
+    measured_voltages, measured_currents = supply.sweep_voltage(voltages, current_limit=0.01, dwell_time=1E-03)
+    np.testing.assert_array_equal(measured_voltages, voltages)
+    np.testing.assert_allclose(measured_currents, voltages / 1E3)
+    assert len(session.written) == 11 # A handful of transactions for the whole sweep
+    assert session.written[6:9] == [":INITiate:TRANsient", ":TRIGger:TRANsient:IMMediate", "*OPC?"]
+    assert session.timeouts == [3000] and session.timeout == 2000 # The wait lasts the sequence
+
+    # The readings can be streamed into reused buffers
+    out = np.empty(1000, dtype='>f8'), np.empty(1000, dtype='>f8')
+    measured_voltages, _ = supply.fetch_sequence_readings(*out)
+    assert np.shares_memory(measured_voltages, out[0])
+
+def test_record_upload(supply_session):
+    supply, _ = supply_session
+    with pytest.raises(IOError):
+        with supply.record_commands():
+            supply.upload_sequence([1.0, 2.0])
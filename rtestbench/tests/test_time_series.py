@@ -0,0 +1,66 @@
+"""Test for the time_series module."""
+
+
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from rtestbench.post_processing import time_series
+
+
+WINDOW = 37
+
+@pytest.fixture
+def signal():
+    return np.random.RandomState(42).standard_normal(1000)
+
+def chunks(data, size=50):
+    for start in range(0, len(data), size):
+        yield data[start:start+size]
+
+
+@pytest.mark.parametrize("function, reference", [
+    (time_series.rolling_mean, lambda r: r.mean()),
+    (time_series.rolling_std, lambda r: r.std(ddof=0)),
+    (time_series.rolling_min, lambda r: r.min()),
+    (time_series.rolling_max, lambda r: r.max()),
+])
+def test_rolling_statistics(signal, function, reference):
+    expected = reference(pd.Series(signal).rolling(WINDOW)).to_numpy()[WINDOW-1:]
+
+    # NumPy array
+    assert np.allclose(function(signal, WINDOW), expected)
+
+    # pandas' Series: the index of the last sample of each window is kept
+    result = function(pd.Series(signal, name="current"), WINDOW)
+    assert isinstance(result, pd.Series)
+    assert result.index[0] == WINDOW - 1
+    assert np.allclose(result.to_numpy(), expected)
+
+    # Generator of chunks
+    streamed = np.concatenate(list(function(chunks(signal), WINDOW)))
+    assert np.allclose(streamed, expected)
+
+def test_rolling_bad_window(signal):
+    with pytest.raises(ValueError):
+        time_series.rolling_mean(signal, 0)
+
+
+def test_detrend():
+    t = np.arange(1000.)
+    y = 3e-12 * t + 1e-9 + 1e-15 * np.sin(t)
+
+    assert np.allclose(time_series.detrend(y), 1e-15 * np.sin(t), atol=1e-16)
+    assert np.allclose(time_series.detrend(chunks(y)), time_series.detrend(y))
+    assert isinstance(time_series.detrend(pd.Series(y, name="current")), pd.Series)
+
+
+def test_allan_deviation(signal):
+    taus, deviations = time_series.allan_deviation(signal, tau0=0.1)
+
+    assert taus[0] == pytest.approx(0.1)
+    assert len(taus) == len(deviations)
+    # White noise: the Allan deviation decreases as 1/sqrt(tau)
+    assert deviations[0] == pytest.approx(1, rel=0.1)
+    assert deviations[2] == pytest.approx(0.5, rel=0.2)
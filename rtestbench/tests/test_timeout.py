@@ -0,0 +1,119 @@
+"""Test for the _timeout module and the adaptive timeouts of tools."""
+
+
+import pytest
+import time
+
+import numpy as np
+
+import rtestbench._timeout as timeout
+from rtestbench.core import Tool
+from rtestbench.core import ToolInfo
+
+
+class FakeInterface(object):
+    """In-memory virtual interface recording the timeout of each operation."""
+
+    def __init__(self):
+        self.timeout = 2000
+        self.timeouts = []
+
+    def write(self, command):
+        self.timeouts.append(self.timeout)
+
+    def query(self, request):
+        self.timeouts.append(self.timeout)
+        return "100000"
+
+    def query_binary_values(self, request, datatype, is_big_endian, container, header_fmt, data_points):
+        self.timeouts.append(self.timeout)
+        return np.zeros(data_points, dtype=np.float32)
+
+
+class FakeAcquisitionTool(Tool):
+    """Tool acquiring for one second before answering query_data()."""
+
+    def __init__(self):
+        Tool.__init__(self, ToolInfo())
+        self._virtual_interface = FakeInterface()
+        self._properties.transfer_formats = ["bin"]
+        self._properties.activated_transfer_format = "bin"
+
+    def query_number_data(self):
+        return self.query(":DATA:QUANtity?")
+
+    def expected_acquisition_time(self):
+        return 1.0
+
+
+@pytest.fixture
+def fake_tool():
+    return FakeAcquisitionTool()
+
+
+def test_estimate():
+    estimator = timeout.AdaptiveTimeout(base=100, margin=2, throughput=1e6)
+    assert estimator.estimate() == 100
+    assert estimator.estimate(n_bytes=1000000) == pytest.approx(2100)
+    assert estimator.estimate(acquisition_time=0.5) == pytest.approx(1100)
+
+    estimator.maximum = 1000
+    assert estimator.estimate(n_bytes=1000000) == 1000
+
+def test_update():
+    estimator = timeout.AdaptiveTimeout(throughput=1e6, smoothing=0.5)
+    estimator.update(100, 1.0) # Too small to measure the throughput
+    assert estimator.throughput == 1e6
+
+    estimator.update(3000000, 1.0)
+    assert estimator.throughput == pytest.approx(2e6)
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        timeout.AdaptiveTimeout(base=0)
+    with pytest.raises(ValueError):
+        timeout.AdaptiveTimeout(margin=0.5)
+    with pytest.raises(ValueError):
+        timeout.AdaptiveTimeout(smoothing=0)
+
+
+def test_tool_static_timeout(fake_tool):
+    fake_tool.send("*RST")
+    fake_tool.query_data(":FETC?")
+    assert set(fake_tool._virtual_interface.timeouts) == {2000}
+
+def test_tool_adaptive_timeout(fake_tool):
+    fake_tool.enable_adaptive_timeout(base=100, margin=2, throughput=1e6)
+
+    fake_tool.send("*RST")
+    assert fake_tool._virtual_interface.timeouts[-1] == pytest.approx(100, abs=1)
+
+    data = fake_tool.query_data(":FETC?")
+    number_query, fetch = fake_tool._virtual_interface.timeouts[-2:]
+    assert number_query == pytest.approx(100, abs=1) # Small query: fails fast
+    assert fetch == pytest.approx(100 + 2000 * (data.nbytes / 1e6 + 1.0), rel=1e-3)
+    assert fake_tool._virtual_interface.timeout == 2000 # Static timeout restored
+
+    fake_tool.disable_adaptive_timeout()
+    fake_tool.send("*RST")
+    assert fake_tool._virtual_interface.timeouts[-1] == 2000
+
+def test_tool_throughput_update(fake_tool):
+    fake_tool.enable_adaptive_timeout(throughput=1e6, smoothing=1.0)
+
+    # The acquisition was over: the whole duration is the transfer
+    fake_tool._update_throughput(1000000, time.time() - 0.5, acquisition_time=1.0)
+    assert fake_tool._adaptive_timeout.throughput == pytest.approx(2e6, rel=0.05)
+
+    # The transfer waited for the acquisition
+    fake_tool._update_throughput(1000000, time.time() - 1.25, acquisition_time=1.0)
+    assert fake_tool._adaptive_timeout.throughput == pytest.approx(4e6, rel=0.05)
+
+def test_tool_wait_operations(fake_tool):
+    fake_tool.wait_operations(1.0)
+    assert fake_tool._virtual_interface.timeouts[-1] == 3000
+    assert fake_tool._virtual_interface.timeout == 2000
+
+    fake_tool.enable_adaptive_timeout(base=100, margin=2, throughput=1e6)
+    fake_tool.wait_operations(1.0)
+    assert fake_tool._virtual_interface.timeouts[-1] == pytest.approx(2100, abs=1)
@@ -0,0 +1,138 @@
+"""Test for the _trigger module."""
+
+
+import logging
+import time
+import pytest
+
+import numpy as np
+
+import rtestbench._trigger as trigger
+from rtestbench.core import RTestBenchManager
+from rtestbench.core import Tool
+from rtestbench.core import ToolInfo
+
+
+class FakeInterface(object):
+    """In-memory virtual interface recording the triggers."""
+
+    def __init__(self):
+        self.written = []
+        self.triggered = None
+
+    def write(self, command):
+        self.written.append(command)
+        if command == "*TRG":
+            self.triggered = time.perf_counter()
+
+    def assert_trigger(self):
+        self.triggered = time.perf_counter()
+
+    def close(self):
+        pass
+
+
+class FakeTriggerTool(Tool):
+    """Tool measuring its index upon bus triggers."""
+
+    def __init__(self, index):
+        info = ToolInfo()
+        info.model = "Trigger {}".format(index)
+        Tool.__init__(self, info)
+        self._virtual_interface = FakeInterface()
+        self.index = index
+        self.count = None
+        self.armed = False
+
+    def set_bus_trigger(self, count=1):
+        self.count = count
+
+    def arm_trigger(self):
+        self.armed = True
+
+    def fetch_triggered_data(self):
+        if not self.armed or self._virtual_interface.triggered is None:
+            raise IOError("Not triggered.")
+        return np.full(self.count, self.index)
+
+
+@pytest.fixture
+def fake_tools():
+    return [FakeTriggerTool(index) for index in range(4)]
+
+@pytest.fixture
+def rtb_simulated_visaRM():
+    """Returns a non-verbose RTestBench with a simulated VISA resource manager."""
+
+    rtb = RTestBenchManager(verbose=False, visa_library='@sim')
+    logging.disable(logging.CRITICAL)
+
+    return rtb
+
+
+def test_report():
+    report = trigger.TriggerReport(trigger.TRIGGER_METHOD_ASSERT)
+    assert "assert" in str(report)
+
+def test_default_method(fake_tools):
+    assert trigger.default_method(fake_tools) == trigger.TRIGGER_METHOD_ASSERT
+
+@pytest.mark.parametrize("method", [trigger.TRIGGER_METHOD_ASSERT, trigger.TRIGGER_METHOD_COMMAND])
+def test_fire(fake_tools, method):
+    trigger.configure(fake_tools, 3)
+    trigger.arm(fake_tools)
+    report = trigger.TriggerReport(method)
+    trigger.fire(fake_tools, method, report)
+
+    assert set(report.trigger_times) == set(fake_tools)
+    assert report.skew == max(report.trigger_times.values()) - min(report.trigger_times.values())
+    assert all(tool._virtual_interface.triggered is not None for tool in fake_tools)
+
+    data = trigger.fetch(fake_tools)
+    assert all(np.array_equal(data[tool], [tool.index]*3) for tool in fake_tools)
+
+def test_fire_errors(fake_tools):
+    with pytest.raises(ValueError):
+        trigger.fire(fake_tools, "toto", trigger.TriggerReport("toto"))
+    with pytest.raises(ValueError):
+        trigger.fire(fake_tools, trigger.TRIGGER_METHOD_GROUP, trigger.TriggerReport("group"))
+
+    fake_tools[0]._virtual_interface = None
+    with pytest.raises(RuntimeError):
+        trigger.fire(fake_tools, trigger.TRIGGER_METHOD_ASSERT, trigger.TriggerReport("assert"))
+
+def test_fetch_not_triggered(fake_tools):
+    trigger.configure(fake_tools)
+    with pytest.raises(RuntimeError):
+        trigger.fetch(fake_tools)
+
+
+def test_manager_trigger_tools(rtb_simulated_visaRM, fake_tools):
+    with pytest.raises(ValueError):
+        rtb_simulated_visaRM.trigger_tools()
+
+    report = rtb_simulated_visaRM.trigger_tools(fake_tools, count=2, method=trigger.TRIGGER_METHOD_COMMAND)
+    assert report.method == trigger.TRIGGER_METHOD_COMMAND
+    assert report.skew >= 0
+    assert all(len(report.data[tool]) == 2 for tool in fake_tools)
+
+def test_manager_trigger_tools_group(rtb_simulated_visaRM, fake_tools, monkeypatch):
+    class FakeBoard(object):
+        def group_execute_trigger(self, *interfaces):
+            for interface in interfaces:
+                interface.assert_trigger()
+
+        def close(self):
+            pass
+
+    opened = []
+    def open_resource(address):
+        opened.append(address)
+        return FakeBoard()
+    monkeypatch.setattr(rtb_simulated_visaRM._router, "open_resource", open_resource) # The board is opened on its backend
+    for tool in fake_tools:
+        tool._virtual_interface.interface_number = 0
+
+    report = rtb_simulated_visaRM.trigger_tools(fake_tools, method=trigger.TRIGGER_METHOD_GROUP)
+    assert opened == ["GPIB0::INTFC"]
+    assert report.skew == 0
@@ -2,6 +2,7 @@
 
 
 from rtestbench.tools.keysight.electrometer import b298x
+from rtestbench.tools.keysight.multimeter import k344xx
 
 
 def get_keysight_tool(tool_info):
@@ -11,10 +12,12 @@ def get_keysight_tool(tool_info):
         ValueError: The model is not known from the system.
     """
 
-    try:
-        return get_keysight_electrometer(tool_info)
-    except ValueError: # When other families are added, update this part of the code.
-        raise ValueError("Unknown Keysight family of instruments/tools.")
+    for get_keysight_family_tool in (get_keysight_electrometer, get_keysight_multimeter):
+        try:
+            return get_keysight_family_tool(tool_info)
+        except ValueError:
+            continue
+    raise ValueError("Unknown Keysight family of instruments/tools.")
 
 
 def get_keysight_electrometer(tool_info):
@@ -29,3 +32,16 @@ def get_keysight_electrometer(tool_info):
         return b298x.B2987(tool_info)
     else:
         raise ValueError("Unknown Keysight electrometer model")
+
+def get_keysight_multimeter(tool_info):
+    # Truevolt 344xx series
+    if tool_info.model == "34460A":
+        return k344xx.K34460(tool_info)
+    elif tool_info.model == "34461A":
+        return k344xx.K34461(tool_info)
+    elif tool_info.model == "34465A":
+        return k344xx.K34465(tool_info)
+    elif tool_info.model == "34470A":
+        return k344xx.K34470(tool_info)
+    else:
+        raise ValueError("Unknown Keysight multimeter model")
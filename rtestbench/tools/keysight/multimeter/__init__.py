@@ -0,0 +1,7 @@
+
+# __all__ = [
+#     'k34460a',
+#     'k34461a',
+#     'k34465a',
+#     'k34470a'
+# ]
@@ -0,0 +1,291 @@
+"""Module dedicated to the control of the Keysight Truevolt multimeters 344xx series (34460A, 34461A, 34465A and 34470A)."""
+
+
+import logging
+
+import rtestbench.constants as const
+from rtestbench import _scpi
+from rtestbench.core import ToolInfo
+from rtestbench.tools.multimeter import Multimeter
+
+
+logger = logging.getLogger(__name__)
+
+KEYSIGHT_344XX_FUNCTION_VOLTAGE = "VOLTage"
+KEYSIGHT_344XX_FUNCTION_CURRENT = "CURRent"
+KEYSIGHT_344XX_FUNCTION_RESISTANCE = "RESistance"
+KEYSIGHT_344XX_FUNCTION_FOUR_WIRE_RESISTANCE = "FRESistance"
+KEYSIGHT_344XX_FUNCTION_FREQUENCY = "FREQuency"
+KEYSIGHT_344XX_FUNCTION_PERIOD = "PERiod"
+KEYSIGHT_344XX_FUNCTION_TEMPERATURE = "TEMPerature"
+KEYSIGHT_344XX_FUNCTION_CAPACITANCE = "CAPacitance"
+KEYSIGHT_344XX_FUNCTION_CONTINUITY = "CONTinuity"
+KEYSIGHT_344XX_FUNCTION_DIODE = "DIODe"
+KEYSIGHT_344XX_FUNCTIONS = _scpi.ScpiKeywords(KEYSIGHT_344XX_FUNCTION_VOLTAGE, KEYSIGHT_344XX_FUNCTION_CURRENT, KEYSIGHT_344XX_FUNCTION_RESISTANCE, KEYSIGHT_344XX_FUNCTION_FOUR_WIRE_RESISTANCE, KEYSIGHT_344XX_FUNCTION_FREQUENCY, KEYSIGHT_344XX_FUNCTION_PERIOD, KEYSIGHT_344XX_FUNCTION_TEMPERATURE, KEYSIGHT_344XX_FUNCTION_CAPACITANCE, KEYSIGHT_344XX_FUNCTION_CONTINUITY, KEYSIGHT_344XX_FUNCTION_DIODE)
+
+KEYSIGHT_344XX_COUPLING_DC = "DC"
+KEYSIGHT_344XX_COUPLING_AC = "AC"
+KEYSIGHT_344XX_COUPLINGS = _scpi.ScpiKeywords(KEYSIGHT_344XX_COUPLING_DC, KEYSIGHT_344XX_COUPLING_AC)
+KEYSIGHT_344XX_COUPLED_FUNCTIONS = _scpi.ScpiKeywords(KEYSIGHT_344XX_FUNCTION_VOLTAGE, KEYSIGHT_344XX_FUNCTION_CURRENT)
+
+KEYSIGHT_344XX_TRIGGER_SOURCE_IMMEDIATE = "IMMediate"
+KEYSIGHT_344XX_TRIGGER_SOURCE_BUS = "BUS"
+KEYSIGHT_344XX_TRIGGER_SOURCE_EXTERNAL = "EXTernal"
+KEYSIGHT_344XX_TRIGGER_SOURCE_INTERNAL = "INTernal"
+KEYSIGHT_344XX_TRIGGER_SOURCES = _scpi.ScpiKeywords(KEYSIGHT_344XX_TRIGGER_SOURCE_IMMEDIATE, KEYSIGHT_344XX_TRIGGER_SOURCE_BUS, KEYSIGHT_344XX_TRIGGER_SOURCE_EXTERNAL, KEYSIGHT_344XX_TRIGGER_SOURCE_INTERNAL)
+
+KEYSIGHT_344XX_SAMPLE_SOURCE_IMMEDIATE = "IMMediate"
+KEYSIGHT_344XX_SAMPLE_SOURCE_TIMER = "TIMer"
+KEYSIGHT_344XX_SAMPLE_SOURCES = _scpi.ScpiKeywords(KEYSIGHT_344XX_SAMPLE_SOURCE_IMMEDIATE, KEYSIGHT_344XX_SAMPLE_SOURCE_TIMER)
+
+
+# Command table, from which the setters and getters of the classes below are generated
+KEYSIGHT_344XX_COMMANDS = (
+    _scpi.ScpiCommand("display", ":DISPlay:STATe", bool, "switch"),
+    # Range
+    _scpi.ScpiCommand("range", ":SENSe:{activated_function}:RANGe", float),
+    _scpi.ScpiCommand("autorange", ":SENSe:{activated_function}:RANGe:AUTO", bool, "switch"),
+    # Aperture (integration) time
+    _scpi.ScpiCommand("aperture_time", ":SENSe:{activated_function}:APERture", float, description="the aperture/integration time"),
+    _scpi.ScpiCommand("nplc", ":SENSe:{activated_function}:NPLCycles", float, description="the integration time in power line cycles"),
+    _scpi.ScpiCommand("autozero", ":SENSe:{activated_function}:ZERO:AUTO", bool, "switch"),
+    # Trigger
+    _scpi.ScpiCommand("trigger_source", ":TRIGger:SOURce", KEYSIGHT_344XX_TRIGGER_SOURCES, "source_name"),
+    _scpi.ScpiCommand("trigger_count", ":TRIGger:COUNt", int, cache="activated_trigger_count"),
+    _scpi.ScpiCommand("trigger_delay", ":TRIGger:DELay", float),
+    # Sample (readings per trigger)
+    _scpi.ScpiCommand("sample_count", ":SAMPle:COUNt", int, cache="activated_sample_count"),
+    _scpi.ScpiCommand("sample_source", ":SAMPle:SOURce", KEYSIGHT_344XX_SAMPLE_SOURCES, "source_name", cache="activated_sample_source"),
+    _scpi.ScpiCommand("sample_timer", ":SAMPle:TIMer", float, cache="activated_sample_timer", description="the sample timer interval"),
+    # Measurement actions
+    _scpi.ScpiAction("initiate_measurement", ":INITiate:IMMediate", "initiate measurement with"),
+    _scpi.ScpiAction("clear_reading_memory", ":DATA:DELete NVMEM", "clear the reading memory of"),
+)
+
+
+
+@_scpi.scpi_commands(KEYSIGHT_344XX_COMMANDS)
+class K344XX(Multimeter):
+    """Interface common to all multimeters from the Keysight Truevolt 344xx series."""
+
+    COALESCED_GETTERS = Multimeter.COALESCED_GETTERS | {"get_function"}
+
+    def __init__(self, info: ToolInfo):
+        Multimeter.__init__(self, info)
+
+        # Generic properties
+        self._properties.transfer_formats = const.RTB_TRANSFERT_FORMATS
+
+        self._properties.bin_data_endianness = "big"
+        self._properties.bin_data_header = "ieee"
+        self._properties.bin_data_type = 'd'
+
+        self._properties.read_msg_terminator = '\n'
+        self._properties.write_msg_terminator = '\n'
+
+        self._properties.text_data_converter = 'e'
+        self._properties.text_data_separator = ','
+
+        # Specific properties
+        self._properties.update_properties(
+            activated_function="{}:{}".format(KEYSIGHT_344XX_FUNCTION_VOLTAGE, KEYSIGHT_344XX_COUPLING_DC),
+            activated_trigger_count=None,
+            activated_sample_count=None,
+            activated_sample_source=None,
+            activated_sample_timer=None
+        )
+
+
+    # Generic commands
+    def query_number_data(self, cached: bool = False) -> int:
+        """Queries the number of readings available in the reading memory.
+
+        Args:
+            cached: If True, the answer is memoized until the next command (e.g., :INITiate) is sent.
+        """
+
+        request = ":DATA:POINts?"
+        try:
+            number_data = _scpi.decode_int(self.query_cached(request, volatile=True) if cached else self.query(request))
+        except IOError as err:
+            logger.warning("%s cannot send the number of data available!", self._info)
+        else:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s is going to send data: %s expected.", self._info, number_data)
+            return number_data
+
+
+    # Common SCPI commands
+    def set_data_transfer_format(self, tsf_format: str, data_type: str):
+        """Sets the data transfer format of the tool (ASCII, or binary with 32- or 64-bit floats)."""
+
+        try:
+            self._properties.activated_transfer_format = tsf_format
+        except ValueError as err:
+            logger.error(err)
+            raise RuntimeError("Cannot sets the data transfer format as {} for the tool {}.".format(tsf_format, self._info))
+
+        if tsf_format in const.RTB_TRANSFERT_FORMAT_TEXT:
+            command = ":FORMat:DATA ASCii"
+        elif data_type in const.RTB_BIN_DATA_TYPES_FLOAT:
+            command = ":FORMat:DATA REAL,32"
+        elif data_type in const.RTB_BIN_DATA_TYPES_DOUBLE:
+            command = ":FORMat:DATA REAL,64"
+        else:
+            raise NotImplementedError("The data_type argument must be in {} or in {} to use binary data for the tool {}.".format(
+                const.RTB_BIN_DATA_TYPES_FLOAT,
+                const.RTB_BIN_DATA_TYPES_DOUBLE,
+                self._info
+            ))
+
+        try:
+            self.send(command)
+            if tsf_format in const.RTB_TRANSFERT_FORMAT_TEXT:
+                self._properties.text_data_converter = data_type
+            else:
+                self._properties.bin_data_type = data_type
+        except IOError as err:
+            logger.error(err)
+            raise RuntimeError("Cannot sets the data transfer format with {} for the tool {}.".format(command, self._info))
+        else:
+            logger.debug("The data transfer format is now set with %s.", command)
+
+
+    def lock(self):
+        """Requests a remote lock of the tool's I/O interface."""
+
+        try:
+            if not self.query_bool(":SYSTem:LOCK:REQuest?"):
+                logger.warning("%s cannot be locked!", self._info)
+        except IOError:
+            logger.warning("%s cannot be locked!", self._info)
+            raise
+        else:
+            logger.info("%s is now locked.", self._info)
+
+    def unlock(self):
+        """Releases the remote lock of the tool's I/O interface."""
+
+        try:
+            self.send(":SYSTem:LOCK:RELease")
+        except IOError:
+            logger.warning("%s cannot be unlocked!", self._info)
+            raise
+        else:
+            logger.info("%s is now unlocked.", self._info)
+
+
+    def expected_acquisition_time(self) -> float:
+        """Returns the sample timer multiplied by the number of readings, in seconds (0 if the readings are not paced by the timer)."""
+
+        properties = self._properties
+        if properties.activated_sample_source != KEYSIGHT_344XX_SAMPLE_SOURCE_TIMER or None in (
+                properties.activated_sample_timer, properties.activated_sample_count, properties.activated_trigger_count):
+            return 0.0
+        return properties.activated_sample_timer * properties.activated_sample_count * properties.activated_trigger_count
+
+
+    # Measurement function interface
+    def set_function(self, function: str, coupling: str = None):
+        """Selects the measurement function (e.g., 'VOLT'), with its coupling ('DC' or 'AC') for voltages and currents (DC if None).
+
+        The range, aperture time and auto-zero setters then apply to this function.
+        """
+
+        keyword = KEYSIGHT_344XX_FUNCTIONS.match(function)
+        if keyword is None:
+            raise ValueError("The function argument must be in {}.".format(KEYSIGHT_344XX_FUNCTIONS))
+        if keyword in KEYSIGHT_344XX_COUPLED_FUNCTIONS:
+            coupled = KEYSIGHT_344XX_COUPLINGS.match(coupling if coupling is not None else KEYSIGHT_344XX_COUPLING_DC)
+            if coupled is None:
+                raise ValueError("The coupling argument must be in {}.".format(KEYSIGHT_344XX_COUPLINGS))
+            keyword = "{}:{}".format(keyword, coupled)
+        elif coupling is not None:
+            raise ValueError("The function {} has no coupling.".format(keyword))
+
+        try:
+            self.send(":SENSe:FUNCtion \"{}\"".format(keyword))
+        except IOError as err:
+            logger.error(err)
+            raise RuntimeError("Cannot set the function to {} on {}.".format(keyword, self._info))
+        self._properties.activated_function = keyword
+
+    def get_function(self) -> str:
+        """Gets the measurement function (e.g., 'VOLTage:DC')."""
+
+        try:
+            answer = self.query(":SENSe:FUNCtion?").strip().strip('"')
+        except IOError as err:
+            logger.error(err)
+            raise RuntimeError("Cannot get the function from {}.".format(self._info))
+
+        function, _, coupling = answer.partition(':')
+        keyword = KEYSIGHT_344XX_FUNCTIONS.match(function)
+        if keyword is None or (coupling and coupling not in KEYSIGHT_344XX_COUPLINGS):
+            raise RuntimeError("Unexpected answer for the function from {}: {}".format(self._info, answer))
+        if keyword in KEYSIGHT_344XX_COUPLED_FUNCTIONS:
+            keyword = "{}:{}".format(keyword, KEYSIGHT_344XX_COUPLINGS.match(coupling or KEYSIGHT_344XX_COUPLING_DC))
+        self._properties.activated_function = keyword
+        return keyword
+
+
+    # Bus trigger interface
+    def set_bus_trigger(self, count: int = 1):
+        """Configures the acquisition to take count readings upon a single bus trigger, paced by the sample source."""
+
+        self.set_trigger_source(KEYSIGHT_344XX_TRIGGER_SOURCE_BUS)
+        self.set_trigger_count(1)
+        self.set_sample_count(count)
+
+
+    # Measurement actions interface
+    def fetch_data(self):
+        """Returns the readings of the reading memory, waiting for the measurement to complete (see query_data())."""
+
+        try:
+            return self.query_data(":FETCh?")
+        except IOError as err:
+            logger.error(err)
+            raise RuntimeError("Cannot fetch data from {}.".format(self._info))
+
+    def fetch_all_data(self, out=None):
+        """Returns the readings of the reading memory, waiting for the measurement to complete.
+
+        In binary, the readings are streamed into a NumPy array (out if given) in one IEEE block (see query_block()).
+        """
+
+        try:
+            if self._properties.activated_transfer_format in const.RTB_TRANSFERT_FORMAT_BIN:
+                return self.query_block(":FETCh?", out=out)
+            return self.query_data(":FETCh?")
+        except IOError as err:
+            logger.error(err)
+            raise RuntimeError("Cannot fetch data from {}.".format(self._info))
+
+
+class K34460(K344XX):
+    """Interface specific to the Keysight 34460A multimeter."""
+
+    def __init__(self, info: ToolInfo):
+        K344XX.__init__(self, info)
+
+
+class K34461(K344XX):
+    """Interface specific to the Keysight 34461A multimeter."""
+
+    def __init__(self, info: ToolInfo):
+        K344XX.__init__(self, info)
+
+
+class K34465(K344XX):
+    """Interface specific to the Keysight 34465A multimeter."""
+
+    def __init__(self, info: ToolInfo):
+        K344XX.__init__(self, info)
+
+
+class K34470(K344XX):
+    """Interface specific to the Keysight 34470A multimeter."""
+
+    def __init__(self, info: ToolInfo):
+        K344XX.__init__(self, info)
@@ -2,12 +2,141 @@
 from rtestbench.core import Tool
 
 
+MULTIMETER_SAMPLE_SOURCE_IMMEDIATE = "IMMediate"
+MULTIMETER_SAMPLE_SOURCE_TIMER = "TIMer"
+
+
 class Multimeter(Tool):
 
     """Interface class for features common to all multimeters.
 
-    All functions defined here must be overriden in daughter classes implementing actual multimeters.
+    All functions defined here must be overriden in daughter classes implementing actual multimeters,
+    except the buffered measurement, which relies on the trigger and sample interfaces below.
+
+    A buffered measurement takes a given number of readings per trigger into the reading memory of the multimeter,
+    paced by its sample timer, then fetches them all at once instead of reading each point.
     """
 
+    def __init__(self, info):
+        info.family = "multimeter"
+
+        Tool.__init__(self, info)
+
+
+    # Measurement function interface
+    def set_function(self, function: str, coupling: str = None):
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+    def get_function(self) -> str:
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+
+    # Range interface
+    def set_range(self, value):
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+    def get_range(self):
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+
+    def set_autorange(self, switch: bool):
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+
+    def set_range_min(self):
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+    def set_range_max(self):
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+
+    # Aperture (integration) time interface
+    def set_aperture_time(self, value):
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+    def get_aperture_time(self):
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+    def set_integration_time(self, value):
+        self.set_aperture_time(value)
+    def get_integration_time(self):
+        return self.get_aperture_time()
+
+    def set_nplc(self, value):
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+    def get_nplc(self):
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+
+    # Trigger interface
+    def set_trigger_source(self, source_name: str):
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+    def get_trigger_source(self) -> str:
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+
+    def set_trigger_count(self, value: int):
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+    def get_trigger_count(self) -> int:
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+
+    # Sample (readings per trigger) interface
+    def set_sample_count(self, value: int):
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+    def get_sample_count(self) -> int:
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+
+    def set_sample_source(self, source_name: str):
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+    def get_sample_source(self) -> str:
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+
+    def set_sample_timer(self, value: float):
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+    def get_sample_timer(self) -> float:
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+
+    # Measurement actions interface
+    def initiate_measurement(self):
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+    def fetch_data(self):
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+    def fetch_all_data(self, out=None):
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+
+
+    # Buffered measurement
+    def configure_buffered_measurement(self, count: int, sample_timer: float = None):
+        """Configures each trigger to take count readings into the reading memory.
+
+        Args:
+            count: An int giving the number of readings.
+            sample_timer: The interval in seconds between the readings, or None to take them as fast as possible.
+        Raises:
+            ValueError: count is not a positive int.
+        """
+
+        if not isinstance(count, int) or isinstance(count, bool) or count < 1:
+            raise ValueError("The count argument must be a positive int.")
+        self.set_trigger_count(1)
+        self.set_sample_count(count)
+        if sample_timer is None:
+            self.set_sample_source(MULTIMETER_SAMPLE_SOURCE_IMMEDIATE)
+        else:
+            self.set_sample_source(MULTIMETER_SAMPLE_SOURCE_TIMER)
+            self.set_sample_timer(sample_timer)
+
+    def arm_buffered_measurement(self):
+        """Initiates the buffered measurement, which starts upon the trigger (immediately with an immediate trigger source)."""
+
+        self.initiate_measurement()
+
+    def fetch_buffered_data(self, out=None):
+        """Returns all readings of the reading memory at once (see fetch_all_data()), waiting for the measurement to complete.
+
+        Args:
+            out: A NumPy array receiving the readings in binary transfers (allocated if None), e.g., to reuse a buffer.
+        """
+
+        return self.fetch_all_data(out)
+
+
+    # Bus trigger interface
+    def arm_trigger(self):
+        """Initiates the measurement, which then waits for the bus trigger."""
+
+        self.initiate_measurement()
+
+    def fetch_triggered_data(self):
+        """Returns all readings taken upon the bus trigger."""
 
-    pass
+        return self.fetch_all_data()
@@ -1,20 +1,111 @@
+import numpy as np
+import pyvisa as visa
 
 from rtestbench.core import Tool
 
 
+OSCILLOSCOPE_WAVEFORM_FORMAT_BYTE = "BYTE"
+OSCILLOSCOPE_WAVEFORM_FORMAT_WORD = "WORD"
+
+
+class WaveformPreamble(object):
+    """Scaling of the raw waveform data of a source, as described by the preamble of the oscilloscope.
+
+    The time of sample i is (i - x_reference) * x_increment + x_origin,
+    and its voltage is (raw - y_reference) * y_increment + y_origin.
+
+    Attributes:
+        points: An int giving the number of samples.
+        x_increment, x_origin, x_reference: Floats giving the time scaling.
+        y_increment, y_origin, y_reference: Floats giving the voltage scaling.
+        gain, offset: Floats of the voltage scaling folded into a single affine function (raw * gain + offset).
+    """
+
+    __slots__ = ("points", "x_increment", "x_origin", "x_reference", "y_increment", "y_origin", "y_reference", "gain", "offset")
+
+    def __init__(self, points: int, x_increment: float, x_origin: float, x_reference: float,
+                 y_increment: float, y_origin: float, y_reference: float):
+        self.points = points
+        self.x_increment = x_increment
+        self.x_origin = x_origin
+        self.x_reference = x_reference
+        self.y_increment = y_increment
+        self.y_origin = y_origin
+        self.y_reference = y_reference
+        self.gain = y_increment
+        self.offset = y_origin - y_reference * y_increment
+
+    def scale(self, raw: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """Returns the voltages of the raw data as float32, computed in out (allocated if None) without temporary arrays."""
+
+        if out is None:
+            out = np.empty(raw.shape, dtype=np.float32)
+        np.multiply(raw, self.gain, out=out, casting="unsafe")
+        out += np.float32(self.offset)
+        return out
+
+    def time_axis(self) -> np.ndarray:
+        """Returns the time of each sample in seconds."""
+
+        return (np.arange(self.points) - self.x_reference) * self.x_increment + self.x_origin
+
+
+def parse_preamble(answer: str) -> WaveformPreamble:
+    """Parses a preamble written as '<format>,<type>,<points>,<count>,<x increment>,<x origin>,<x reference>,
+    <y increment>,<y origin>,<y reference>' (e.g., Keysight, Agilent and Rigol oscilloscopes).
+
+    Raises:
+        ValueError: The preamble is malformed.
+    """
+
+    fields = answer.strip().split(',')
+    if len(fields) < 10:
+        raise ValueError("The preamble {} does not have 10 fields.".format(answer))
+    return WaveformPreamble(int(float(fields[2])), *(float(field) for field in fields[4:10]))
+
+
 class Oscilloscope(Tool):
 
     """Interface class for features common to all oscilloscopes.
 
-    All functions defined here must be overriden in daughter classes implementing actual oscilloscopes.
+    All functions defined here must be overriden in daughter classes implementing actual oscilloscopes,
+    except the waveform transfer engine, which only needs the SCPI messages declared below.
+
+    Attributes:
+        _preambles: A dict associating each source with its cached WaveformPreamble.
+        _raw_buffers: A dict associating each source with the array reused to receive its raw data.
+        _selected_source: The source currently selected for the transfers, or None.
     """
 
+    # SCPI messages of the waveform transfer engine, declared by daughter classes ({source} and {format} are replaced)
+    WAVEFORM_SOURCE_COMMAND = None      # e.g., ":WAVeform:SOURce {source}"
+    WAVEFORM_FORMAT_COMMAND = None      # e.g., ":WAVeform:FORMat {format}"
+    WAVEFORM_PREAMBLE_REQUEST = None    # e.g., ":WAVeform:PREamble?"
+    WAVEFORM_DATA_REQUEST = None        # e.g., ":WAVeform:DATA?"
+    WAVEFORM_FORMATS = {OSCILLOSCOPE_WAVEFORM_FORMAT_BYTE: 'B', OSCILLOSCOPE_WAVEFORM_FORMAT_WORD: 'H'} # Binary data type of each format ('b' and 'h' if signed)
+    WAVEFORM_UNSIGNED_COMMAND = None    # e.g., ":WAVeform:UNSigned {switch}", making the signedness of the data match WAVEFORM_FORMATS
+    WAVEFORM_COMPOUND_QUERIES = False   # True if several queries can be sent in one message (one round trip for all sources)
+
+    # SCPI messages of the segmented acquisition, declared by daughter classes ({count}, {index} and {switch} are replaced)
+    SEGMENTED_ON_COMMAND = None         # e.g., ":ACQuire:MODE SEGMented"
+    SEGMENTED_OFF_COMMAND = None        # e.g., ":ACQuire:MODE RTIMe"
+    SEGMENTED_COUNT_COMMAND = None      # e.g., ":ACQuire:SEGMented:COUNt {count}"
+    SEGMENTED_COUNT_REQUEST = None      # e.g., ":WAVeform:SEGMented:COUNt?" (number of segments acquired)
+    SEGMENTED_INDEX_COMMAND = None      # e.g., ":ACQuire:SEGMented:INDex {index}" (from 1)
+    SEGMENTED_TIME_TAG_REQUEST = None   # e.g., ":WAVeform:SEGMented:TTAG?" (time tag of the current segment)
+    SEGMENTED_TIME_TAGS_REQUEST = None  # Request answering the time tags of all segments separated by commas, if any
+    SEGMENTED_ALL_COMMAND = None        # e.g., ":WAVeform:SEGMented:ALL {switch}", making WAVEFORM_DATA_REQUEST answer all segments in one block
+
 
     def __init__(self, info):
         info.family = "oscilloscope"
 
         Tool.__init__(self, info)
-    
+
+        self._preambles = dict()
+        self._raw_buffers = dict()
+        self._selected_source = None
+
 
     # Coupling
     def set_coupling(self, channel, mode):
@@ -51,6 +142,215 @@ class Oscilloscope(Tool):
     def get_trigger_source(self) -> str:
         raise NotImplementedError("This function must be implemented in daughter classes.")
 
+
+    # Waveform transfer engine
+    def send(self, command: str) -> int:
+        """Sends an SCPI command; the cached preambles are forgotten, since the command may change the scaling."""
+
+        self._preambles.clear()
+        self._selected_source = None
+        return Tool.send(self, command)
+
+    def _waveform_message(self, message: str, **fields) -> str:
+        if message is None:
+            raise NotImplementedError("The waveform transfer is not declared for the tool {}.".format(self._info))
+        return message.format(**fields)
+
+    def _select_source(self, source: str):
+        if source != self._selected_source:
+            Tool.send(self, self._waveform_message(self.WAVEFORM_SOURCE_COMMAND, source=source)) # Keeps the cached preambles
+            self._selected_source = source
+
+    def set_waveform_format(self, waveform_format: str):
+        """Selects the binary format of the waveform transfers (see WAVEFORM_FORMATS), and its signedness if declared.
+
+        Raises:
+            ValueError: The format is not supported by the tool.
+        """
+
+        data_type = self.WAVEFORM_FORMATS.get(waveform_format.upper())
+        if data_type is None:
+            raise ValueError("The waveform_format argument must be in {}.".format(tuple(self.WAVEFORM_FORMATS)))
+        self.send(self._waveform_message(self.WAVEFORM_FORMAT_COMMAND, format=waveform_format.upper()))
+        if self.WAVEFORM_UNSIGNED_COMMAND is not None:
+            self.send(self._waveform_message(self.WAVEFORM_UNSIGNED_COMMAND, switch="ON" if np.dtype(data_type).kind == 'u' else "OFF"))
+        self._properties.bin_data_type = data_type
+        self._raw_buffers.clear()
+
+    def get_preamble(self, source: str) -> WaveformPreamble:
+        """Returns the WaveformPreamble of source, queried only if no command has been sent since the last query."""
+
+        preamble = self._preambles.get(source)
+        if preamble is None:
+            self._select_source(source)
+            preamble = self._preambles[source] = self.parse_preamble(self.query(self._waveform_message(self.WAVEFORM_PREAMBLE_REQUEST)))
+        return preamble
+
+    def parse_preamble(self, answer: str) -> WaveformPreamble:
+        """Parses the answer to WAVEFORM_PREAMBLE_REQUEST (see parse_preamble()); to be overriden for other layouts."""
+
+        return parse_preamble(answer)
+
+    def _raw_buffer(self, source: str, points: int) -> np.ndarray:
+        dtype = np.dtype(('>' if self._properties.bin_data_endianness == "big" else '<') + self._properties.bin_data_type)
+        buffer = self._raw_buffers.get(source)
+        if buffer is None or buffer.size < points or buffer.dtype != dtype:
+            buffer = self._raw_buffers[source] = np.empty(points, dtype=dtype)
+        return buffer
+
+    def fetch_waveform(self, source: str, out: np.ndarray = None) -> np.ndarray:
+        """Returns the waveform of source in volts, as float32.
+
+        The raw data are streamed into a buffer reused between calls, then scaled into out (allocated if None).
+        """
+
+        preamble = self.get_preamble(source)
+        self._select_source(source)
+        raw = self.query_block(self._waveform_message(self.WAVEFORM_DATA_REQUEST), out=self._raw_buffer(source, preamble.points))
+        return preamble.scale(raw, out[:raw.size] if out is not None else None)
+
+    def fetch_waveforms(self, sources: list, out: np.ndarray = None) -> np.ndarray:
+        """Returns the waveforms of several sources in volts, as the rows of a 2-D float32 array.
+
+        If the tool accepts compound queries, all sources are fetched in one round trip.
+
+        Args:
+            out: A 2-D float32 array receiving the waveforms (allocated if None).
+        Raises:
+            ValueError: The sources do not have the same number of samples, or out is too small.
+        """
+
+        preambles = [self.get_preamble(source) for source in sources]
+        points = preambles[0].points
+        if any(preamble.points != points for preamble in preambles):
+            raise ValueError("The sources {} do not have the same number of samples.".format(sources))
+        if out is None:
+            out = np.empty((len(sources), points), dtype=np.float32)
+        elif out.shape[0] < len(sources) or out.shape[1] < points:
+            raise ValueError("The out argument must have at least the shape {}.".format((len(sources), points)))
+
+        if not self.WAVEFORM_COMPOUND_QUERIES:
+            for row, source in enumerate(sources):
+                self.fetch_waveform(source, out[row, :points])
+            return out[:len(sources), :points]
+
+        data_request = self._waveform_message(self.WAVEFORM_DATA_REQUEST)
+        raw_buffers = [self._raw_buffer(source, points) for source in sources]
+        self._query_blocks(";".join("{};{}".format(self._waveform_message(self.WAVEFORM_SOURCE_COMMAND, source=source), data_request)
+                                    for source in sources), raw_buffers)
+        self._selected_source = sources[-1]
+        for row, (preamble, raw) in enumerate(zip(preambles, raw_buffers)):
+            preamble.scale(raw[:points], out[row, :points])
+        return out[:len(sources), :points]
+
+    def _query_blocks(self, request: str, buffers: list):
+        """Sends a compound request answered by consecutive IEEE binary blocks, read into buffers."""
+
+        Tool.send(self, request) # Keeps the cached preambles
+        acquisition_time = self.expected_acquisition_time() if self._adaptive_timeout is not None else 0.0
+        try:
+            with self._operation_timeout(sum(buffer.nbytes for buffer in buffers), acquisition_time):
+                for buffer in buffers:
+                    self._read_block(buffer)
+        except visa.VisaIOError as err:
+            raise IOError("Cannot get an answer from the request {}; origin comes from {}.".format(request, err.description))
+
+
+    # Segmented acquisition
+    def set_segmented_acquisition(self, switch: bool, count: int = None):
+        """Switches the segmented acquisition on or off, with count segments (the number set on the tool if None).
+
+        Raises:
+            ValueError: count is not a positive int.
+        """
+
+        if count is not None and (not isinstance(count, int) or isinstance(count, bool) or count < 1):
+            raise ValueError("The count argument must be a positive int.")
+        if switch:
+            self.send(self._waveform_message(self.SEGMENTED_ON_COMMAND))
+            if count is not None:
+                self.send(self._waveform_message(self.SEGMENTED_COUNT_COMMAND, count=count))
+        else:
+            self.send(self._waveform_message(self.SEGMENTED_OFF_COMMAND))
+
+    def get_segment_count(self) -> int:
+        """Returns the number of segments acquired."""
+
+        return self.query_int(self._waveform_message(self.SEGMENTED_COUNT_REQUEST))
+
+    def _select_segment(self, index: int) -> str:
+        return self._waveform_message(self.SEGMENTED_INDEX_COMMAND, index=index)
+
+    def fetch_segment_time_tags(self, count: int = None) -> np.ndarray:
+        """Returns the time tag in seconds of the count first segments (all segments acquired if None), as float64.
+
+        The time tags are queried in one round trip if the tool answers them all at once or accepts compound queries.
+        """
+
+        if self.SEGMENTED_TIME_TAGS_REQUEST is not None:
+            time_tags = np.array(self.query(self.SEGMENTED_TIME_TAGS_REQUEST).split(','), dtype=np.float64)
+            return time_tags[:count] if count is not None else time_tags
+
+        if count is None:
+            count = self.get_segment_count()
+        time_tag_request = self._waveform_message(self.SEGMENTED_TIME_TAG_REQUEST)
+        if self.WAVEFORM_COMPOUND_QUERIES:
+            answer = self.query(";".join("{};{}".format(self._select_segment(index), time_tag_request) for index in range(1, count + 1)))
+            return np.array(answer.split(';'), dtype=np.float64)
+
+        time_tags = np.empty(count, dtype=np.float64)
+        for index in range(1, count + 1):
+            Tool.send(self, self._select_segment(index))
+            time_tags[index - 1] = self.query_float(time_tag_request)
+        return time_tags
+
+    def fetch_segments(self, source: str, count: int = None, out: np.ndarray = None, time_tags: bool = True) -> tuple:
+        """Returns the count first segments of source (all segments acquired if None) in volts, as the rows of a 2-D float32 array.
+
+        The segments are transferred in one block if the tool declares SEGMENTED_ALL_COMMAND, in one round trip
+        if it accepts compound queries, or one by one otherwise; the raw data are always read into a buffer reused between calls.
+
+        Args:
+            out: A 2-D float32 array receiving the segments (allocated if None).
+            time_tags: If True, the time tag of each segment is fetched too (see fetch_segment_time_tags()).
+        Returns:
+            A tuple (segments, time tags), the time tags being None if not fetched.
+        Raises:
+            ValueError: out is too small, or count is larger than the number of segments acquired.
+        """
+
+        acquired = self.get_segment_count() if count is None or self.SEGMENTED_ALL_COMMAND is not None else count
+        if count is None:
+            count = acquired
+        elif count > acquired:
+            raise ValueError("The count argument must be at most the number of segments acquired ({}).".format(acquired))
+        preamble = self.get_preamble(source)
+        points = preamble.points
+        if out is None:
+            out = np.empty((count, points), dtype=np.float32)
+        elif out.shape[0] < count or out.shape[1] < points:
+            raise ValueError("The out argument must have at least the shape {}.".format((count, points)))
+
+        self._select_source(source)
+        raw = self._raw_buffer(source, acquired * points)[:acquired * points].reshape(-1, points)
+        data_request = self._waveform_message(self.WAVEFORM_DATA_REQUEST)
+        if self.SEGMENTED_ALL_COMMAND is not None:
+            Tool.send(self, self.SEGMENTED_ALL_COMMAND.format(switch="ON"))
+            try:
+                self.query_block(data_request, out=raw) # All segments acquired are answered
+            finally:
+                Tool.send(self, self.SEGMENTED_ALL_COMMAND.format(switch="OFF"))
+        elif self.WAVEFORM_COMPOUND_QUERIES:
+            self._query_blocks(";".join("{};{}".format(self._select_segment(index), data_request) for index in range(1, count + 1)), list(raw[:count]))
+        else:
+            for index in range(count):
+                Tool.send(self, self._select_segment(index + 1))
+                self.query_block(data_request, out=raw[index])
+
+        segments = preamble.scale(raw[:count], out[:count, :points])
+        return segments, self.fetch_segment_time_tags(count) if time_tags else None
+
+
     # Measurement actions interface
     def fetch_data(self, source_name):
-        raise NotImplementedError("This function must be implemented in daughter classes.")
+        return self.fetch_waveform(source_name)
@@ -1,13 +1,170 @@
+import numpy as np
 
 from rtestbench.core import Tool
 
 
+SUPPLY_LIST_STEP_AUTO = "AUTO"      # Each step lasts its dwell time
+SUPPLY_LIST_STEP_TRIGGER = "ONCE"   # Each trigger advances one step
+
+
 class Supply(Tool):
 
     """Interface class for features common to all voltage supplies.
 
-    All functions defined here must be overriden in daughter classes implementing actual supplies.
+    All functions defined here must be overriden in daughter classes implementing actual supplies,
+    except the sequence (list) engine, which only needs the SCPI messages declared below.
+
+    A sequence is uploaded at once (voltages, currents and dwell times as binary blocks), stepped by the supply itself,
+    on its dwell times or on hardware triggers, then the voltages and currents measured at each step are read back at once.
+
+    Attributes:
+        _sequence_duration: A float giving the duration in seconds of the uploaded sequence, with its repetitions.
     """
 
+    # SCPI messages of the sequence engine, declared by daughter classes ({count} and {step} are replaced)
+    LIST_VOLTAGE_COMMAND = None         # e.g., ":LIST:VOLTage" (followed by a binary block)
+    LIST_CURRENT_COMMAND = None         # e.g., ":LIST:CURRent" (followed by a binary block)
+    LIST_DWELL_COMMAND = None           # e.g., ":LIST:DWELl" (followed by a binary block)
+    LIST_COUNT_COMMAND = None           # e.g., ":LIST:COUNt {count}"
+    LIST_STEP_COMMAND = None            # e.g., ":LIST:STEP {step}" (SUPPLY_LIST_STEP_AUTO or SUPPLY_LIST_STEP_TRIGGER)
+    LIST_ON_COMMAND = None              # e.g., ":VOLTage:MODE LIST;:CURRent:MODE LIST"
+    LIST_OFF_COMMAND = None             # e.g., ":VOLTage:MODE FIXed;:CURRent:MODE FIXed"
+    LIST_INITIATE_COMMAND = None        # e.g., ":INITiate:TRANsient"
+    LIST_TRIGGER_COMMAND = None         # e.g., ":TRIGger:TRANsient:IMMediate" (starts the initiated sequence whatever the trigger source)
+    READBACK_VOLTAGE_REQUEST = None     # e.g., ":FETCh:ARRay:VOLTage?" (answered by a binary block)
+    READBACK_CURRENT_REQUEST = None     # e.g., ":FETCh:ARRay:CURRent?" (answered by a binary block)
+
+
+    def __init__(self, info):
+        info.family = "supply"
+
+        Tool.__init__(self, info)
+
+        self._sequence_duration = 0.0
+
+
+    # Output interface
+    def set_output(self, switch: bool):
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+    def get_output(self) -> bool:
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+
+    # Level interface
+    def set_voltage(self, value: float):
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+    def get_voltage(self) -> float:
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+
+    def set_current(self, value: float):
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+    def get_current(self) -> float:
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+
+    # Measurement interface
+    def measure_voltage(self) -> float:
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+    def measure_current(self) -> float:
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+
+    # Trigger interface
+    def set_trigger_source(self, source_name: str):
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+    def get_trigger_source(self) -> str:
+        raise NotImplementedError("This function must be implemented in daughter classes.")
+
+
+    # Sequence (list) engine
+    def _sequence_message(self, message: str, **fields) -> str:
+        if message is None:
+            raise NotImplementedError("The sequence mode is not declared for the tool {}.".format(self._info))
+        return message.format(**fields)
+
+    def upload_sequence(self, voltages, currents=None, dwell_times=None, count: int = 1):
+        """Uploads a sequence of steps and switches the supply to the sequence mode.
+
+        Args:
+            voltages: An array of the voltage of each step.
+            currents: An array of the current (limit) of each step, a single value for all steps, or None to leave it.
+            dwell_times: An array of the duration in seconds of each step, a single value for all steps, or None to leave it.
+            count: An int giving the number of repetitions of the sequence.
+        Raises:
+            ValueError: The arrays are empty or do not have the same length, or count is not a positive int.
+        """
+
+        voltages = np.atleast_1d(np.asarray(voltages, dtype=np.float64))
+        if voltages.ndim != 1 or voltages.size == 0:
+            raise ValueError("The voltages argument must be a non-empty 1-D array.")
+        lists = [(self.LIST_VOLTAGE_COMMAND, voltages)]
+        for name, values, command in (("currents", currents, self.LIST_CURRENT_COMMAND), ("dwell_times", dwell_times, self.LIST_DWELL_COMMAND)):
+            if values is not None:
+                values = np.atleast_1d(np.asarray(values, dtype=np.float64))
+                if values.ndim != 1 or values.size not in (1, voltages.size):
+                    raise ValueError("The {} argument must be a single value or an array of {} values.".format(name, voltages.size))
+                lists.append((command, values))
+        if not isinstance(count, int) or isinstance(count, bool) or count < 1:
+            raise ValueError("The count argument must be a positive int.")
+
+        for command, values in lists:
+            self.send_block(self._sequence_message(command), values)
+        self.send(self._sequence_message(self.LIST_COUNT_COMMAND, count=count))
+        self.send(self._sequence_message(self.LIST_ON_COMMAND))
+
+        if dwell_times is not None:
+            dwell_times = lists[-1][1]
+            self._sequence_duration = count * (float(dwell_times.sum()) if dwell_times.size > 1 else float(dwell_times[0]) * voltages.size)
+        else:
+            self._sequence_duration = 0.0 # Unknown
+
+    def set_sequence_stepping(self, triggered: bool):
+        """Steps the sequence on the triggers (hardware or bus, see set_trigger_source()) if True, on the dwell times otherwise."""
+
+        self.send(self._sequence_message(self.LIST_STEP_COMMAND, step=SUPPLY_LIST_STEP_TRIGGER if triggered else SUPPLY_LIST_STEP_AUTO))
+
+    def run_sequence(self):
+        """Initiates the sequence, which starts upon the trigger."""
+
+        self.send(self._sequence_message(self.LIST_INITIATE_COMMAND))
+
+    def trigger_sequence(self):
+        """Starts the initiated sequence at once with a software trigger, whatever the trigger source."""
+
+        self.send(self._sequence_message(self.LIST_TRIGGER_COMMAND))
+
+    def disable_sequence(self):
+        """Switches the supply back to fixed levels."""
+
+        self.send(self._sequence_message(self.LIST_OFF_COMMAND))
+
+    def fetch_sequence_readings(self, voltages_out: np.ndarray = None, currents_out: np.ndarray = None) -> tuple:
+        """Returns the voltage and current measured at each step of the sequence, each in one binary block.
+
+        Args:
+            voltages_out, currents_out: Arrays of the binary data type of the tool receiving the readings (allocated if None).
+        Returns:
+            A tuple of two NumPy arrays (voltages, currents).
+        """
+
+        voltages = self.query_block(self._sequence_message(self.READBACK_VOLTAGE_REQUEST), out=voltages_out)
+        currents = self.query_block(self._sequence_message(self.READBACK_CURRENT_REQUEST), out=currents_out)
+        return voltages, currents
+
+    def sweep_voltage(self, voltages, current_limit: float, dwell_time: float) -> tuple:
+        """Sweeps the voltages, each applied during dwell_time seconds, and returns the measured voltages and currents.
+
+        The sequence is started by a software trigger, and its readings are fetched once it is complete (see wait_operations()).
+
+        Returns:
+            A tuple of two NumPy arrays (voltages, currents), see fetch_sequence_readings().
+        """
+
+        self.upload_sequence(voltages, current_limit, dwell_time)
+        self.set_sequence_stepping(False)
+        self.run_sequence()
+        self.trigger_sequence()
+        self.wait_operations(self._sequence_duration)
+        return self.fetch_sequence_readings()
+
+    def expected_acquisition_time(self) -> float:
+        """Returns the duration of the uploaded sequence in seconds (0 if unknown), to adapt the timeout of its readback."""
 
-    pass
+        return self._sequence_duration
@@ -5,12 +5,14 @@ import rtestbench
 # Step 1 - create the software remote test bench
 testbench = rtestbench.Manager()
 
-# Step 2 - detect available tools
-available_tools = testbench.detect_tools()
+# Step 2 - detect available tools (identify=True also asks each tool for its identity)
+available_tools = testbench.detect_tools(identify=True)
 
 # Step 3 - print the results
 if available_tools:
-    print('Available tools:', available_tools)
+    print('Available tools:')
+    for tool_info in available_tools:
+        print(tool_info.address, '-', tool_info)
 else:
     print('No available tools')
 
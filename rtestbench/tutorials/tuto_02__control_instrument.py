@@ -16,7 +16,7 @@ ADDR_INSTR_2 = "USB0::0x0957::0x9318::MY54321248::0::INSTR" # example of tool ad
 
 
 # 1st method: if/else
-if ADDR_INSTR_1 in testbench.detect_tools():
+if ADDR_INSTR_1 in [tool_info.address for tool_info in testbench.detect_tools()]:
     instr_1 = testbench.attach_tool(ADDR_INSTR_1)
 else:
     testbench.log_warning("It seems that there is no instrument @ {}.".format(ADDR_INSTR_1))
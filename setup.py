@@ -20,6 +20,7 @@ setup(
     extras_require={
         'hdf5': ['tables >= 3.5.2'],
         'feather': ['feather-format >= 0.4.1'],
+        'yaml': ['PyYAML >= 5.1'],
     },
     author="Alexandre Quenon",
     author_email="aquenon@hotmail.be",